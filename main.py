@@ -23,9 +23,11 @@ from sentry_sdk.integrations.logging import LoggingIntegration
 
 from utils.database import __database as database
 from utils.database.__database import init_database
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.database.__async_db import run_db, shutdown_db_workers
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
 from utils.core_features.__constants import DEFAULT_PREFIX
 from utils.helpers.__logging_module import get_log
+from utils.realm_profiles.__rp_card import realm_card_renderer
 
 # Centralized error handlers (new)
 from utils.core_features.__errors import (
@@ -40,6 +42,9 @@ logger.setLevel(logging.INFO)
 _log = get_log(__name__)
 _log.info("Starting PortalBot...")
 
+# Fork the realm card render workers while this is still the only thread.
+realm_card_renderer.start()
+
 # Load environment variables
 load_dotenv()
 
@@ -104,7 +109,7 @@ class PortalBot(commands.Bot):
 
     async def get_prefix(self, message: discord.Message):
         if message.guild:
-            bot_data = get_bot_data_for_server(message.guild.id)
+            bot_data = await fetch_bot_data_for_server(message.guild.id)
             if bot_data and bot_data.prefix:
                 return commands.when_mentioned_or(bot_data.prefix)(self, message)
         return commands.when_mentioned_or(DEFAULT_PREFIX)(self, message)
@@ -177,19 +182,23 @@ class PortalBot(commands.Bot):
             _log.error(f"❌ Failed to sync application commands: {e}", exc_info=True)
 
     async def is_owner(self, user: discord.User):
-        # Your Administrators.discordID is a TextField — compare to str(user.id)
-        database.db.connect(reuse_if_open=True)
-        try:
-            query = database.Administrators.select().where(
+        is_owner = await run_db(
+            database.Administrators.select()
+            .where(
                 (database.Administrators.TierLevel >= 3)
-                & (database.Administrators.discordID == str(user.id))
+                & (database.Administrators.discordID == user.id)
             )
-            is_owner = query.exists()
-        finally:
-            database.db.close()
+            .exists
+        )
         _log.info(f"User {user} owner check: {'Yes' if is_owner else 'No'}")
         return is_owner or await super().is_owner(user)
 
+    async def close(self):
+        await super().close()
+        # Let in-flight queries finish once cogs have been unloaded.
+        shutdown_db_workers(wait=True)
+        realm_card_renderer.shutdown()
+
     @property
     def version(self):
         try:
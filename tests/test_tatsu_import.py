@@ -0,0 +1,229 @@
+# tests/test_tatsu_import.py
+"""
+Tatsu importer against a local stub of the Tatsu API.
+
+The database helpers are swapped for in-memory fakes, so these tests need
+aiohttp, discord.py and peewee installed but no MySQL server.
+"""
+
+import asyncio
+import os
+import types
+
+import pytest
+
+# utils.database refuses to import without connection settings; nothing connects.
+for _name in ("database_username", "database_password", "database_schema"):
+    os.environ.setdefault(_name, "test")
+
+pytest.importorskip("discord")
+pytest.importorskip("peewee")
+web = pytest.importorskip("aiohttp.web")
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from utils.helpers.__rate_limit import TokenBucket  # noqa: E402
+from utils.level_system import __ls_tatsu_import as tatsu  # noqa: E402
+
+GUILD_ID = 1000
+
+
+class FakeTatsu:
+    """Tatsu v1 stub. Records every request and can fail chosen ones."""
+
+    def __init__(self, scores: dict[int, int], *, rankings: bool = True):
+        self.scores = scores
+        self.rankings = rankings
+        self.requests: list[tuple[str, str]] = []
+        self.rate_limit_next = 0  # answer this many requests with 429 first
+        self.fail_offsets: set[int] = set()  # rankings offsets answered with 400 (once each)
+        self.fail_members: set[int] = set()  # member lookups answered with 400 (once each)
+
+        self.app = web.Application()
+        self.app.router.add_get("/guilds/{guild}/rankings/all", self.rankings_page)
+        self.app.router.add_get("/guilds/{guild}/rankings/members/{user}/all", self.member)
+
+    def _limited(self):
+        if self.rate_limit_next:
+            self.rate_limit_next -= 1
+            return web.json_response({"message": "slow down"}, status=429, headers={"Retry-After": "0"})
+        return None
+
+    async def rankings_page(self, request):
+        offset = int(request.query.get("offset", 0))
+        self.requests.append(("rankings", str(offset)))
+        if (limited := self._limited()) is not None:
+            return limited
+        if not self.rankings:
+            return web.json_response({"message": "forbidden"}, status=403)
+        if offset in self.fail_offsets:
+            self.fail_offsets.discard(offset)
+            return web.json_response({"message": "bad request"}, status=400)
+        ranked = sorted(self.scores.items(), key=lambda item: -item[1])
+        page = ranked[offset : offset + tatsu.TATSU_PAGE_SIZE]
+        return web.json_response(
+            {"rankings": [{"user_id": str(uid), "score": score} for uid, score in page]}
+        )
+
+    async def member(self, request):
+        uid = int(request.match_info["user"])
+        self.requests.append(("member", str(uid)))
+        if (limited := self._limited()) is not None:
+            return limited
+        if uid in self.fail_members:
+            self.fail_members.discard(uid)
+            return web.json_response({"message": "bad request"}, status=400)
+        if uid not in self.scores:
+            return web.json_response({"message": "unknown member"}, status=404)
+        return web.json_response({"user_id": str(uid), "score": self.scores[uid]})
+
+
+class FakeDB:
+    """In-memory stand-ins for the importer's blocking database helpers."""
+
+    def __init__(self):
+        self.state = None
+        self.scores: dict[int, int] = {}
+
+    def load_state(self, guild_id):
+        return self.state
+
+    def reset_state(self, guild_id, mode):
+        self.state = types.SimpleNamespace(
+            guild_id=guild_id, mode=mode, cursor=0, processed=0, updated=0,
+            failed_ids=None, completed_at=None,
+        )
+        return self.state
+
+    def save_state(self, state):
+        pass
+
+    def load_existing(self, guild_id, user_ids):
+        return {uid: self.scores[uid] for uid in user_ids if uid in self.scores}
+
+    def upsert_scores(self, rows):
+        for row in rows:
+            self.scores[row["DiscordLongID"]] = row["Score"]
+
+
+def make_guild(member_ids):
+    members = {uid: types.SimpleNamespace(id=uid, name=f"user{uid}", bot=False) for uid in member_ids}
+    return types.SimpleNamespace(
+        id=GUILD_ID, name="Test Guild", members=list(members.values()), get_member=members.get
+    )
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDB()
+
+    async def run_db(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(tatsu, "run_db", run_db)
+    monkeypatch.setattr(tatsu, "_load_state", db.load_state)
+    monkeypatch.setattr(tatsu, "_reset_state", db.reset_state)
+    monkeypatch.setattr(tatsu, "_save_state", db.save_state)
+    monkeypatch.setattr(tatsu, "_load_existing", db.load_existing)
+    monkeypatch.setattr(tatsu, "_upsert_scores", db.upsert_scores)
+    monkeypatch.setattr(tatsu, "_tatsu_budget", TokenBucket(1000, 1000))
+    monkeypatch.setattr(tatsu, "_MEMBER_BATCH", 10)
+    return db
+
+
+def run_against(fake: FakeTatsu, monkeypatch, body):
+    async def main():
+        server = TestServer(fake.app)
+        await server.start_server()
+        monkeypatch.setattr(tatsu, "TATSU_API_BASE", str(server.make_url("")).rstrip("/"))
+        try:
+            return await body(tatsu.TatsuImporter())
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_rankings_are_paged_until_a_short_page(fake_db, monkeypatch):
+    scores = {uid: uid * 10 for uid in range(1, 251)}
+    fake = FakeTatsu(scores)
+    guild = make_guild(scores)
+
+    result = run_against(fake, monkeypatch, lambda importer: importer.run(guild))
+
+    assert [offset for kind, offset in fake.requests] == ["0", "100", "200"]
+    assert result.mode == "rankings" and result.updated == 250
+    assert fake_db.scores == scores
+    assert fake_db.state.completed_at is not None
+
+
+def test_rankings_skip_people_who_left(fake_db, monkeypatch):
+    fake = FakeTatsu({1: 500, 2: 400, 3: 300})
+    guild = make_guild([1, 3])
+
+    run_against(fake, monkeypatch, lambda importer: importer.run(guild))
+
+    assert fake_db.scores == {1: 500, 3: 300}
+
+
+def test_429_waits_for_retry_after_and_retries(fake_db, monkeypatch):
+    scores = {uid: uid for uid in range(1, 11)}
+    fake = FakeTatsu(scores)
+    fake.rate_limit_next = 2
+    guild = make_guild(scores)
+
+    result = run_against(fake, monkeypatch, lambda importer: importer.run(guild))
+
+    assert fake.requests == [("rankings", "0")] * 3
+    assert result.updated == 10
+
+
+def test_falls_back_to_member_lookups(fake_db, monkeypatch):
+    fake = FakeTatsu({1: 100, 2: 200, 4: 400}, rankings=False)
+    guild = make_guild([1, 2, 3, 4])
+
+    result = run_against(fake, monkeypatch, lambda importer: importer.run(guild))
+
+    assert result.mode == "members"
+    assert sorted(int(uid) for kind, uid in fake.requests if kind == "member") == [1, 2, 3, 4]
+    assert fake_db.scores == {1: 100, 2: 200, 4: 400}  # 3 is unranked (404)
+    assert fake_db.state.completed_at is not None
+
+
+def test_interrupted_rankings_resume_from_the_checkpoint(fake_db, monkeypatch):
+    scores = {uid: uid for uid in range(1, 251)}
+    fake = FakeTatsu(scores)
+    fake.fail_offsets = {100}
+    guild = make_guild(scores)
+
+    async def body(importer):
+        with pytest.raises(tatsu.TatsuError):
+            await importer.run(guild)
+        assert fake_db.state.cursor == 100 and fake_db.state.completed_at is None
+        return await importer.run(guild)
+
+    result = run_against(fake, monkeypatch, body)
+
+    assert result.resumed
+    assert [offset for kind, offset in fake.requests] == ["0", "100", "100", "200"]
+    assert fake_db.scores == scores
+
+
+def test_failed_member_lookups_are_retried_on_resume(fake_db, monkeypatch):
+    scores = {uid: uid * 7 for uid in range(1, 26)}
+    fake = FakeTatsu(scores, rankings=False)
+    fake.fail_members = {3, 17}
+    guild = make_guild(scores)
+
+    async def body(importer):
+        first = await importer.run(guild)
+        assert first.failed == 2
+        assert fake_db.state.completed_at is None
+        fake.requests.clear()
+        return await importer.run(guild)
+
+    result = run_against(fake, monkeypatch, body)
+
+    assert result.resumed and result.failed == 0
+    assert sorted(int(uid) for kind, uid in fake.requests if kind == "member") == [3, 17]
+    assert fake_db.scores == scores
+    assert fake_db.state.failed_ids is None and fake_db.state.completed_at is not None
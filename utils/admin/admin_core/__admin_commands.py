@@ -53,7 +53,7 @@ class AdminCommands(commands.GroupCog, name="admin"):
     @has_admin_level(4)
     async def deletedb(self, interaction: discord.Interaction):
         try:
-            if not database.db.is_closed():
+            if database.pool_stats()["in_use"]:
                 await interaction.response.send_message(
                     "Database is in use. Cannot delete.", ephemeral=True
                 )
@@ -82,7 +82,7 @@ class AdminCommands(commands.GroupCog, name="admin"):
     @has_admin_level(4)
     async def replacedb(self, interaction: discord.Interaction):
         try:
-            if not database.db.is_closed():
+            if database.pool_stats()["in_use"]:
                 await interaction.response.send_message(
                     "Database is in use. Cannot replace.", ephemeral=True
                 )
@@ -6,14 +6,34 @@ from discord.ext import commands
 
 from utils.helpers.__logging_module import get_log
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.core_features.__constants import ConsoleColors
 from utils.daily_questions.__dq_views import QuestionSuggestionManager
 from utils.admin.bot_management.__bm_logic import initialize_db
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.admin.bot_management.__bm_logic import get_cached_bot_data
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 
 _log = get_log(__name__)
 
 
+def _mark_persistent_views(guild_ids: list[int]) -> list:
+    """Flag BotData rows that have not had their persistent views added yet."""
+    marked = []
+    for guild_id in guild_ids:
+        row = database.BotData.get_or_none(database.BotData.server_id == guild_id)
+        if not row:
+            _log.warning(
+                f"BotData missing during persistent view init for {guild_id}"
+            )
+            continue
+
+        if not row.persistent_views:
+            row.persistent_views = True
+            row.save()
+            marked.append(row)
+    return marked
+
+
 class BotManagementBootstrap(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -29,9 +49,10 @@ class BotManagementBootstrap(commands.Cog):
         now = datetime.now()
         _log.info(f"Bot ready at {now}. Running bootstrap...")
 
-        # initialize_db manages its own Peewee connection state. Wrapping it in
-        # connection_context() can make Peewee pop an already-cleared context.
-        initialize_db(self.bot)
+        # initialize_db checks its own connection out of the pool.
+        await run_db(initialize_db, self.bot)
+        # One SELECT warms the per-guild BotData cache for every guild.
+        await run_db(bot_data_cache.load_all)
 
         # Initialize persistent views once per guild.
         await self._init_persistent_views()
@@ -46,24 +67,14 @@ class BotManagementBootstrap(commands.Cog):
         _log.info("Bootstrap complete.")
 
     async def _init_persistent_views(self):
-        with database.db.connection_context():
-            for guild in self.bot.guilds:
-                row = database.BotData.get_or_none(
-                    database.BotData.server_id == str(guild.id)
-                )
-                if not row:
-                    _log.warning(
-                        f"BotData missing during persistent view init for {guild.id}"
-                    )
-                    continue
-
-                if not row.persistent_views:
-                    self.bot.add_view(QuestionSuggestionManager())
-                    row.persistent_views = True
-                    row.save()
-                    _log.info(
-                        f"Persistent views initialized for {guild.name} ({guild.id})"
-                    )
+        guilds = {guild.id: guild for guild in self.bot.guilds}
+        for row in await run_db(_mark_persistent_views, list(guilds)):
+            guild = guilds[int(row.server_id)]
+            self.bot.add_view(QuestionSuggestionManager())
+            bot_data_cache.update(row)
+            _log.info(
+                f"Persistent views initialized for {guild.name} ({guild.id})"
+            )
 
     async def _git_version(self) -> str:
         try:
@@ -112,7 +123,7 @@ class BotManagementBootstrap(commands.Cog):
     """)
 
     async def _notify_github_log(self):
-        bot_data = get_bot_data_for_server(448488274562908170)
+        bot_data = get_cached_bot_data(448488274562908170)
         test_id = int(getattr(bot_data, "pb_test_server_id", "448488274562908170"))
         pb_guild = self.bot.get_guild(test_id)
 
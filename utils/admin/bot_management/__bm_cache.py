@@ -0,0 +1,134 @@
+# utils/admin/bot_management/__bm_cache.py
+
+import json
+import threading
+from typing import Iterator, Union
+
+from utils.database import __database as database
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# BotData TextFields holding a channel ID ("0" / "" meaning unset).
+CHANNEL_FIELDS = (
+    "welcome_channel",
+    "bannedlist_response_channel",
+    "daily_question_channel",
+    "question_suggest_channel",
+    "bot_spam_channel",
+    "realm_channel_response",
+    "general_channel",
+    "mod_channel",
+    "message_log",
+    "member_log",
+    "server_log",
+    "rule_channel",
+    "monthly_checkin_channel",
+)
+
+
+def _parse_id(value) -> int | None:
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed or None
+
+
+class CachedBotData:
+    """
+    Read-only snapshot of a BotData row with the hot fields pre-parsed.
+
+    Any other attribute falls through to the underlying row. Do not mutate
+    or save() it — load the row with get_bot_data_for_server(), save it and
+    hand it to bot_data_cache.update().
+    """
+
+    __slots__ = ("row", "guild_id", "blocked_channels", "channel_ids")
+
+    def __init__(self, row: database.BotData):
+        self.row = row
+        self.guild_id = int(row.server_id)
+        try:
+            blocked = json.loads(row.blocked_channels or "[]")
+        except (TypeError, ValueError):
+            _log.warning(f"Invalid blocked_channels JSON for guild {row.server_id}")
+            blocked = []
+        self.blocked_channels = frozenset(
+            cid for cid in (_parse_id(c) for c in blocked) if cid
+        )
+        self.channel_ids = {
+            name: _parse_id(getattr(row, name, None)) for name in CHANNEL_FIELDS
+        }
+
+    def __getattr__(self, name):
+        return getattr(self.row, name)
+
+    def channel_id(self, field: str) -> int | None:
+        """Parsed channel ID for a BotData channel field, or None when unset."""
+        return self.channel_ids.get(field)
+
+    def get_blocked_channels(self) -> frozenset[int]:
+        return self.blocked_channels
+
+
+class BotDataCache:
+    """
+    Per-guild BotData cache, filled in bulk at startup and kept current by
+    write-through update() calls wherever a BotData row is saved.
+    """
+
+    def __init__(self):
+        self._entries: dict[int, CachedBotData] = {}
+        self._missing: set[int] = set()
+        self._lock = threading.Lock()
+
+    def get(self, guild_id: Union[int, str]) -> CachedBotData | None:
+        return self._entries.get(int(guild_id))
+
+    def is_known_missing(self, guild_id: Union[int, str]) -> bool:
+        return int(guild_id) in self._missing
+
+    def update(self, row: database.BotData | None, guild_id: Union[int, str, None] = None):
+        """Store a freshly saved/loaded row; None marks the guild as having no row."""
+        if row is None:
+            if guild_id is None:
+                return None
+            with self._lock:
+                self._entries.pop(int(guild_id), None)
+                self._missing.add(int(guild_id))
+            return None
+        entry = CachedBotData(row)
+        with self._lock:
+            self._entries[entry.guild_id] = entry
+            self._missing.discard(entry.guild_id)
+        return entry
+
+    def invalidate(self, guild_id: Union[int, str]):
+        with self._lock:
+            self._entries.pop(int(guild_id), None)
+            self._missing.discard(int(guild_id))
+
+    def load_all(self) -> int:
+        """Replace the cache with every BotData row. Blocking; run via run_db."""
+        entries = {}
+        for row in database.BotData.select():
+            entry = CachedBotData(row)
+            entries[entry.guild_id] = entry
+        with self._lock:
+            self._entries = entries
+            self._missing.clear()
+        _log.info(f"📦 Cached BotData for {len(entries)} guild(s).")
+        return len(entries)
+
+    def items(self) -> list[tuple[int, CachedBotData]]:
+        return list(self._entries.items())
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+bot_data_cache = BotDataCache()
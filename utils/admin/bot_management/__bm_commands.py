@@ -4,8 +4,10 @@ import json
 import io
 from discord import app_commands
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
+from .__bm_cache import bot_data_cache
 from .__bm_views import BotConfigSectionSelectView
 from utils.admin.bot_management.__bm_logic import (
     get_bot_data_for_server,
@@ -15,6 +17,40 @@ from utils.admin.bot_management.__bm_logic import (
 _log = get_log(__name__)
 
 
+def _set_admin_level(user: discord.User, level: int) -> bool:
+    """Create or update an administrator. Returns True if they already existed."""
+    query = database.Administrators.get_or_none(
+        database.Administrators.discordID == user.id
+    )
+    if query:
+        query.TierLevel = level
+        query.discord_name = user.name
+        query.save()
+        return True
+    database.Administrators.create(
+        discordID=user.id, discord_name=user.name, TierLevel=level
+    )
+    return False
+
+
+def _remove_admin(user_id: int) -> bool:
+    return bool(
+        database.Administrators.delete()
+        .where(database.Administrators.discordID == user_id)
+        .execute()
+    )
+
+
+def _update_bot_data(guild_id: int, updated_fields: dict):
+    bot_data = database.BotData.get_or_none(database.BotData.server_id == guild_id)
+    if not bot_data:
+        return None
+    for key, value in updated_fields.items():
+        setattr(bot_data, key, value)
+    bot_data.save()
+    return bot_data
+
+
 class PermitCommands(app_commands.Group):
     def __init__(self):
         super().__init__(name="permit", description="Manage bot permits")
@@ -50,20 +86,10 @@ class PermitCommands(app_commands.Group):
             )
             return
 
-        database.db.connect(reuse_if_open=True)
         try:
-            query = database.Administrators.get_or_none(
-                database.Administrators.discordID == str(user.id)
-            )
-            if query:
-                query.TierLevel = level
-                query.discord_name = user.name
-                query.save()
+            if await run_db(_set_admin_level, user, level):
                 msg = f"{user.name}'s permit level updated to `{level}`."
             else:
-                database.Administrators.create(
-                    discordID=str(user.id), discord_name=user.name, TierLevel=level
-                )
                 msg = f"{user.name} added with permit level `{level}`."
 
             embed = discord.Embed(
@@ -76,21 +102,13 @@ class PermitCommands(app_commands.Group):
             await interaction.response.send_message(
                 "Failed to update user.", ephemeral=True
             )
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
 
     @app_commands.command(name="remove", description="Remove a bot administrator.")
     @app_commands.describe(user="User to remove")
     @has_admin_level(4)
     async def remove(self, interaction: discord.Interaction, user: discord.User):
-        database.db.connect(reuse_if_open=True)
         try:
-            query = database.Administrators.get_or_none(
-                database.Administrators.discordID == str(user.id)
-            )
-            if query:
-                query.delete_instance()
+            if await run_db(_remove_admin, user.id):
                 msg = f"{user.name} has been removed."
                 color = discord.Color.green()
             else:
@@ -107,9 +125,6 @@ class PermitCommands(app_commands.Group):
             await interaction.response.send_message(
                 "Failed to remove user.", ephemeral=True
             )
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
 
 
 class ConfigCommands(app_commands.Group):
@@ -121,8 +136,9 @@ class ConfigCommands(app_commands.Group):
     async def bot_data(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(interaction.guild.id)
+        bot_data = await run_db(
+            database.BotData.get_or_none,
+            database.BotData.server_id == interaction.guild.id,
         )
         if not bot_data:
             await interaction.followup.send(
@@ -155,17 +171,14 @@ class ConfigCommands(app_commands.Group):
         self, interaction: discord.Interaction, updated_fields: dict
     ):
         try:
-            bot_data = database.BotData.get_or_none(
-                database.BotData.server_id == str(interaction.guild.id)
+            bot_data = await run_db(
+                _update_bot_data, interaction.guild.id, updated_fields
             )
             if not bot_data:
                 await interaction.followup.send("❌ BotData not found.", ephemeral=True)
                 return
 
-            for key, value in updated_fields.items():
-                setattr(bot_data, key, value)
-
-            bot_data.save()
+            bot_data_cache.update(bot_data)
             await interaction.followup.send("✅ Bot settings updated.", ephemeral=True)
 
         except Exception as e:
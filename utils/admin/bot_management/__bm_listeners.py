@@ -3,8 +3,10 @@ from discord.ext import commands
 
 from utils.helpers.__logging_module import get_log
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 # Use the normalized creator/repair function we added earlier
 from utils.admin.bot_management.__bm_logic import _ensure_botdata_for_guild
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 
 _log = get_log(__name__)
 
@@ -16,6 +18,17 @@ def _first_welcome_channel_id(guild: discord.Guild) -> str:
     return str(guild.text_channels[0].id) if guild.text_channels else "0"
 
 
+def _setup_guild_bot_data(bot: commands.Bot, guild: discord.Guild, welcome_channel: str):
+    # _ensure_botdata_for_guild handles create/repair idempotently
+    _ensure_botdata_for_guild(bot, guild)
+    # If you also want to set a default welcome channel immediately:
+    row = database.BotData.get_or_none(database.BotData.server_id == guild.id)
+    if row and (not getattr(row, "welcome_channel", None) or row.welcome_channel in ("", "0")):
+        row.welcome_channel = welcome_channel
+        row.save()
+    return row
+
+
 class BotManagementListeners(commands.Cog):
     """Event listeners for bot-management lifecycle tasks."""
     def __init__(self, bot: commands.Bot):
@@ -25,15 +38,11 @@ class BotManagementListeners(commands.Cog):
     async def on_guild_join(self, guild: discord.Guild):
         """Ensure BotData exists for newly joined guilds."""
         _log.info(f"Joined guild {guild.name} ({guild.id}); ensuring BotData.")
-        # If your _ensure_botdata_for_guild relies on DB connection, wrap it:
-        with database.db.connection_context():
-            # _ensure_botdata_for_guild handles create/repair idempotently
-            _ensure_botdata_for_guild(self.bot, guild)
-        # If you also want to set a default welcome channel immediately:
-        row = database.BotData.get_or_none(database.BotData.server_id == str(guild.id))
-        if row and (not getattr(row, "welcome_channel", None) or row.welcome_channel in ("", "0")):
-            row.welcome_channel = _first_welcome_channel_id(guild)
-            row.save()
+        row = await run_db(
+            _setup_guild_bot_data, self.bot, guild, _first_welcome_channel_id(guild)
+        )
+        if row:
+            bot_data_cache.update(row)
 
     # Optional: log leaves or clean up if you store per-guild caches
     @commands.Cog.listener()
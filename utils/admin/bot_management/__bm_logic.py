@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Union
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_cache import CachedBotData, bot_data_cache
 from utils.helpers.__logging_module import get_log
 
 _log = get_log(__name__)
@@ -13,52 +15,75 @@ _log = get_log(__name__)
 # ========== Admin Helpers ==========
 
 
-async def fetch_admins_by_level(bot, level: int):
-    try:
-        _log.debug(f"Fetching administrators with permit level {level}")
-        database.db.connect(reuse_if_open=True)
-        query = database.Administrators.select().where(
-            database.Administrators.TierLevel == level
-        )
+def _admin_ids_for_level(level: int) -> list[str]:
+    query = database.Administrators.select(database.Administrators.discordID).where(
+        database.Administrators.TierLevel == level
+    )
+    return [admin.discordID for admin in query]
 
-        admin_list = []
-        for admin in query:
-            try:
-                user = bot.get_user(int(admin.discordID)) or await bot.fetch_user(
-                    int(admin.discordID)
-                )
-                admin_list.append(f"`{user.name}` -> `{user.id}`")
-            except Exception as e:
-                _log.error(f"Error fetching user with ID {admin.discordID}: {e}")
-                continue
 
-        return admin_list or ["None"]
-    finally:
-        if not database.db.is_closed():
-            database.db.close()
+async def fetch_admins_by_level(bot, level: int):
+    _log.debug(f"Fetching administrators with permit level {level}")
+    # Materialize the IDs first so no connection is held across fetch_user().
+    admin_ids = await run_db(_admin_ids_for_level, level)
+
+    admin_list = []
+    for discord_id in admin_ids:
+        try:
+            user = bot.get_user(int(discord_id)) or await bot.fetch_user(
+                int(discord_id)
+            )
+            admin_list.append(f"`{user.name}` -> `{user.id}`")
+        except Exception as e:
+            _log.error(f"Error fetching user with ID {discord_id}: {e}")
+            continue
+
+    return admin_list or ["None"]
 
 
 # ========== BotData ==========
 
 
 def get_bot_data_for_server(guild_id: Union[int, str]):
-    """Fetch BotData directly from the database for the specified guild."""
+    """
+    Fetch BotData directly from the database for the specified guild.
+    Use this when the row will be modified; save it, then pass it to
+    bot_data_cache.update().
+    """
     try:
         bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(guild_id)
+            database.BotData.server_id == guild_id
         )
         if bot_data:
-            _log.info(
+            _log.debug(
                 f"BotData loaded from DB: Prefix: {bot_data.prefix}, Server ID: {bot_data.server_id}"
             )
         else:
             _log.warning(f"No BotData found for guild {guild_id}")
+        bot_data_cache.update(bot_data, guild_id)
         return bot_data
     except Exception as e:
         _log.error(f"Error fetching BotData for guild {guild_id}: {e}", exc_info=True)
         return None
 
 
+def get_cached_bot_data(guild_id: Union[int, str]) -> CachedBotData | None:
+    """Read-only BotData for a guild from the in-process cache (no DB access)."""
+    return bot_data_cache.get(guild_id)
+
+
+async def fetch_bot_data_for_server(guild_id: Union[int, str]) -> CachedBotData | None:
+    """
+    Read-only BotData for a guild, served from the cache and loaded on the DB
+    worker pool on a miss. Guilds without a row are remembered until one is saved.
+    """
+    entry = bot_data_cache.get(guild_id)
+    if entry is not None or bot_data_cache.is_known_missing(guild_id):
+        return entry
+    await run_db(get_bot_data_for_server, guild_id)
+    return bot_data_cache.get(guild_id)
+
+
 # ========== Config Loader ==========
 
 
@@ -91,8 +116,7 @@ config, config_file = load_config()
 def initialize_db(bot):
     try:
         _log.info("Initializing database...")
-        database.db.connect(reuse_if_open=True)
-        with database.db.atomic():
+        with database.connection(), database.db.atomic():
             for guild in list(bot.guilds):
                 _ensure_botdata_for_guild(bot, guild)
 
@@ -100,12 +124,9 @@ def initialize_db(bot):
                 _create_administrators(bot.owner_ids)
     except Exception:
         _log.exception("Error during database initialization")
-    finally:
-        if not database.db.is_closed():
-            database.db.close()
 
 def _ensure_botdata_for_guild(bot, guild):
-    gid = str(guild.id)
+    gid = guild.id
     row = database.BotData.get_or_none(database.BotData.server_id == gid)
 
     desired = {
@@ -119,7 +140,7 @@ def _ensure_botdata_for_guild(bot, guild):
     desired_welcome = str(guild.system_channel.id) if guild.system_channel else "0"
 
     if row is None:
-        _create_bot_data(
+        row = _create_bot_data(
             server_name=desired["server_name"],
             server_id=desired["server_id"],
             bot_id=desired["bot_id"],
@@ -127,6 +148,7 @@ def _ensure_botdata_for_guild(bot, guild):
             pb_test_server_id=desired["pb_test_server_id"],
             welcome_channel=desired_welcome,
         )
+        bot_data_cache.update(row)
         _log.info(f"Created BotData for {guild.name} ({gid})")
         return
 
@@ -148,11 +170,12 @@ def _ensure_botdata_for_guild(bot, guild):
     if changed:
         row.save()
         _log.info(f"Repaired BotData for {guild.name} ({gid})")
+    bot_data_cache.update(row)
 
-def _create_bot_data(*, server_name: str, server_id: str, bot_id: str,
+def _create_bot_data(*, server_name: str, server_id: int, bot_id: str,
                      prefix: str = ">", pb_test_server_id: str = "448488274562908170",
                      welcome_channel: str = "0"):
-    database.BotData.create(
+    return database.BotData.create(
         server_name=server_name,
         server_desc="",
         server_invite="0",
@@ -168,5 +191,5 @@ def _create_bot_data(*, server_name: str, server_id: str, bot_id: str,
 
 def _create_administrators(owner_ids):
     for owner_id in owner_ids:
-        database.Administrators.create(discordID=str(owner_id), TierLevel=4)
-    database.Administrators.create(discordID="306070011028439041", TierLevel=4)
+        database.Administrators.create(discordID=owner_id, TierLevel=4)
+    database.Administrators.create(discordID=306070011028439041, TierLevel=4)
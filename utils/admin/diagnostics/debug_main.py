@@ -1,8 +1,11 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, ui
+from utils.database import __database as database
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
+from utils.helpers.__scheduler import scheduler
 
 _log = get_log(__name__)
 
@@ -89,6 +92,62 @@ class DebugCommands(commands.GroupCog, name="debug"):
             embed=pages[0], view=view, ephemeral=True
         )
 
+    @app_commands.command(
+        name="db_pool", description="Show database connection pool usage."
+    )
+    @has_admin_level(4)
+    async def db_pool(self, interaction: discord.Interaction):
+        """Display current pool occupancy, peak usage and checkout count."""
+        stats = database.pool_stats()
+        embed = discord.Embed(
+            title="🗄️ Database Pool",
+            color=discord.Color.teal(),
+        )
+        embed.add_field(
+            name="In Use",
+            value=f"{stats['in_use']} / {stats['max_connections']}",
+            inline=True,
+        )
+        embed.add_field(name="Idle", value=str(stats["idle"]), inline=True)
+        embed.add_field(name="Peak In Use", value=str(stats["peak_in_use"]), inline=True)
+        embed.add_field(name="Checkouts", value=str(stats["checkouts"]), inline=True)
+        embed.add_field(
+            name="Stale Timeout", value=f"{stats['stale_timeout']}s", inline=True
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="jobs", description="Show scheduled jobs and their last runs.")
+    @has_admin_level(4)
+    async def jobs(self, interaction: discord.Interaction):
+        """Display the central scheduler's job table."""
+        jobs = scheduler.jobs()
+        embed = discord.Embed(
+            title="⏱️ Scheduled Jobs",
+            description=None if jobs else "No jobs are registered.",
+            color=discord.Color.teal(),
+        )
+        status_icons = {"ok": "✅", "failed": "❌", "running": "⏳"}
+
+        def when(value) -> str:
+            return f"<t:{int(value.timestamp())}:R>" if value else "—"
+
+        for job in jobs[:25]:
+            status = "running" if job.running else job.last_status
+            lines = [
+                f"**Schedule:** `{job.schedule_text}`",
+                f"**Next:** {when(job.next_fire)}",
+                f"**Last:** {when(job.last_fire)} {status_icons.get(status, '')} {status or 'never run'}"
+                + (f" ({job.last_duration_ms} ms)" if job.last_duration_ms is not None else ""),
+            ]
+            if job.last_error and status == "failed":
+                lines.append(f"**Error:** `{job.last_error[:200]}`")
+            embed.add_field(
+                name=f"{job.name} — {job.description}" if job.description else job.name,
+                value="\n".join(lines),
+                inline=False,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(DebugCommands(bot))
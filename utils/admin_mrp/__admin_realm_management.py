@@ -9,9 +9,10 @@ from discord import app_commands, ui
 from discord.ext import commands
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
 
 _log = get_log(__name__)
 STOP_WORDS = {"the", "a", "an", "smp", "realm", "realms", "server", "room"}
@@ -128,6 +129,12 @@ def _find_realm_channel(
     return None
 
 
+def _realm_profiles_by_name() -> list[database.RealmProfile]:
+    return list(
+        database.RealmProfile.select().order_by(database.RealmProfile.realm_name)
+    )
+
+
 def _upsert_realm_profile_from_application(
     application: "database.RealmApplications",
     channel: discord.TextChannel,
@@ -405,7 +412,7 @@ class RealmApplicationModal(ui.Modal):
         await self.finish_application(interaction)
 
     async def finish_application(self, interaction: discord.Interaction):
-        bot_data = get_bot_data_for_server(interaction.guild.id)
+        bot_data = await fetch_bot_data_for_server(interaction.guild.id)
 
         if bot_data is None:
             await interaction.response.send_message(
@@ -463,7 +470,9 @@ class RealmApplicationModal(ui.Modal):
                 f"'{self.application_data.get('realm_name', 'Unknown Realm')}'"
             )
 
-            self.save_application(interaction, member_count, world_start_date)
+            await run_db(
+                self.save_application, interaction, member_count, world_start_date
+            )
             embed = self.build_embed(interaction.user)
 
             await log_channel.send(content=admin_role.mention, embed=embed)
@@ -647,10 +656,9 @@ class AdminRealmManagement(commands.GroupCog, name="realm"):
         author = interaction.user
 
         try:
-            q: database.RealmApplications = (
-                database.RealmApplications.select()
-                .where(database.RealmApplications.entry_id == app_number)
-                .get()
+            q: database.RealmApplications = await run_db(
+                database.RealmApplications.get,
+                database.RealmApplications.entry_id == app_number,
             )
         except database.RealmApplications.DoesNotExist:
             return await interaction.followup.send(
@@ -718,7 +726,7 @@ class AdminRealmManagement(commands.GroupCog, name="realm"):
 
             log["PermissionsSet"] = "✅"
 
-            _upsert_realm_profile_from_application(q, channel, role)
+            await run_db(_upsert_realm_profile_from_application, q, channel, role)
             log["ProfileSaved"] = "✅"
 
             if guild.id == 587495640502763521:
@@ -792,9 +800,7 @@ class AdminRealmManagement(commands.GroupCog, name="realm"):
         missing_channels = []
         report_lines = []
 
-        for profile in database.RealmProfile.select().order_by(
-            database.RealmProfile.realm_name
-        ):
+        for profile in await run_db(_realm_profiles_by_name):
             changed = False
             role = _find_realm_op_role(guild, profile.realm_name)
             channel = _find_realm_channel(guild, profile.realm_name)
@@ -816,7 +822,7 @@ class AdminRealmManagement(commands.GroupCog, name="realm"):
                 missing_channels.append(profile.realm_name)
 
             if changed:
-                profile.save()
+                await run_db(profile.save)
                 updated += 1
 
             report_lines.append(
@@ -6,10 +6,11 @@ from typing import Literal
 from discord import app_commands, ui
 from discord.ext import commands
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
 from utils.admin.bot_management.__bm_logic import (
     load_config,
-    get_bot_data_for_server,
+    fetch_bot_data_for_server,
 )
 from utils.helpers.__pagination import paginate_embed
 
@@ -20,6 +21,15 @@ _log = get_log(__name__)
 config, _ = load_config()
 
 
+def _search_entries(fields, search_term: str) -> list:
+    results = []
+    for field in fields:
+        query = database.MRP_Blacklist_Data.select().where(field.contains(search_term))
+        if query.exists():
+            results.extend(query)
+    return results
+
+
 class BannedListCommands(commands.GroupCog, name="banned-list"):
     def __init__(self, bot):
         self.bot = bot
@@ -67,13 +77,7 @@ class BannedListCommands(commands.GroupCog, name="banned-list"):
             database.MRP_Blacklist_Data.BanReporter,
         ]
 
-        results = []
-        for field in database_fields:
-            query = database.MRP_Blacklist_Data.select().where(
-                field.contains(search_term)
-            )
-            if query.exists():
-                results.extend(query)
+        results = await run_db(_search_entries, database_fields, search_term)
 
         if not results:
             embed = discord.Embed(
@@ -123,8 +127,9 @@ class BannedListCommands(commands.GroupCog, name="banned-list"):
         ],
         new_value: str,
     ):
-        query = database.MRP_Blacklist_Data.get_or_none(
-            database.MRP_Blacklist_Data.entryid == entry_id
+        query = await run_db(
+            database.MRP_Blacklist_Data.get_or_none,
+            database.MRP_Blacklist_Data.entryid == entry_id,
         )
 
         if not query:
@@ -157,10 +162,10 @@ class BannedListCommands(commands.GroupCog, name="banned-list"):
 
         old_value = getattr(query, field_mapping[modify])
         setattr(query, field_mapping[modify], new_value)
-        query.save()
+        await run_db(query.save)
 
         # Log the update to the configured banned list channel
-        bot_data = get_bot_data_for_server(interaction.guild.id)
+        bot_data = await fetch_bot_data_for_server(interaction.guild.id)
         log_channel = self.bot.get_channel(bot_data.bannedlist_channel)
 
         log_embed = discord.Embed(
@@ -4,8 +4,9 @@ import datetime
 import discord
 from discord import ui
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
 
 from .__bl_logic import create_ban_embed, send_to_log_channel, entry_to_user_data_dict
 
@@ -65,11 +66,12 @@ class BanishBlacklistForm(ui.Modal, title="Blacklist Form"):
 async def on_submit(self, interaction: discord.Interaction):
     try:
         await interaction.response.defer()
-        bot_data = get_bot_data_for_server(interaction.guild.id)
+        bot_data = await fetch_bot_data_for_server(interaction.guild.id)
         log_channel = self.bot.get_channel(bot_data.bannedlist_channel)
 
         # Save to database
-        entry = database.MRP_Blacklist_Data.create(
+        entry = await run_db(
+            database.MRP_Blacklist_Data.create,
             BanReporter=interaction.user.display_name,
             DiscUsername=self.discord_username.value,
             DiscID=self.user.id,
@@ -81,7 +83,6 @@ async def on_submit(self, interaction: discord.Interaction):
             TypeofBan=self.type_of_ban,
             DatetheBanEnds=self.ban_end_date.value,
         )
-        entry.save()
 
         # Build and send embed
         user_data = entry_to_user_data_dict(entry)
@@ -89,7 +90,7 @@ async def on_submit(self, interaction: discord.Interaction):
             entry.entryid,
             interaction,
             user_data,
-            get_bot_data_for_server(interaction.guild.id).asdict(),
+            bot_data.asdict(),
         )
 
         await send_to_log_channel(interaction, log_channel, embed)
@@ -8,8 +8,11 @@ from discord import app_commands, ui
 from discord.ext import commands
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
+from utils.helpers.__scheduler import scheduler
 from . import __bc_logic as logic
+from .__bc_tasks import JOB_NAME as SCHEDULER_JOB
 
 _log = get_log("build_comp.commands")
 
@@ -24,11 +27,22 @@ NOTIFY_EMOJI = "🏰"  # reaction-role emoji
 def _get_cfg(guild_id: int) -> Optional[database.BuildConfig]:
     return database.BuildConfig.get_or_none(database.BuildConfig.guild_id == str(guild_id))
 
+def _latest_submission_season(guild_id: int) -> Optional[database.BuildSeason]:
+    return (
+        database.BuildSeason.select()
+        .where(
+            (database.BuildSeason.guild_id == str(guild_id))
+            & (database.BuildSeason.status == "submissions")
+        )
+        .order_by(database.BuildSeason.id.desc())
+        .first()
+    )
+
 async def _get_or_create_announce_role(guild: discord.Guild) -> discord.Role:
     """
     Prefer BuildConfig.announce_role_id; otherwise create a 'Build Comp Notification' role and save it if possible.
     """
-    cfg = _get_cfg(guild.id)
+    cfg = await run_db(_get_cfg, guild.id)
     if cfg and getattr(cfg, "announce_role_id", None):
         role = guild.get_role(int(cfg.announce_role_id))
         if role:
@@ -38,13 +52,13 @@ async def _get_or_create_announce_role(guild: discord.Guild) -> discord.Role:
     if role:
         if cfg and hasattr(cfg, "announce_role_id"):
             cfg.announce_role_id = str(role.id)
-            cfg.save()
+            await run_db(cfg.save)
         return role
     # Create it
     role = await guild.create_role(name="Build Comp Notification", mentionable=True, reason="Build competitions notify role")
     if cfg and hasattr(cfg, "announce_role_id"):
         cfg.announce_role_id = str(role.id)
-        cfg.save()
+        await run_db(cfg.save)
     return role
 
 
@@ -103,7 +117,7 @@ class StartSeasonModal(ui.Modal, title="Start Build Season"):
         desc = (str(self.description.value).strip() or None)
 
         # Require central forum
-        cfg = _get_cfg(guild.id)
+        cfg = await run_db(_get_cfg, guild.id)
         if not cfg or not cfg.submission_forum_id:
             return await interaction.followup.send(
                 "❌ Submission/Judging forum not configured. Run `/build config-set-forum`.", ephemeral=True
@@ -123,7 +137,8 @@ class StartSeasonModal(ui.Modal, title="Start Build Season"):
                 pass
 
         # Create Season row
-        season = database.BuildSeason.create(
+        season = await run_db(
+            database.BuildSeason.create,
             guild_id=str(guild.id),
             theme=theme,
             theme_description=desc,
@@ -133,6 +148,7 @@ class StartSeasonModal(ui.Modal, title="Start Build Season"):
             voting_end=ve,
             status="scheduled",
         )
+        scheduler.reschedule(SCHEDULER_JOB)
 
         # Create pinned season announcement thread
         body = (
@@ -160,7 +176,7 @@ class StartSeasonModal(ui.Modal, title="Start Build Season"):
 
         season.season_thread_id = str(season_thread.id) if hasattr(season, "season_thread_id") else None
         try:
-            season.save()
+            await run_db(season.save)
         except Exception:
             pass
 
@@ -209,9 +225,9 @@ class BuildCommands(commands.Cog):
     @group.command(name="config-set-forum", description="Select the Forum used for submissions & season posts")
     @app_commands.checks.has_permissions(manage_guild=True)
     async def config_set_forum(self, interaction: discord.Interaction, forum_channel: discord.ForumChannel):
-        cfg, _ = database.BuildConfig.get_or_create(guild_id=str(interaction.guild_id))
+        cfg, _ = await run_db(database.BuildConfig.get_or_create, guild_id=str(interaction.guild_id))
         cfg.submission_forum_id = str(forum_channel.id)
-        cfg.save()
+        await run_db(cfg.save)
         await interaction.response.send_message(
             f"Submission & judging forum set to {forum_channel.mention}.", ephemeral=True
         )
@@ -219,18 +235,18 @@ class BuildCommands(commands.Cog):
     @group.command(name="config-set-announce", description="(Optional) Set an announcements channel for cross-posts")
     @app_commands.checks.has_permissions(manage_guild=True)
     async def config_set_announce(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        cfg, _ = database.BuildConfig.get_or_create(guild_id=str(interaction.guild_id))
+        cfg, _ = await run_db(database.BuildConfig.get_or_create, guild_id=str(interaction.guild_id))
         cfg.announce_channel_id = str(channel.id)
-        cfg.save()
+        await run_db(cfg.save)
         await interaction.response.send_message(f"Announcements set to {channel.mention}.", ephemeral=True)
 
     @group.command(name="config-set-announce-role", description="(Optional) Set a role to ping for comp updates")
     @app_commands.checks.has_permissions(manage_guild=True)
     async def config_set_announce_role(self, interaction: discord.Interaction, role: discord.Role):
-        cfg, _ = database.BuildConfig.get_or_create(guild_id=str(interaction.guild_id))
+        cfg, _ = await run_db(database.BuildConfig.get_or_create, guild_id=str(interaction.guild_id))
         if hasattr(cfg, "announce_role_id"):
             cfg.announce_role_id = str(role.id)
-            cfg.save()
+            await run_db(cfg.save)
             await interaction.response.send_message(f"Announcement role set to {role.mention}.", ephemeral=True)
         else:
             await interaction.response.send_message(
@@ -266,7 +282,7 @@ class BuildCommands(commands.Cog):
         image5: Optional[discord.Attachment] = None,
     ):
         await interaction.response.defer(ephemeral=True, thinking=True)
-        ok, msg = logic.user_can_submit(interaction.user.id, interaction.guild_id)
+        ok, msg = await run_db(logic.user_can_submit, interaction.user.id, interaction.guild_id)
         if not ok:
             return await interaction.followup.send(msg, ephemeral=True)
 
@@ -381,7 +397,7 @@ class BuildCommands(commands.Cog):
             _log.info(f"Could not add reaction: {e}")
 
         # Persist message id/role id if columns exist
-        cfg = _get_cfg(guild.id)
+        cfg = await run_db(_get_cfg, guild.id)
         if cfg:
             if hasattr(cfg, "reaction_message_id"):
                 cfg.reaction_message_id = str(notify_msg.id)
@@ -392,7 +408,7 @@ class BuildCommands(commands.Cog):
             if hasattr(cfg, "announce_role_id"):
                 cfg.announce_role_id = str(notify_role.id)
             try:
-                cfg.save()
+                await run_db(cfg.save)
             except Exception:
                 pass
 
@@ -402,19 +418,12 @@ class BuildCommands(commands.Cog):
     @group.command(name="force-open-voting", description="Force voting to open and post the ballot")
     @app_commands.checks.has_permissions(manage_guild=True)
     async def force_open_voting(self, interaction: discord.Interaction):
-        season = (
-            database.BuildSeason.select()
-            .where(
-                (database.BuildSeason.guild_id == str(interaction.guild_id))
-                & (database.BuildSeason.status == "submissions")
-            )
-            .order_by(database.BuildSeason.id.desc())
-            .first()
-        )
+        season = await run_db(_latest_submission_season, interaction.guild_id)
         if not season:
             return await interaction.response.send_message("No season in submissions.", ephemeral=True)
         season.status = "voting"
-        season.save()
+        await run_db(season.save)
+        scheduler.reschedule(SCHEDULER_JOB)
         await logic.post_ballot(self.bot, interaction.guild, season)
         await interaction.response.send_message("Voting opened and ballot posted.", ephemeral=True)
 
@@ -423,7 +432,7 @@ class BuildCommands(commands.Cog):
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         if payload.guild_id is None or str(payload.emoji) != NOTIFY_EMOJI:
             return
-        cfg = _get_cfg(payload.guild_id)
+        cfg = await run_db(_get_cfg, payload.guild_id)
         if not cfg or not getattr(cfg, "reaction_message_id", None) or int(cfg.reaction_message_id) != payload.message_id:
             return
         guild = self.bot.get_guild(payload.guild_id)
@@ -445,7 +454,7 @@ class BuildCommands(commands.Cog):
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
         if payload.guild_id is None or str(payload.emoji) != NOTIFY_EMOJI:
             return
-        cfg = _get_cfg(payload.guild_id)
+        cfg = await run_db(_get_cfg, payload.guild_id)
         if not cfg or not getattr(cfg, "reaction_message_id", None) or int(cfg.reaction_message_id) != payload.message_id:
             return
         guild = self.bot.get_guild(payload.guild_id)
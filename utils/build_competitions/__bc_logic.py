@@ -5,6 +5,7 @@ from typing import List, Tuple, Optional
 import discord
 from utils.helpers.__logging_module import get_log
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 
 _log = get_log("build_comp.logic")
 
@@ -54,6 +55,15 @@ def user_can_submit(user_id: int, guild_id: int) -> Tuple[bool, str]:
             return False, "You already submitted this season."
     return True, "OK"
 
+def _get_config(guild_id: int) -> Optional[database.BuildConfig]:
+    return database.BuildConfig.get_or_none(database.BuildConfig.guild_id == str(guild_id))
+
+def _entry_count(season: database.BuildSeason) -> int:
+    return database.BuildEntry.select().where(database.BuildEntry.season == season).count()
+
+def _vote_count(season: database.BuildSeason) -> int:
+    return database.BuildVote.select().where(database.BuildVote.season == season).count()
+
 # ---------------- submissions (each entry is its own forum post) ----------------
 
 async def create_forum_submission(
@@ -64,11 +74,11 @@ async def create_forum_submission(
     images: List[discord.Attachment],
     world_link: Optional[str],
 ) -> database.BuildEntry:
-    ok, msg, season = get_active_submission_season(guild.id)
+    ok, msg, season = await run_db(get_active_submission_season, guild.id)
     if not ok:
         raise RuntimeError(msg)
 
-    cfg = database.BuildConfig.get_or_none(database.BuildConfig.guild_id == str(guild.id))
+    cfg = await run_db(_get_config, guild.id)
     if not cfg or not cfg.submission_forum_id:
         raise RuntimeError("Submission forum not configured.")
 
@@ -82,7 +92,7 @@ async def create_forum_submission(
     # Files
     files = [await a.to_file() for a in images[: season.max_images]]
 
-    idx = database.BuildEntry.select().where(database.BuildEntry.season == season).count() + 1
+    idx = await run_db(_entry_count, season) + 1
     title = f"Entry #{idx:03d} — {season.theme}"
     body = f"**Caption**: {caption}\n"
     if world_link:
@@ -98,7 +108,8 @@ async def create_forum_submission(
         reason=f"Build submission by {author} ({author.id})",
     )
 
-    entry = database.BuildEntry.create(
+    entry = await run_db(
+        database.BuildEntry.create,
         season=season,
         user_id=str(author.id),
         message_id=str(created.message.id) if created.message else None,
@@ -112,6 +123,9 @@ async def create_forum_submission(
 # ---------------- voting ----------------
 
 async def record_vote(inter: discord.Interaction, season_id: int, entry_id: int) -> str:
+    return await run_db(_record_vote, inter.user.id, season_id, entry_id)
+
+def _record_vote(voter_id: int, season_id: int, entry_id: int) -> str:
     season = database.BuildSeason.get_or_none(database.BuildSeason.id == season_id)
     if not season or season.status != "voting":
         return "Voting is not open."
@@ -120,10 +134,10 @@ async def record_vote(inter: discord.Interaction, season_id: int, entry_id: int)
     )
     if not entry:
         return "That entry is not valid."
-    if str(inter.user.id) == entry.user_id:
+    if str(voter_id) == entry.user_id:
         return "You cannot vote for your own entry."
     try:
-        database.BuildVote.create(season=season, entry=entry, voter_id=str(inter.user.id))
+        database.BuildVote.create(season=season, entry=entry, voter_id=str(voter_id))
     except Exception:
         return "You already cast a vote this season."
     return "Your vote has been recorded."
@@ -140,7 +154,7 @@ def tally_results(season: database.BuildSeason):
 # ---------------- ballot & results are separate forum posts (threads) ----------------
 
 async def _get_forum(guild: discord.Guild) -> Optional[discord.ForumChannel]:
-    cfg = database.BuildConfig.get_or_none(database.BuildConfig.guild_id == str(guild.id))
+    cfg = await run_db(_get_config, guild.id)
     if not cfg or not cfg.submission_forum_id:
         return None
     ch = guild.get_channel(int(cfg.submission_forum_id))
@@ -192,7 +206,7 @@ async def announce_winners(bot: discord.Client, guild: discord.Guild, season: da
         # pick latest
         ballot_thread = sorted(ballot_threads, key=lambda t: t.created_at or datetime.datetime.utcnow(), reverse=True)[0]
 
-    results = tally_results(season)
+    results = await run_db(tally_results, season)
     if not results:
         if ballot_thread:
             await ballot_thread.send("No valid entries this season.")
@@ -206,7 +220,7 @@ async def announce_winners(bot: discord.Client, guild: discord.Guild, season: da
         return
 
     winner, top_votes = results[0]
-    total_votes = database.BuildVote.select().where(database.BuildVote.season == season).count()
+    total_votes = await run_db(_vote_count, season)
     embed = discord.Embed(
         title=f"Winner — {season.theme}",
         description=f"**Entry ID**: #{int(winner.id)}\n**Votes**: {top_votes}/{total_votes}",
@@ -238,22 +252,38 @@ async def announce_winners(bot: discord.Client, guild: discord.Guild, season: da
 
 # ---------------- scheduler ----------------
 
+def next_season_transition() -> Optional[datetime.datetime]:
+    """Earliest pending status change (naive UTC) across open seasons, or None."""
+    s = database.BuildSeason
+    rows = (
+        s.select(s.status, s.submission_start, s.submission_end, s.voting_end)
+        .where(s.status != "closed")
+        .tuples()
+    )
+    boundary = {"scheduled": 1, "submissions": 2, "voting": 3}
+    times = [row[boundary[row[0]]] for row in rows if row[0] in boundary]
+    return min(times, default=None)
+
+def _open_seasons() -> List[database.BuildSeason]:
+    return list(database.BuildSeason.select().where(database.BuildSeason.status != "closed"))
+
+
 async def process_scheduled_events(bot: discord.Client):
     now = datetime.datetime.utcnow()
-    for season in database.BuildSeason.select():
+    for season in await run_db(_open_seasons):
         try:
             if season.status == "scheduled" and now >= season.submission_start:
-                season.status = "submissions"; season.save()
+                season.status = "submissions"; await run_db(season.save)
                 # (Your announcement thread was already created by the modal command and pinned.)
 
             if season.status == "submissions" and now >= season.submission_end:
-                season.status = "voting"; season.save()
+                season.status = "voting"; await run_db(season.save)
                 guild = bot.get_guild(int(season.guild_id))
                 if guild:
                     await post_ballot(bot, guild, season)  # ballot is its own forum thread (appears after submissions)
 
             if season.status == "voting" and now >= season.voting_end:
-                season.status = "closed"; season.save()
+                season.status = "closed"; await run_db(season.save)
                 guild = bot.get_guild(int(season.guild_id))
                 if guild:
                     await announce_winners(bot, guild, season)
@@ -1,24 +1,42 @@
 # utils/build_competitions/__bc_tasks.py
-from discord.ext import commands, tasks
+import datetime
+
+from discord.ext import commands
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
-from .__bc_logic import process_scheduled_events
+from utils.helpers.__scheduler import scheduler
+from .__bc_logic import next_season_transition, process_scheduled_events
 
 _log = get_log("build_comp.tasks")
 
+JOB_NAME = "build-competitions"
+
+
+async def _next_transition():
+    when = await run_db(next_season_transition)
+    return when.replace(tzinfo=datetime.timezone.utc) if when else None
+
+
 class _BCScheduler(commands.Cog):
+    """Wakes only when a season's next phase boundary is reached."""
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._tick.start()
 
-    def cog_unload(self):
-        self._tick.cancel()
+    async def cog_load(self):
+        scheduler.add_job(
+            JOB_NAME,
+            self._tick,
+            planner=_next_transition,
+            description="Advance build seasons (submissions → voting → closed)",
+        )
+        scheduler.start(self.bot)
+
+    async def cog_unload(self):
+        scheduler.remove_job(JOB_NAME)
 
-    @tasks.loop(seconds=60)
     async def _tick(self):
-        try:
-            await process_scheduled_events(self.bot)
-        except Exception as e:
-            _log.exception(f"Scheduler error: {e}")
+        await process_scheduled_events(self.bot)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(_BCScheduler(bot))
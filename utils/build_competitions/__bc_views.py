@@ -1,6 +1,7 @@
 from __future__ import annotations
 import discord
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from .__bc_logic import record_vote
 
 
@@ -20,13 +21,17 @@ class BallotView(discord.ui.View):
         super().__init__(timeout=timeout)
 
 
-async def make_ballot_view(season: database.BuildSeason) -> BallotView:
-    view = BallotView(timeout=None)
-    entries = list(
+def _ballot_entries(season: database.BuildSeason) -> list:
+    return list(
         database.BuildEntry.select()
         .where(database.BuildEntry.season == season)
         .order_by(database.BuildEntry.created_at)
     )
+
+
+async def make_ballot_view(season: database.BuildSeason) -> BallotView:
+    view = BallotView(timeout=None)
+    entries = await run_db(_ballot_entries, season)
     # Up to 25 buttons per message; paginate later if needed
     for e in entries[:25]:
         label = f"Vote #{e.id}"
@@ -129,38 +129,47 @@ def calculate_level(score: int) -> Tuple[int, float, int]:
 def get_user_rank(server_id: Union[int, str], user_id: Union[int, str]):
     """
     Returns the 1-based rank of a user in a given server based on score.
+    Uses an index range count; hot paths should prefer the level system's
+    rank_index, which answers from memory.
     """
     try:
-        query = (
-            database.ServerScores.select(database.ServerScores.DiscordLongID)
-            .where(database.ServerScores.ServerID == str(server_id))
-            .order_by(database.ServerScores.Score.desc())
+        entry = (
+            database.ServerScores.select(database.ServerScores.Score)
+            .where(
+                (database.ServerScores.ServerID == server_id)
+                & (database.ServerScores.DiscordLongID == user_id)
+            )
+            .first()
+        )
+        if entry is None:
+            return None
+        return (
+            database.ServerScores.select()
+            .where(
+                (database.ServerScores.ServerID == server_id)
+                & (database.ServerScores.Score > entry.Score)
+            )
+            .count()
+            + 1
         )
-        rank = 1
-        for entry in query:
-            if entry.DiscordLongID == str(user_id):
-                return rank
-            rank += 1
     except Exception as e:
         _log.error(f"Error retrieving user rank: {e}")
         return None
 
-    return None
-
 
 def ensure_profile_exists(profile: object) -> database.PortalbotProfile | None:
     """
     Ensure the given Discord Member has a profile in the database.
     Creates one if missing. Returns the profile or None on failure.
     """
-    user_id = str(profile.id)
+    user_id = profile.id
     discordname = f"{profile.name}#{profile.discriminator}"
 
     try:
-        database.db.connect(reuse_if_open=True)
-        profile_record, created = database.PortalbotProfile.get_or_create(
-            DiscordLongID=user_id, defaults={"DiscordName": discordname}
-        )
+        with database.connection():
+            profile_record, created = database.PortalbotProfile.get_or_create(
+                DiscordLongID=user_id, defaults={"DiscordName": discordname}
+            )
         if created:
             _log.info(f"Auto-created profile for {discordname}")
         return profile_record
@@ -169,12 +178,8 @@ def ensure_profile_exists(profile: object) -> database.PortalbotProfile | None:
         _log.error(f"Failed to ensure profile for {discordname}: {e}", exc_info=True)
         return None
 
-    finally:
-        if not database.db.is_closed():
-            database.db.close()
-
 
-def get_profile_record(self, user_id: str):
+def get_profile_record(self, user_id: int):
     return database.PortalbotProfile.get(
         database.PortalbotProfile.DiscordLongID == user_id
     )
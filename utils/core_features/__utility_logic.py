@@ -1,18 +1,23 @@
 import discord
 from datetime import datetime
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
 
 _log = get_log("reminder_logic")
 
 
+def _due_reminders(now: datetime) -> list:
+    return list(database.Reminder.select().where(database.Reminder.remind_at <= now))
+
+
 async def run_reminder_loop(bot: discord.Client):
     """
     Check and send reminders. Intended to be called by a scheduled task every minute.
     """
     try:
         now = datetime.now()
-        due = database.Reminder.select().where(database.Reminder.remind_at <= now)
+        due = await run_db(_due_reminders, now)
 
         for reminder in due:
             user = bot.get_user(int(reminder.user_id))
@@ -24,7 +29,7 @@ async def run_reminder_loop(bot: discord.Client):
                     _log.info(f"Reminder sent to {user.id}")
                 except Exception as e:
                     _log.warning(f"Failed to DM reminder to {user.id}: {e}")
-            reminder.delete_instance()
+            await run_db(reminder.delete_instance)
 
     except Exception as e:
         _log.error(f"Reminder loop error: {e}", exc_info=True)
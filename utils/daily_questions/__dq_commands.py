@@ -1,5 +1,6 @@
 # utils/daily_questions/dq_commands.py
 
+import io
 import math
 import discord
 from datetime import datetime
@@ -7,26 +8,62 @@ from discord import app_commands
 from discord.ext import commands
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__pagination import paginate_embed
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.admin.bot_management.__bm_logic import (
+    fetch_bot_data_for_server,
+    get_bot_data_for_server,
+)
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 from utils.helpers.__logging_module import get_log
 
+from .__dq_dedupe import QUESTION, find_duplicates, question_index
+from .__dq_deck import add_question
 from .__dq_logic import (
     send_specific_question_to_guild_no_usage,
-    renumber_display_order,
+    delete_question_by_display_order,
+    export_questions,
+    import_questions,
+    parse_question_file,
     reset_question_usage,
 )
 from .__dq_views import (
     DailyQuestionActionView,
     SuggestModalNEW,
-    QuestionVoteView,
     create_question_embed,
+    question_vote_view,
 )
 
 _log = get_log(__name__)
 
 
+def _toggle_daily_question(guild_id: int):
+    bot_data = get_bot_data_for_server(guild_id)
+    bot_data.daily_question_enabled = not bot_data.daily_question_enabled
+    bot_data.save()
+    return bot_data
+
+
+def _modify_question(display_order: int, text: str):
+    question = database.Question.get(display_order=display_order)
+    question.question = text
+    question.save()
+    return question
+
+
+def _question_page(page: int, page_size: int) -> list:
+    return list(
+        database.Question.select()
+        .order_by(database.Question.display_order)
+        .paginate(page, page_size)
+    )
+
+
+def _question_total_pages(page_size: int) -> int:
+    return math.ceil(database.Question.select().count() / page_size)
+
+
 class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
     def __init__(self, bot):
         self.bot = bot
@@ -40,6 +77,49 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
             ephemeral=True,
         )
 
+    @app_commands.command(name="export", description="Download the question bank as CSV.")
+    @has_admin_level(2)
+    async def export(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            data = await run_db(export_questions)
+        except Exception as e:
+            _log.error(f"Error exporting questions: {e}", exc_info=True)
+            await interaction.followup.send("❌ Failed to export questions.", ephemeral=True)
+            return
+        filename = f"questions_{datetime.utcnow():%Y%m%d}.csv"
+        await interaction.followup.send(
+            "📤 Question bank export:",
+            file=discord.File(io.BytesIO(data), filename=filename),
+            ephemeral=True,
+        )
+
+    @app_commands.command(name="import", description="Add questions from a .txt or .csv file.")
+    @app_commands.describe(
+        file="One question per line (.txt), or a CSV with a `question` column (e.g. an export)."
+    )
+    @has_admin_level(2)
+    async def import_file(self, interaction: discord.Interaction, file: discord.Attachment):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            texts = parse_question_file(file.filename, await file.read())
+        except (ValueError, UnicodeDecodeError) as e:
+            await interaction.followup.send(f"❌ Could not read `{file.filename}`: {e}", ephemeral=True)
+            return
+        if not texts:
+            await interaction.followup.send("❌ No questions found in that file.", ephemeral=True)
+            return
+
+        try:
+            added, skipped = await run_db(import_questions, texts)
+        except Exception as e:
+            _log.error(f"Error importing questions: {e}", exc_info=True)
+            await interaction.followup.send("❌ Failed to import questions.", ephemeral=True)
+            return
+        await interaction.followup.send(
+            f"✅ Imported {added} questions ({skipped} duplicates skipped).", ephemeral=True
+        )
+
     # ---------- Callbacks ---------- #
     def get_callback(self, action: str):
         match action:
@@ -67,7 +147,7 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
             ephemeral=True
         )  # keeps UI snappy and avoids double-send errors
 
-        bot_data = get_bot_data_for_server(str(interaction.guild.id))
+        bot_data = await fetch_bot_data_for_server(interaction.guild.id)
         # Prefer explicit id, otherwise fall back to last recorded
         question_id = id or (bot_data.last_question_posted if bot_data else None)
 
@@ -105,9 +185,7 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
 
     async def repost_last_question(self, interaction: discord.Interaction):
         try:
-            database.ensure_database_connection()
-
-            bot_data = get_bot_data_for_server(str(interaction.guild.id))
+            bot_data = await fetch_bot_data_for_server(interaction.guild.id)
             if not bot_data or not bot_data.last_question_posted:
                 await interaction.response.send_message(
                     "No previous question found to repost.", ephemeral=True
@@ -115,8 +193,9 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
                 return
 
             # Fetch the last posted question
-            question = database.Question.get(
-                database.Question.display_order == bot_data.last_question_posted
+            question = await run_db(
+                database.Question.get,
+                database.Question.display_order == bot_data.last_question_posted,
             )
 
             # Build the embed via the shared factory in __dq_views.py
@@ -136,7 +215,9 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
             # Send with the standard voting view
             await channel.send(
                 embed=embed,
-                view=QuestionVoteView(self.bot, question.display_order),
+                view=question_vote_view(
+                    question.id, (question.upvotes, question.downvotes)
+                ),
             )
 
             await interaction.response.send_message(
@@ -156,11 +237,14 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
 
     async def new_question(self, interaction: discord.Interaction, question: str):
         try:
-            database.Question.create(question=question, usage=False)
-            renumber_display_order()
-            await interaction.response.send_message(
-                "✅ Question added.", ephemeral=True
-            )
+            duplicates = await find_duplicates(question)
+            await run_db(add_question, question)
+            message = "✅ Question added."
+            if duplicates:
+                message += "\n⚠️ Similar questions already exist:\n" + "\n".join(
+                    f"• {match.describe()}" for match in duplicates
+                )
+            await interaction.response.send_message(message, ephemeral=True)
         except Exception as e:
             _log.error(f"Error adding question: {e}", exc_info=True)
             await interaction.response.send_message(
@@ -171,44 +255,34 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
         self, interaction: discord.Interaction, id: str, question: str
     ):
         try:
-            q = database.Question.get(display_order=id)
-            q.question = question
-            q.save()
+            q = await run_db(_modify_question, int(id), question)
+            question_index.upsert(QUESTION, q.id, question, q.display_order)
             await interaction.response.send_message(
                 f"✅ Modified question `{id}`.", ephemeral=True
             )
-        except database.Question.DoesNotExist:
+        except (database.Question.DoesNotExist, ValueError):
             await interaction.response.send_message(
                 "❌ Question not found.", ephemeral=True
             )
 
     async def delete_question(self, interaction: discord.Interaction, id: str):
         try:
-            q = database.Question.get(display_order=id)
-            q.delete_instance()
-            renumber_display_order()
+            deleted = await run_db(delete_question_by_display_order, int(id))
+        except ValueError:
+            deleted = False
+        if deleted:
             await interaction.response.send_message(
                 f"🗑️ Question `{id}` deleted.", ephemeral=True
             )
-        except database.Question.DoesNotExist:
+        else:
             await interaction.response.send_message(
                 "❌ Question not found.", ephemeral=True
             )
 
     async def list_questions(self, interaction: discord.Interaction):
-        renumber_display_order()
-
-        def get_total_pages(page_size: int) -> int:
-            total = database.Question.select().count()
-            return math.ceil(total / page_size)
-
         async def populate_embed(embed: discord.Embed, page: int):
             embed.clear_fields()
-            questions = (
-                database.Question.select()
-                .order_by(database.Question.display_order)
-                .paginate(page, 10)
-            )
+            questions = await run_db(_question_page, page, 10)
             q_list = "\n".join(f"{q.display_order}. {q.question}" for q in questions)
             embed.add_field(name=f"Page {page}", value=q_list or "*No Questions Found*")
             return embed
@@ -220,7 +294,7 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
                 interaction,
                 embed,
                 populate_embed,
-                get_total_pages(10),
+                await run_db(_question_total_pages, 10),
                 page=1,
             )
         except Exception as e:
@@ -231,9 +305,8 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
 
     async def toggle_daily_question(self, interaction: discord.Interaction):
         try:
-            bot_data = get_bot_data_for_server(str(interaction.guild.id))
-            bot_data.daily_question_enabled = not bot_data.daily_question_enabled
-            bot_data.save()
+            bot_data = await run_db(_toggle_daily_question, interaction.guild.id)
+            bot_data_cache.update(bot_data)
             status = "enabled" if bot_data.daily_question_enabled else "disabled"
             await interaction.response.send_message(
                 f"✅ Daily questions {status}.", ephemeral=True
@@ -246,7 +319,7 @@ class DailyQuestionCommands(commands.GroupCog, name="daily-question"):
 
     async def reset_usage(self, interaction: discord.Interaction):
         try:
-            count = reset_question_usage()
+            count = await run_db(reset_question_usage)
             await interaction.response.send_message(
                 f"✅ Reset usage for {count} questions.", ephemeral=True
             )
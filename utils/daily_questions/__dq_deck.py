@@ -0,0 +1,138 @@
+# utils/daily_questions/__dq_deck.py
+
+import math
+import os
+import random
+from datetime import datetime
+
+from peewee import fn
+
+from utils.database import __database as database
+from utils.helpers.__logging_module import get_log
+from .__dq_dedupe import QUESTION, question_index
+
+_log = get_log(__name__)
+
+# Order reshuffled decks by votes (well-liked questions tend to come up sooner).
+DQ_DECK_WEIGHTED = os.getenv("dq_deck_weighted", "false").lower() in ("1", "true", "yes")
+
+_STATE_ID = 1
+
+# Deck keys are exponential "arrival times": each question draws -ln(U) / weight
+# and the deck is served in ascending key order. With equal weights that is a
+# uniform shuffle; with vote weights it is a weighted shuffle without
+# replacement. Because the exponential is memoryless, a new question drawn as
+# last_key + Exp(weight) lands at a uniformly random spot among the questions
+# still to come.
+_WEIGHT_SQL = "(1 + GREATEST(upvotes - downvotes, 0))"
+
+
+def _draw(weight: float = 1.0) -> float:
+    return -math.log(1.0 - random.random()) / weight
+
+
+def _state(for_update: bool = False):
+    query = database.QuestionDeckState.select().where(
+        database.QuestionDeckState.id == _STATE_ID
+    )
+    if for_update:
+        query = query.for_update()
+    state = query.first()
+    if state is None:
+        state = database.QuestionDeckState.create(id=_STATE_ID, weighted=DQ_DECK_WEIGHTED)
+    return state
+
+
+def reshuffle_deck(weighted: bool | None = None) -> int:
+    """Deal a fresh deck: one UPDATE assigns every question a new key. Returns the deck size."""
+    with database.db.atomic():
+        state = _state(for_update=True)
+        if weighted is not None:
+            state.weighted = weighted
+        weight = _WEIGHT_SQL if state.weighted else "1"
+        cursor = database.db.execute_sql(
+            f"UPDATE question SET deck_key = -LN(1 - RAND()) / {weight}, `usage` = 0"
+        )
+        state.last_key = 0
+        state.cycle += 1
+        state.shuffled_at = datetime.utcnow()
+        state.save()
+    _log.info(
+        f"🔀 Reshuffled question deck (cycle {state.cycle}, "
+        f"{'vote-weighted' if state.weighted else 'uniform'}, {cursor.rowcount} questions)."
+    )
+    return cursor.rowcount
+
+
+def _next_after(key: float):
+    return (
+        database.Question.select()
+        .where(database.Question.deck_key > key)
+        .order_by(database.Question.deck_key)
+        .first()
+    )
+
+
+def draw_next_question():
+    """
+    Serve the next question in the deck: one index seek on deck_key. The deck is
+    reshuffled only when exhausted. Must be called inside a transaction.
+    """
+    state = _state(for_update=True)
+    question = _next_after(state.last_key)
+    if question is None:
+        reshuffle_deck()
+        state = _state(for_update=True)
+        question = _next_after(state.last_key)
+        if question is None:
+            raise database.Question.DoesNotExist("The question bank is empty.")
+
+    state.last_key = question.deck_key
+    state.save()
+    database.Question.update(usage=True).where(
+        database.Question.id == question.id
+    ).execute()
+    return question
+
+
+def insert_key() -> float:
+    """Deck key for a new question: a random position among the questions not yet served."""
+    state = _state()
+    return state.last_key + _draw()
+
+
+def insert_keys(count: int) -> list[float]:
+    """insert_key() for a batch of new questions; each lands independently."""
+    last_key = _state().last_key
+    return [last_key + _draw() for _ in range(count)]
+
+
+def next_display_order() -> int:
+    """display_order for the next question appended to the bank."""
+    return (database.Question.select(fn.MAX(database.Question.display_order)).scalar() or 0) + 1
+
+
+def add_question(text: str, **fields):
+    """Create a question and shuffle it into the remaining deck."""
+    with database.db.atomic():
+        question = database.Question.create(
+            question=text,
+            usage=False,
+            deck_key=insert_key(),
+            display_order=next_display_order(),
+            **fields,
+        )
+    question_index.upsert(QUESTION, question.id, text, question.display_order)
+    return question
+
+
+def deck_status() -> dict:
+    state = _state()
+    q = database.Question
+    return {
+        "cycle": state.cycle,
+        "weighted": state.weighted,
+        "remaining": q.select().where(q.deck_key > state.last_key).count(),
+        "total": q.select().count(),
+        "shuffled_at": state.shuffled_at,
+    }
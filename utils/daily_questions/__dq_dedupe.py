@@ -0,0 +1,201 @@
+# utils/daily_questions/__dq_dedupe.py
+
+import math
+import os
+import re
+import threading
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# Trigram Jaccard similarity at or above which texts are flagged as near-duplicates.
+DQ_DUPLICATE_THRESHOLD = min(1.0, max(0.1, float(os.getenv("dq_duplicate_threshold", "0.6"))))
+
+QUESTION = "question"
+SUGGESTION = "suggestion"
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Character trigrams of the normalised text (case, punctuation and spacing ignored)."""
+    norm = _SPACES.sub(" ", _NON_WORD.sub("", text.casefold())).strip()
+    padded = f"  {norm} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class DuplicateMatch:
+    __slots__ = ("kind", "id", "label", "text", "score")
+
+    def __init__(self, kind: str, id: int, label, text: str, score: float):
+        self.kind = kind
+        self.id = id
+        self.label = label  # display_order for questions, queue id for suggestions
+        self.text = text
+        self.score = score
+
+    def describe(self) -> str:
+        where = f"Question #{self.label}" if self.kind == QUESTION else "Pending suggestion"
+        text = self.text if len(self.text) <= 120 else self.text[:119] + "…"
+        return f"{where} ({self.score:.0%}): {text}"
+
+
+class _Doc:
+    __slots__ = ("label", "text", "grams", "prefix")
+
+    def __init__(self, label, text: str, grams: frozenset[str], prefix: list[str]):
+        self.label = label
+        self.text = text
+        self.grams = grams
+        self.prefix = prefix
+
+
+class DuplicateIndex:
+    """
+    Prefix-filtered trigram index over the question bank and suggestion queue.
+
+    If two texts have Jaccard >= t, then under any fixed ordering of trigrams
+    their prefixes intersect. A text's prefix is its first |A| - ceil(t·|A|) + 1
+    trigrams. Trigrams are ordered rarest first (document frequency at the last
+    load), so only each text's prefix is indexed. A lookup reads a few short
+    posting lists and verifies every candidate with one set intersection.
+
+    Mutations come from DB worker threads, so everything runs under a lock. The
+    initial load holds the lock across its SELECT; a write committed during the
+    load is either in the snapshot or applied right after it.
+    """
+
+    def __init__(self, threshold: float = DQ_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self._docs: dict[tuple[str, int], _Doc] = {}
+        self._postings: dict[str, set[tuple[str, int]]] = {}
+        self._rank: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _order(self, gram: str):
+        # Trigrams unseen at load time count as rarest; ties break on the text
+        # so the order is total and stable until the next load.
+        return self._rank.get(gram, -1), gram
+
+    def _prefix(self, grams: frozenset[str]) -> list[str]:
+        size = len(grams) - math.ceil(self.threshold * len(grams)) + 1
+        return sorted(grams, key=self._order)[:size]
+
+    def _add(self, key: tuple[str, int], label, text: str, grams: frozenset[str] | None = None):
+        self._remove(key)
+        grams = trigrams(text) if grams is None else grams
+        doc = self._docs[key] = _Doc(label, text, grams, self._prefix(grams))
+        for gram in doc.prefix:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def _remove(self, key: tuple[str, int]):
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for gram in doc.prefix:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def load(self) -> int:
+        """(Re)build from the database. Blocking; run via run_db."""
+        with self._lock:
+            q = database.Question
+            s = database.QuestionSuggestionQueue
+            rows = [
+                ((QUESTION, qid), order, text or "")
+                for qid, order, text in q.select(q.id, q.display_order, q.question).tuples().iterator()
+            ]
+            rows += [
+                ((SUGGESTION, sid), sid, text or "")
+                for sid, text in s.select(s.id, s.question).tuples().iterator()
+            ]
+            grams = [trigrams(text) for _, _, text in rows]
+
+            frequency: dict[str, int] = {}
+            for doc_grams in grams:
+                for gram in doc_grams:
+                    frequency[gram] = frequency.get(gram, 0) + 1
+            self._rank = {
+                gram: rank for rank, gram in enumerate(sorted(frequency, key=lambda g: (frequency[g], g)))
+            }
+
+            self._docs.clear()
+            self._postings.clear()
+            for (key, label, text), doc_grams in zip(rows, grams):
+                self._add(key, label, text, doc_grams)
+            self._loaded = True
+            count = len(self._docs)
+        _log.info(f"🔎 Indexed {count} questions and suggestions for duplicate checks.")
+        return count
+
+    def upsert(self, kind: str, id: int, text: str, label=None):
+        with self._lock:
+            if self._loaded:
+                self._add((kind, id), label if label is not None else id, text)
+
+    def remove(self, kind: str, id: int):
+        with self._lock:
+            self._remove((kind, id))
+
+    def shift_question_labels(self, after: int):
+        """Mirror delete_question_by_display_order's renumbering (labels > after move down)."""
+        with self._lock:
+            for (kind, _), doc in self._docs.items():
+                if kind == QUESTION and isinstance(doc.label, int) and doc.label > after:
+                    doc.label -= 1
+
+    def find(
+        self,
+        text: str,
+        *,
+        limit: int = 3,
+        exclude: tuple[str, int] | None = None,
+    ) -> list[DuplicateMatch]:
+        """Indexed texts with trigram Jaccard >= threshold, most similar first."""
+        grams = trigrams(text)
+        if not grams:
+            return []
+        t = self.threshold
+        # Jaccard >= t is impossible unless the sizes are within a factor of t.
+        low, high = t * len(grams), len(grams) / t
+        matches = []
+        with self._lock:
+            candidates = set()
+            for gram in self._prefix(grams):
+                candidates.update(self._postings.get(gram, ()))
+            candidates.discard(exclude)
+            for key in candidates:
+                doc = self._docs[key]
+                if not low <= len(doc.grams) <= high:
+                    continue
+                shared = len(grams & doc.grams)
+                score = shared / (len(grams) + len(doc.grams) - shared)
+                if score >= t:
+                    matches.append(DuplicateMatch(key[0], key[1], doc.label, doc.text, score))
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+
+question_index = DuplicateIndex()
+
+
+async def find_duplicates(text: str, **kwargs) -> list[DuplicateMatch]:
+    """Near-duplicates of `text`; loads the index on first use."""
+    if not question_index.loaded:
+        await run_db(question_index.load)
+    return question_index.find(text, **kwargs)
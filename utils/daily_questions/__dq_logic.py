@@ -1,15 +1,25 @@
 # utils/daily_questions/dq_logic.py
 
+import csv
+import io
+
 import pytz
 import discord
 from datetime import datetime, date
-from peewee import fn
 
 from utils.database import __database as database
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_logic import (
+    fetch_bot_data_for_server,
+    get_bot_data_for_server,
+)
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 
+from utils.helpers.__fanout import FanoutReport, SkipGuild, fan_out
 from utils.helpers.__logging_module import get_log
-from .__dq_views import QuestionVoteView, create_question_embed
+from .__dq_dedupe import QUESTION, question_index
+from .__dq_deck import draw_next_question, insert_keys, next_display_order, reshuffle_deck
+from .__dq_views import create_question_embed, question_vote_view
 
 _log = get_log(__name__)
 
@@ -25,10 +35,6 @@ def _now_cst_naive() -> datetime:
     return datetime.now(pytz.timezone("America/Chicago")).replace(tzinfo=None)
 
 
-def _ensure_db():
-    database.ensure_database_connection()
-
-
 # Raw SQL helpers (robust against ORM mapping issues)
 # Adjust column/table names here if your schema differs.
 _DQL_TABLE = "daily_question_log"
@@ -70,7 +76,6 @@ def _upsert_daily_log(today: date, question_id: int, posted_at: datetime):
 
 
 def get_or_create_todays_question_id() -> int:
-    _ensure_db()
     today = _today_cst_date()
 
     with database.db.atomic():
@@ -83,20 +88,8 @@ def get_or_create_todays_question_id() -> int:
             q = database.Question.get_by_id(qid)
             return q.display_order
 
-        # Pick an unused question (usage is "True"/"False" text in your schema)
-        unused = database.Question.select().where(database.Question.usage == False)
-        if not unused.exists():
-            database.Question.update(usage=False).execute()
-
-        question = (
-            database.Question.select()
-            .where(database.Question.usage == False)
-            .order_by(fn.Rand())
-            .limit(1)
-            .get()
-        )
-        question.usage = True
-        question.save()
+        # Next card from the persisted shuffled deck (reshuffles when exhausted)
+        question = draw_next_question()
 
         # Upsert today's log row (robust against double-runs)
         _upsert_daily_log(today, question.id, _now_cst_naive())
@@ -106,148 +99,307 @@ def get_or_create_todays_question_id() -> int:
 
 # ----- Posting flows -----
 
+# _deliver_question per-guild states within one broadcast.
+_SENDING = "sending"
+_SENT = "sent"
 
-async def post_question_to_guild(
+
+def _record_question_posted(guild_id: int, question_id, posted_at: datetime):
+    bot_data = get_bot_data_for_server(guild_id)
+    if bot_data:
+        bot_data.last_question_posted = str(question_id)
+        bot_data.last_question_posted_time = posted_at
+        bot_data.save()
+        bot_data_cache.update(bot_data)
+
+
+async def _deliver_question(
     bot,
     guild,
     question_id,
     embed,
     posted_at: datetime,
     *,
-    record_to_botdata: bool = True,
+    view: discord.ui.View,
+    record_to_botdata: bool,
+    deliveries: dict[int, str] | None = None,
 ):
     """
-    Posts the question to a single guild if enabled.
-    When record_to_botdata=False, does NOT touch BotData.last_question_posted(_time).
+    Post to one guild. Raises SkipGuild when the guild isn't set up (or already
+    has today's question); send errors propagate so fan_out can retry them.
+
+    `deliveries` (one dict per broadcast) makes retries safe: a guild whose
+    message went out only redoes the BotData write, and a guild whose send was
+    interrupted (timeout, dropped connection) is never sent to again, since
+    the message may have landed.
     """
-    try:
-        bot_data = get_bot_data_for_server(str(guild.id))
+    # Normalize to naive for DB comparisons/saves
+    posted_at_naive = posted_at.replace(tzinfo=None) if posted_at.tzinfo else posted_at
+    state = deliveries.get(guild.id) if deliveries is not None else None
+    if state == _SENDING:
+        raise RuntimeError("an earlier attempt may already have posted; not sending again")
+
+    if state != _SENT:
+        bot_data = await fetch_bot_data_for_server(guild.id)
         if not bot_data:
-            _log.warning(
-                f"No BotData for guild {guild.id} — configure the server first."
-            )
-            return
+            raise SkipGuild("no BotData — configure the server first")
         if not bot_data.daily_question_enabled:
-            _log.debug(f"Daily Question disabled for {guild.name} ({guild.id}).")
-            return
-        if not bot_data.daily_question_channel:
-            _log.warning(
-                f"No daily_question_channel set for {guild.name} ({guild.id})."
-            )
-            return
-
-        # Normalize to naive for DB comparisons/saves
-        posted_at_naive = (
-            posted_at.replace(tzinfo=None) if posted_at.tzinfo else posted_at
-        )
+            raise SkipGuild("daily questions disabled")
+        channel_id = bot_data.channel_id("daily_question_channel")
+        if not channel_id:
+            raise SkipGuild("no daily_question_channel set")
 
         # Only do the "already posted today" guard for the normal daily posts
         if record_to_botdata:
             if (
                 bot_data.last_question_posted_time
                 and bot_data.last_question_posted_time.date() == posted_at_naive.date()
+                and str(bot_data.last_question_posted) == str(question_id)
             ):
-                if str(bot_data.last_question_posted) == str(question_id):
-                    _log.debug(
-                        f"⏭️ Already posted today's question to {guild.name}; skipping."
-                    )
-                    return
+                raise SkipGuild("already posted today's question")
 
-        send_channel = bot.get_channel(int(bot_data.daily_question_channel))
+        send_channel = bot.get_channel(channel_id)
         if not send_channel:
-            _log.error(
-                f"❌ Channel ID {bot_data.daily_question_channel} not found in {guild.name}."
-            )
-            return
-
-        view = QuestionVoteView(bot, question_id)
-        await send_channel.send(embed=embed, view=view)
+            raise SkipGuild(f"channel {channel_id} not found")
+
+        if deliveries is not None:
+            deliveries[guild.id] = _SENDING
+        try:
+            await send_channel.send(embed=embed, view=view)
+        except discord.HTTPException:
+            # Discord answered with an error, so nothing was posted; retrying is safe.
+            if deliveries is not None:
+                del deliveries[guild.id]
+            raise
+        if deliveries is not None:
+            deliveries[guild.id] = _SENT
         _log.info(
             f"📤 Posted question #{question_id} to {send_channel.name} in {guild.name} (record={record_to_botdata})."
         )
 
-        if record_to_botdata:
-            bot_data.last_question_posted = str(question_id)
-            bot_data.last_question_posted_time = posted_at_naive
-            bot_data.save()
+    if record_to_botdata:
+        await run_db(_record_question_posted, guild.id, question_id, posted_at_naive)
 
+
+async def post_question_to_guild(
+    bot,
+    guild,
+    question_id,
+    embed,
+    posted_at: datetime,
+    *,
+    view: discord.ui.View,
+    record_to_botdata: bool = True,
+):
+    """
+    Posts the question to a single guild if enabled. `view` comes from
+    question_vote_view() and can be shared by every guild in a broadcast.
+    When record_to_botdata=False, does NOT touch BotData.last_question_posted(_time).
+    """
+    try:
+        await _deliver_question(
+            bot, guild, question_id, embed, posted_at,
+            view=view, record_to_botdata=record_to_botdata,
+        )
+    except SkipGuild as e:
+        _log.debug(f"⏭️ Not posting question to {guild.name} ({guild.id}): {e}")
     except Exception as e:
         _log.error(f"❌ Failed to send question to {guild.name}: {e}", exc_info=True)
 
 
+def _load_question(question_display_order: int):
+    return database.Question.get(database.Question.display_order == question_display_order)
+
+
 async def send_daily_question_to_guilds(
     bot, question_display_order: int, when_cst: datetime
-):
+) -> FanoutReport | None:
     """
-    Build embed once and post to every enabled guild, using the already-chosen
-    question_display_order for today.
+    Build embed once and post to every enabled guild concurrently, using the
+    already-chosen question_display_order for today.
     """
     try:
-        _ensure_db()
-        question = database.Question.get(
-            database.Question.display_order == question_display_order
-        )
-        embed = create_question_embed(question)
+        question = await run_db(_load_question, question_display_order)
+    except Exception as e:
+        _log.error(f"❌ Error loading daily question #{question_display_order}: {e}", exc_info=True)
+        return None
 
-        # Normalize to naive before we pass into post_question_to_guild
-        when_naive = when_cst.replace(tzinfo=None) if when_cst.tzinfo else when_cst
+    embed = create_question_embed(question)
+    view = question_vote_view(question.id, (question.upvotes, question.downvotes))
+    # Normalize to naive before we pass into _deliver_question
+    when_naive = when_cst.replace(tzinfo=None) if when_cst.tzinfo else when_cst
 
-        for guild in bot.guilds:
-            await post_question_to_guild(
-                bot, guild, question.display_order, embed, when_naive
-            )
+    deliveries: dict[int, str] = {}
 
-    except Exception as e:
-        _log.error(f"❌ Error posting daily question to guilds: {e}", exc_info=True)
+    async def post(guild):
+        await _deliver_question(
+            bot, guild, question.display_order, embed, when_naive,
+            view=view, record_to_botdata=True, deliveries=deliveries,
+        )
 
+    return await fan_out("Daily question", bot.guilds, post)
 
-async def send_daily_question_repost_to_guild(
-    bot, guild_id, question_display_order: int
-) -> None:
+
+async def repost_daily_question_to_guilds(bot, question_display_order: int) -> FanoutReport | None:
     """
-    Reposts today's question to a single guild.
+    Reposts today's question to every guild that received it this morning.
+    Reposts leave BotData alone, so the morning post's guard never suppresses them.
     """
     try:
-        _ensure_db()
-        question = database.Question.get(
-            database.Question.display_order == question_display_order
-        )
-        embed = create_question_embed(question)
-
-        guild = bot.get_guild(guild_id)
-        if guild:
-            now_cst = _now_cst_naive()
-            await post_question_to_guild(
-                bot, guild, question.display_order, embed, now_cst
+        question = await run_db(_load_question, question_display_order)
+    except Exception as e:
+        _log.error(f"❌ Error loading daily question #{question_display_order}: {e}", exc_info=True)
+        return None
+
+    embed = create_question_embed(question)
+    view = question_vote_view(question.id, (question.upvotes, question.downvotes))
+    now_cst = _now_cst_naive()
+    deliveries: dict[int, str] = {}
+
+    async def repost(guild):
+        bot_data = await fetch_bot_data_for_server(guild.id)
+        # Only repost if we posted this question to this guild earlier today
+        if bot_data and bot_data.last_question_posted != str(question_display_order):
+            raise SkipGuild(
+                f"last_question_posted={bot_data.last_question_posted}, today={question_display_order}"
             )
+        await _deliver_question(
+            bot, guild, question.display_order, embed, now_cst,
+            view=view, record_to_botdata=False, deliveries=deliveries,
+        )
 
-    except Exception as e:
-        _log.error(f"❌ Error reposting daily question: {e}", exc_info=True)
+    return await fan_out("Daily question repost", bot.guilds, repost)
 
 
 # ----- Maintenance -----
 
 
-def renumber_display_order():
-    """Reassign sequential display_order to all questions based on creation order."""
+# Closes gaps left by deletes; only rows whose number actually changes are written.
+_RENUMBER_SQL = """
+    UPDATE question q
+    JOIN (SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS rn FROM question) r
+      ON q.id = r.id
+    SET q.display_order = r.rn
+    WHERE q.display_order IS NULL OR q.display_order <> r.rn
+"""
+
+_IMPORT_CHUNK = 500
+_EXPORT_COLUMNS = ("display_order", "question", "upvotes", "downvotes", "usage")
+
+
+def renumber_display_order() -> int:
+    """
+    Reassign sequential display_order to all questions based on creation
+    order, in one set-based UPDATE. Returns the number of rows renumbered.
+    """
     try:
-        _ensure_db()
-        questions = database.Question.select().order_by(database.Question.id)
-        for new_order, question in enumerate(questions, start=1):
-            question.display_order = new_order
-            question.save()
-        _log.info("✅ Renumbered display_order for all questions.")
+        with database.db.atomic():
+            cursor = database.db.execute_sql(_RENUMBER_SQL)
+        if cursor.rowcount:
+            _log.info(f"✅ Renumbered display_order for {cursor.rowcount} questions.")
+            if question_index.loaded:
+                question_index.load()
+        return cursor.rowcount
     except Exception as e:
         _log.error(f"❌ Failed to renumber display_order: {e}", exc_info=True)
+        return 0
+
+
+def delete_question_by_display_order(display_order: int) -> bool:
+    """Delete one question and shift the ones after it down, in one transaction."""
+    q = database.Question
+    with database.db.atomic():
+        question_id = q.select(q.id).where(q.display_order == display_order).scalar()
+        if question_id is None:
+            return False
+        q.delete().where(q.id == question_id).execute()
+        q.update(display_order=q.display_order - 1).where(
+            q.display_order > display_order
+        ).execute()
+    question_index.remove(QUESTION, question_id)
+    question_index.shift_question_labels(display_order)
+    _log.info(f"🗑️ Deleted question #{display_order}.")
+    return True
+
+
+def export_questions() -> bytes:
+    """The whole question bank as CSV, in display order."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_EXPORT_COLUMNS)
+    rows = (
+        database.Question.select(
+            *(getattr(database.Question, column) for column in _EXPORT_COLUMNS)
+        )
+        .order_by(database.Question.display_order)
+        .tuples()
+        .iterator()
+    )
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def parse_question_file(filename: str, data: bytes) -> list[str]:
+    """
+    Question texts from an uploaded file: a .csv with a `question` column
+    (the export format), or plain text with one question per line.
+    """
+    text = data.decode("utf-8-sig")
+    if filename.lower().endswith(".csv"):
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames or "question" not in reader.fieldnames:
+            raise ValueError("CSV files need a `question` column.")
+        lines = (row.get("question") or "" for row in reader)
+    else:
+        lines = text.splitlines()
+    return [line.strip() for line in lines if line and line.strip()]
+
+
+def import_questions(texts: list[str]) -> tuple[int, int]:
+    """
+    Append new questions in chunked multi-row inserts, skipping ones already in
+    the bank (case-insensitive). Imported questions are shuffled into the
+    remaining deck. Returns (added, skipped).
+    """
+    q = database.Question
+    seen = {text.casefold() for (text,) in q.select(q.question).tuples().iterator()}
+    fresh = []
+    for text in texts:
+        key = text.casefold()
+        if key not in seen:
+            seen.add(key)
+            fresh.append(text)
+
+    with database.db.atomic():
+        order = next_display_order()
+        keys = insert_keys(len(fresh))
+        for start in range(0, len(fresh), _IMPORT_CHUNK):
+            chunk = fresh[start : start + _IMPORT_CHUNK]
+            q.insert_many(
+                [
+                    {
+                        "question": text,
+                        "display_order": order + start + i,
+                        "deck_key": keys[start + i],
+                        "usage": False,
+                    }
+                    for i, text in enumerate(chunk)
+                ]
+            ).execute()
+
+    if fresh and question_index.loaded:
+        question_index.load()
+    _log.info(f"📥 Imported {len(fresh)} questions ({len(texts) - len(fresh)} duplicates skipped).")
+    return len(fresh), len(texts) - len(fresh)
 
 
 def reset_question_usage() -> int:
     """
-    Resets all questions' usage status to "False".
+    Starts a new question cycle: reshuffles the deck and resets every
+    question's usage status to "False".
     """
     try:
-        _ensure_db()
-        updated = database.Question.update(usage=False).execute()
+        updated = reshuffle_deck()
         _log.info(f"🔄 Reset usage for {updated} questions.")
         return updated
     except Exception as e:
@@ -266,10 +418,7 @@ async def send_specific_question_to_guild_no_usage(
     and without recording BotData.last_question_posted(_time).
     """
     try:
-        _ensure_db()
-        question = database.Question.get(
-            database.Question.display_order == question_display_order
-        )
+        question = await run_db(_load_question, question_display_order)
         embed = create_question_embed(question)
 
         guild = bot.get_guild(int(guild_id))
@@ -284,6 +433,7 @@ async def send_specific_question_to_guild_no_usage(
             question.display_order,
             embed,
             now_cst,
+            view=question_vote_view(question.id, (question.upvotes, question.downvotes)),
             record_to_botdata=False,  # do NOT touch BotData
         )
 
@@ -1,19 +1,30 @@
 # utils/MRP_Cogs/daily_questions/dq_views.py
 
+import asyncio
+import os
+
 import discord
 from discord import ui
 from datetime import datetime
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
 from typing import Callable, Optional
+from .__dq_dedupe import QUESTION, SUGGESTION, find_duplicates, question_index
+from .__dq_deck import add_question
 import re
 
 _log = get_log(__name__)
 
 QUESTION_UPVOTE_CUSTOM_ID = "question_upvote"
 QUESTION_DOWNVOTE_CUSTOM_ID = "question_downvote"
+QUESTION_SUGGEST_CUSTOM_ID = "persistent_view:qsm_sug_question"
 QUESTION_FOOTER_RE = re.compile(r"Question #(?P<question_id>\d+)")
 
+# Seconds a posted question's vote counts wait before its buttons are relabelled,
+# so a burst of clicks costs one message edit.
+DQ_VOTE_LABEL_WINDOW = max(0.5, float(os.getenv("dq_vote_label_window", "2")))
+
 
 # ──────────────── NEW: Daily QOD Manager Interface ──────────────── #
 class DailyQuestionActionView(discord.ui.View):
@@ -113,129 +124,271 @@ class QuestionIDInputModal(discord.ui.Modal):
         await self.callback_func(interaction, self.id_input.value)
 
 
-# ──────────────── EXISTING COMPONENTS: UNCHANGED ──────────────── #
+# ──────────────── VOTE BUTTONS ──────────────── #
+# Vote buttons carry the question's primary key in their custom_id and are
+# registered once with bot.add_dynamic_items(); no View object is kept per post.
 
 
-class QuestionVoteView(discord.ui.View):
-    def __init__(self, bot, question_id=None, *, include_suggest: bool = True):
-        super().__init__(timeout=None)
-        self.bot = bot
+class QuestionVoteButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"dq:vote:(?P<vote_type>up|down):(?P<question_id>[0-9]+)",
+):
+    def __init__(self, question_id: int, vote_type: str, count: int | None = None):
+        emoji = "👍" if vote_type == "up" else "👎"
+        super().__init__(
+            discord.ui.Button(
+                label=emoji if count is None else f"{emoji} {count}",
+                style=discord.ButtonStyle.green if vote_type == "up" else discord.ButtonStyle.red,
+                custom_id=f"dq:vote:{vote_type}:{question_id}",
+            )
+        )
         self.question_id = question_id
+        self.vote_type = vote_type
 
-        question = None
-        if question_id is not None:
-            question = database.Question.get(display_order=question_id)
-
-        self.upvote_count = question.upvotes if question else 0
-        self.downvote_count = question.downvotes if question else 0
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]
+    ):
+        return cls(int(match["question_id"]), match["vote_type"])
 
-        self.upvote_button = discord.ui.Button(
-            label=f"👍 {self.upvote_count}" if question else "👍",
-            style=discord.ButtonStyle.green,
-            custom_id=QUESTION_UPVOTE_CUSTOM_ID,
-        )
-        self.upvote_button.callback = self.handle_upvote
-        self.add_item(self.upvote_button)
+    async def callback(self, interaction: discord.Interaction):
+        await _handle_vote(interaction, self.question_id, self.vote_type)
 
-        self.downvote_button = discord.ui.Button(
-            label=f"👎 {self.downvote_count}" if question else "👎",
-            style=discord.ButtonStyle.red,
-            custom_id=QUESTION_DOWNVOTE_CUSTOM_ID,
-        )
-        self.downvote_button.callback = self.handle_downvote
-        self.add_item(self.downvote_button)
 
-        if include_suggest:
-            self.suggest_button = discord.ui.Button(
+class SuggestQuestionButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=re.escape(QUESTION_SUGGEST_CUSTOM_ID),
+):
+    def __init__(self):
+        super().__init__(
+            discord.ui.Button(
                 label="Suggest a Question!",
                 style=discord.ButtonStyle.blurple,
                 emoji="📝",
-                custom_id="persistent_view:qsm_sug_question",
+                custom_id=QUESTION_SUGGEST_CUSTOM_ID,
             )
-            self.suggest_button.callback = self.handle_suggest_question
-            self.add_item(self.suggest_button)
+        )
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str]
+    ):
+        return cls()
 
-    async def handle_upvote(self, interaction: discord.Interaction):
-        await self._handle_vote(interaction, "up")
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_modal(SuggestModalNEW(interaction.client))
+
+
+def question_vote_view(
+    question_id: int,
+    counts: tuple[int, int] | None = None,
+    *,
+    include_suggest: bool = True,
+) -> discord.ui.View:
+    """
+    Components for a posted question. The view is stopped before it is sent so
+    discord.py does not store it per message; clicks reach the dynamic items.
+    The same view can be reused for every guild in a broadcast.
+    """
+    view = discord.ui.View(timeout=None)
+    up, down = counts if counts is not None else (None, None)
+    view.add_item(QuestionVoteButton(question_id, "up", up))
+    view.add_item(QuestionVoteButton(question_id, "down", down))
+    if include_suggest:
+        view.add_item(SuggestQuestionButton())
+    view.stop()
+    return view
+
+
+class LegacyQuestionVoteView(discord.ui.View):
+    """
+    Handles vote buttons on questions posted before the dynamic buttons, which
+    only identify the question through the embed footer. The first relabel
+    swaps in dynamic buttons. Suggest clicks are handled by SuggestQuestionButton.
+    """
 
-    async def handle_downvote(self, interaction: discord.Interaction):
-        await self._handle_vote(interaction, "down")
+    def __init__(self):
+        super().__init__(timeout=None)
 
-    async def _handle_vote(self, interaction: discord.Interaction, vote_type: str):
-        user_id = str(interaction.user.id)
-        try:
-            database.ensure_database_connection()
-            question = self._get_question_from_interaction(interaction)
-            vote, created = database.QuestionVote.get_or_create(
-                question=question,
-                user_id=user_id,
-                defaults={"vote_type": vote_type},
-            )
+    @discord.ui.button(label="👍", style=discord.ButtonStyle.green, custom_id=QUESTION_UPVOTE_CUSTOM_ID)
+    async def upvote(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._vote(interaction, "up")
 
-            if not created:
-                if vote.vote_type == vote_type:
-                    vote.delete_instance()
-                    self._decrement_question_vote(question, vote_type)
-                else:
-                    old_vote_type = vote.vote_type
-                    vote.vote_type = vote_type
-                    vote.save()
-                    self._decrement_question_vote(question, old_vote_type)
-                    self._increment_question_vote(question, vote_type)
-            else:
-                self._increment_question_vote(question, vote_type)
-
-            question.save()
-            self._update_labels(question)
-            await interaction.response.edit_message(view=self)
+    @discord.ui.button(label="👎", style=discord.ButtonStyle.red, custom_id=QUESTION_DOWNVOTE_CUSTOM_ID)
+    async def downvote(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._vote(interaction, "down")
 
+    async def _vote(self, interaction: discord.Interaction, vote_type: str):
+        try:
+            display_order = _display_order_from_message(interaction.message)
+            if display_order is None:
+                raise ValueError("Could not determine daily question id for vote.")
+            question_id = await run_db(question_id_for_display_order, display_order)
         except Exception as e:
-            _log.error(f"Error handling {vote_type}vote: {e}", exc_info=True)
-            await self._send_vote_error(interaction)
-
-    def _get_question_from_interaction(self, interaction: discord.Interaction):
-        question_id = self.question_id or self._question_id_from_message(interaction)
-        if question_id is None:
-            raise ValueError("Could not determine daily question id for vote.")
-        return database.Question.get(display_order=str(question_id))
-
-    def _question_id_from_message(self, interaction: discord.Interaction):
-        message = interaction.message
-        if not message or not message.embeds:
-            return None
-
-        footer_text = message.embeds[0].footer.text or ""
-        match = QUESTION_FOOTER_RE.search(footer_text)
-        return match.group("question_id") if match else None
-
-    def _increment_question_vote(self, question, vote_type: str):
-        if vote_type == "up":
-            question.upvotes += 1
+            _log.error(f"Error resolving legacy {vote_type}vote: {e}", exc_info=True)
+            await _send_vote_error(interaction)
+            return
+        await _handle_vote(interaction, question_id, vote_type)
+
+
+def _display_order_from_message(message) -> int | None:
+    if not message or not message.embeds:
+        return None
+    footer_text = message.embeds[0].footer.text or ""
+    match = QUESTION_FOOTER_RE.search(footer_text)
+    return int(match.group("question_id")) if match else None
+
+
+def _has_suggest_button(message) -> bool:
+    return any(
+        getattr(child, "custom_id", None) == QUESTION_SUGGEST_CUSTOM_ID
+        for row in getattr(message, "components", ())
+        for child in getattr(row, "children", ())
+    )
+
+
+async def _handle_vote(interaction: discord.Interaction, question_id: int, vote_type: str):
+    try:
+        counts = await run_db(record_vote, question_id, interaction.user.id, vote_type)
+        await interaction.response.defer()
+        vote_labels.schedule(interaction, question_id, counts)
+    except Exception as e:
+        _log.error(f"Error handling {vote_type}vote: {e}", exc_info=True)
+        await _send_vote_error(interaction)
+
+
+async def _send_vote_error(interaction: discord.Interaction):
+    message = "I couldn't record that vote. Please try again in a moment."
+    try:
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
         else:
-            question.downvotes += 1
+            await interaction.response.send_message(message, ephemeral=True)
+    except discord.HTTPException:
+        pass
+
+
+# ──────────────── VOTE STORAGE ──────────────── #
+
+_COUNTER = {"up": "upvotes", "down": "downvotes"}
+
+
+def question_id_for_display_order(display_order: int) -> int:
+    row = database.db.execute_sql(
+        "SELECT id FROM question WHERE display_order = %s", (display_order,)
+    ).fetchone()
+    if row is None:
+        raise database.Question.DoesNotExist(f"No question #{display_order}.")
+    return row[0]
+
+
+def question_counts(question_id: int, for_update: bool = False) -> tuple[int, int]:
+    row = database.db.execute_sql(
+        "SELECT upvotes, downvotes FROM question WHERE id = %s" + (" FOR UPDATE" if for_update else ""),
+        (question_id,),
+    ).fetchone()
+    if row is None:
+        raise database.Question.DoesNotExist(f"No question with id {question_id}.")
+    return int(row[0]), int(row[1])
+
 
-    def _decrement_question_vote(self, question, vote_type: str):
-        if vote_type == "up":
-            question.upvotes = max(0, question.upvotes - 1)
+def record_vote(question_id: int, user_id: int, vote_type: str) -> tuple[int, int]:
+    """
+    Toggle a member's vote and return the question's (upvotes, downvotes).
+
+    Every toggle ends up updating the question's counters, so the question row
+    is locked first: votes on one question queue behind it instead of taking
+    vote-row and gap locks in different orders and deadlocking. Counters only
+    change through `col = col ± 1` in the same transaction as the vote row.
+    """
+    db = database.db
+    with db.atomic():
+        question_counts(question_id, for_update=True)  # raises if the question was deleted
+
+        row = db.execute_sql(
+            "SELECT vote_type FROM questionvote WHERE question_id = %s AND user_id = %s",
+            (question_id, user_id),
+        ).fetchone()
+        if row is None:
+            db.execute_sql(
+                "INSERT INTO questionvote (question_id, user_id, vote_type) VALUES (%s, %s, %s)",
+                (question_id, user_id, vote_type),
+            )
+            db.execute_sql(
+                f"UPDATE question SET {_COUNTER[vote_type]} = {_COUNTER[vote_type]} + 1 WHERE id = %s",
+                (question_id,),
+            )
+        elif row[0] == vote_type:
+            old = _COUNTER[row[0]]
+            db.execute_sql(
+                "DELETE FROM questionvote WHERE question_id = %s AND user_id = %s",
+                (question_id, user_id),
+            )
+            db.execute_sql(
+                f"UPDATE question SET {old} = GREATEST({old} - 1, 0) WHERE id = %s",
+                (question_id,),
+            )
         else:
-            question.downvotes = max(0, question.downvotes - 1)
+            old, new = _COUNTER[row[0]], _COUNTER[vote_type]
+            db.execute_sql(
+                "UPDATE questionvote SET vote_type = %s WHERE question_id = %s AND user_id = %s",
+                (vote_type, question_id, user_id),
+            )
+            db.execute_sql(
+                f"UPDATE question SET {old} = GREATEST({old} - 1, 0), {new} = {new} + 1 WHERE id = %s",
+                (question_id,),
+            )
+
+        return question_counts(question_id)
+
 
-    async def _send_vote_error(self, interaction: discord.Interaction):
-        message = "I couldn't record that vote. Please try again in a moment."
+class _PendingLabels:
+    __slots__ = ("interaction", "question_id", "counts", "task")
+
+    def __init__(self):
+        self.interaction = None
+        self.question_id = None
+        self.counts = (0, 0)
+        self.task: asyncio.Task | None = None
+
+
+class VoteLabelRefresher:
+    """
+    Coalesces button relabels per posted message. Each click only records the
+    newest counts; one edit goes out per DQ_VOTE_LABEL_WINDOW, using the latest
+    interaction's webhook token so the edit doesn't spend the channel's budget.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, _PendingLabels] = {}
+
+    def schedule(self, interaction: discord.Interaction, question_id: int, counts: tuple[int, int]):
+        message_id = interaction.message.id
+        pending = self._pending.get(message_id)
+        if pending is None:
+            pending = self._pending[message_id] = _PendingLabels()
+        pending.interaction = interaction
+        pending.question_id = question_id
+        pending.counts = counts
+        if pending.task is None or pending.task.done():
+            pending.task = asyncio.create_task(self._refresh(message_id, pending))
+
+    async def _refresh(self, message_id: int, pending: _PendingLabels):
+        await asyncio.sleep(DQ_VOTE_LABEL_WINDOW)
+        # Anything scheduled after this point starts a new window.
+        self._pending.pop(message_id, None)
+        view = question_vote_view(
+            pending.question_id,
+            pending.counts,
+            include_suggest=_has_suggest_button(pending.interaction.message),
+        )
         try:
-            if interaction.response.is_done():
-                await interaction.followup.send(message, ephemeral=True)
-            else:
-                await interaction.response.send_message(message, ephemeral=True)
-        except discord.HTTPException:
-            pass
+            await pending.interaction.edit_original_response(view=view)
+        except discord.HTTPException as e:
+            _log.warning(f"Failed to refresh vote labels on message {message_id}: {e}")
 
-    async def handle_suggest_question(self, interaction: discord.Interaction):
-        await interaction.response.send_modal(SuggestModalNEW(self.bot))
 
-    def _update_labels(self, question):
-        self.upvote_button.label = f"👍 {question.upvotes}"
-        self.downvote_button.label = f"👎 {question.downvotes}"
+vote_labels = VoteLabelRefresher()
 
 
 class DisabledQuestionSuggestionManager(discord.ui.View):
@@ -267,6 +420,21 @@ class DisabledQuestionSuggestionManager(discord.ui.View):
         pass
 
 
+def _discard_suggestion(message_id: int):
+    suggestion = database.QuestionSuggestionQueue.get(
+        database.QuestionSuggestionQueue.message_id == message_id
+    )
+    suggestion.delete_instance()
+    return suggestion
+
+
+def _accept_suggestion(message_id: int):
+    """Move a queued suggestion into the question deck."""
+    with database.db.atomic():
+        suggestion = _discard_suggestion(message_id)
+        return suggestion, add_question(suggestion.question)
+
+
 class QuestionSuggestionManager(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -281,11 +449,8 @@ class QuestionSuggestionManager(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         try:
-            q = database.QuestionSuggestionQueue.get(
-                database.QuestionSuggestionQueue.message_id == interaction.message.id
-            )
-            new_q = database.Question.create(question=q.question, usage="False")
-            q.delete_instance()
+            q, new_q = await run_db(_accept_suggestion, interaction.message.id)
+            question_index.remove(SUGGESTION, q.id)
 
             embed = discord.Embed(
                 title="Question Suggestion",
@@ -313,10 +478,8 @@ class QuestionSuggestionManager(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         try:
-            q = database.QuestionSuggestionQueue.get(
-                database.QuestionSuggestionQueue.message_id == interaction.message.id
-            )
-            q.delete_instance()
+            q = await run_db(_discard_suggestion, interaction.message.id)
+            question_index.remove(SUGGESTION, q.id)
 
             embed = discord.Embed(
                 title="Question Suggestion",
@@ -354,39 +517,38 @@ class SuggestModalNEW(discord.ui.Modal, title="Suggest a Question"):
             )
             embed.add_field(name="Question", value=self.short_description.value)
 
+            duplicates = await find_duplicates(self.short_description.value)
+            if duplicates:
+                embed.add_field(
+                    name="⚠️ Possible Duplicates",
+                    value="\n".join(f"• {match.describe()}" for match in duplicates)[:1024],
+                    inline=False,
+                )
+
             log_channel = await self.bot.fetch_channel(777987716008509490)
             msg = await log_channel.send(embed=embed, view=QuestionSuggestionManager())
 
-            database.QuestionSuggestionQueue.create(
+            suggestion = await run_db(
+                database.QuestionSuggestionQueue.create,
                 question=self.short_description.value,
                 discord_id=interaction.user.id,
                 message_id=msg.id,
             )
-
-            await interaction.followup.send(
-                "Thank you for your suggestion!", ephemeral=True
-            )
+            question_index.upsert(SUGGESTION, suggestion.id, suggestion.question)
+
+            message = "Thank you for your suggestion!"
+            if duplicates:
+                best = duplicates[0]
+                message += (
+                    f"\nHeads up: it looks {best.score:.0%} similar to an existing "
+                    f"{'question' if best.kind == QUESTION else 'suggestion'}:\n> {best.text[:200]}"
+                )
+            await interaction.followup.send(message, ephemeral=True)
         except Exception as e:
             _log.exception("Error in SuggestModalNEW: %s", e)
             await interaction.followup.send("An error occurred.", ephemeral=True)
 
 
-class SuggestQuestionFromDQ(discord.ui.View):
-    def __init__(self, bot):
-        super().__init__(timeout=None)
-        self.bot = bot
-
-    @discord.ui.button(
-        label="Suggest a Question!",
-        style=discord.ButtonStyle.blurple,
-        emoji="📝",
-        custom_id="persistent_view:qsm_sug_question",
-    )
-    async def suggest_question(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        await interaction.response.send_modal(SuggestModalNEW(self.bot))
-
 # ──────────────── DAILY QUESTION EMBED ──────────────── #
 
 def create_question_embed(question) -> discord.Embed:
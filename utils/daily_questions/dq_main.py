@@ -16,8 +16,9 @@ async def setup(bot: commands.Bot):
     # Load task that posts questions
     await __dq_tasks.setup(bot)
 
-    # Register persistent views
+    # Register persistent views and the stateless vote/suggest buttons
     bot.add_view(__dq_views.QuestionSuggestionManager())
-    bot.add_view(__dq_views.QuestionVoteView(bot))
+    bot.add_view(__dq_views.LegacyQuestionVoteView())
+    bot.add_dynamic_items(__dq_views.QuestionVoteButton, __dq_views.SuggestQuestionButton)
 
     _log.info("✅ Daily Question system initialized (commands, tasks, views).")
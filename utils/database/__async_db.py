@@ -0,0 +1,60 @@
+# utils/database/__async_db.py
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, TypeVar
+
+from utils.database import __database as database
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+T = TypeVar("T")
+
+# Peewee keeps connection state per thread; each call checks a connection out
+# of the shared pool, so queries never run on the gateway event loop.
+DB_WORKERS = max(1, int(os.getenv("database_workers", "4")))
+
+_executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix="pb-db")
+
+
+def _call_on_worker(func: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    # Check a connection out of the pool for this call only and hand it back
+    # afterwards, so idle workers do not pin connections.
+    with database.connection():
+        return func(*args, **kwargs)
+
+
+async def run_db(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking Peewee call on the database worker pool and await the result.
+
+    Usage:
+        row = await run_db(database.BotData.get_or_none, database.BotData.server_id == gid)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(_call_on_worker, func, args, kwargs)
+    )
+
+
+def db_call(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Decorator turning a synchronous data-access helper into a coroutine function
+    that executes on the database worker pool.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_db(func, *args, **kwargs)
+
+    wrapper.sync = func
+    return wrapper
+
+
+def shutdown_db_workers(wait: bool = True) -> None:
+    """Stop accepting new database work and optionally wait for in-flight calls."""
+    _log.info("Shutting down database worker pool.")
+    _executor.shutdown(wait=wait)
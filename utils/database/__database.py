@@ -1,19 +1,24 @@
 import os
 import json
 import datetime
+import threading
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from peewee import (
     AutoField,
+    BigIntegerField,
+    CharField,
+    CompositeKey,
     Model,
     IntegerField,
     TextField,
     BooleanField,
     DateTimeField,
-    MySQLDatabase,
-    OperationalError,
     ForeignKeyField,
     DateField,
+    DoubleField,
 )
+from playhouse.pool import PooledMySQLDatabase
 from playhouse.shortcuts import ReconnectMixin
 from utils.helpers.__logging_module import get_log
 
@@ -36,18 +41,48 @@ except Exception as e:
     raise SystemExit(e)
 
 
-class ReconnectMySQLDatabase(ReconnectMixin, MySQLDatabase):
-    def _initialize_connection(self, conn):
-        super()._initialize_connection(conn)
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SET NAMES utf8mb4 COLLATE utf8mb4_unicode_ci")
-        finally:
-            cursor.close()
+DB_POOL_SIZE = int(os.getenv("database_pool_size", "8"))
+DB_POOL_STALE_TIMEOUT = int(os.getenv("database_pool_stale_timeout", "300"))
+DB_POOL_WAIT_TIMEOUT = int(os.getenv("database_pool_wait_timeout", "10"))
+
+
+class ReconnectPooledMySQLDatabase(ReconnectMixin, PooledMySQLDatabase):
+    """
+    Connection pool with automatic reconnects.
+
+    connect()/close() check a connection out of / back into the pool, so one
+    handler closing no longer drops the connection another handler is using.
+    Idle connections older than the stale timeout are recycled, and dead ones
+    are discarded on checkout (PooledMySQLDatabase pings before reuse).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool_lock = threading.Lock()
+        self._checkouts = 0
+        self._peak_in_use = 0
+
+    def _connect(self, *args, **kwargs):
+        conn = super()._connect(*args, **kwargs)
+        with self._pool_lock:
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, len(self._in_use))
+        return conn
+
+    def pool_stats(self) -> dict:
+        with self._pool_lock:
+            return {
+                "max_connections": self._max_connections,
+                "in_use": len(self._in_use),
+                "idle": len(self._connections),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "stale_timeout": self._stale_timeout,
+            }
 
 
 try:
-    db = ReconnectMySQLDatabase(
+    db = ReconnectPooledMySQLDatabase(
         DB_Database,
         user=DB_user,
         password=DB_password,
@@ -55,19 +90,39 @@ try:
         port=DB_Port,
         charset="utf8mb4",
         use_unicode=True,
+        # Runs once per physical connection instead of on every checkout.
+        init_command="SET NAMES utf8mb4 COLLATE utf8mb4_unicode_ci",
+        max_connections=DB_POOL_SIZE,
+        stale_timeout=DB_POOL_STALE_TIMEOUT,
+        timeout=DB_POOL_WAIT_TIMEOUT,
     )
 except Exception as e:
     _log.error(f"Error connecting to the database: {e}")
     raise SystemExit(e)
 
 
-def ensure_database_connection():
+@contextmanager
+def connection():
+    """
+    Check a pooled connection out for the current thread/task.
+
+    Re-entrant: if this thread already holds a connection it is reused and left
+    open, so nested helpers never close a connection out from under a caller.
+    Do not hold it across an ``await`` — use run_db for async code instead.
+    """
+    opened = False
+    if db.is_closed():
+        db.connect()
+        opened = True
     try:
-        if db.is_closed():
-            db.connect(reuse_if_open=True)
-    except OperationalError as e:
-        _log.error(f"Error connecting to the database: {e}")
-        raise
+        yield db
+    finally:
+        if opened and not db.is_closed():
+            db.close()
+
+
+def pool_stats() -> dict:
+    return db.pool_stats()
 
 
 class BaseModel(Model):
@@ -89,7 +144,7 @@ class BotData(BaseModel):
     other_info_1_text = TextField(default="")
     other_info_2_title = TextField(default="More Information")
     other_info_2_text = TextField(default="")
-    server_id = TextField(default="0")
+    server_id = BigIntegerField(default=0, index=True)
     bot_id = TextField(default="0")
     bot_type = TextField(default="Stable")
     pb_test_server_id = TextField(default="448488274562908170")
@@ -135,11 +190,26 @@ class Tag(BaseModel):
 
 class Question(BaseModel):
     id = AutoField()
-    display_order = TextField()
+    display_order = IntegerField(null=True, index=True)
     question = TextField()
     usage = BooleanField(default=False)
     upvotes = IntegerField(default=0)
     downvotes = IntegerField(default=0)
+    # Position in the shuffled deck; questions are served in ascending order.
+    deck_key = DoubleField(null=True, index=True)
+
+
+class QuestionDeckState(BaseModel):
+    """Single-row cursor into the shuffled question deck."""
+
+    id = IntegerField(primary_key=True)
+    last_key = DoubleField(default=0)  # deck_key of the last question served
+    weighted = BooleanField(default=False)
+    cycle = IntegerField(default=0)
+    shuffled_at = DateTimeField(null=True)
+
+    class Meta:
+        table_name = "question_deck_state"
 
 
 class Daily_Question_Log(BaseModel):
@@ -151,9 +221,12 @@ class Daily_Question_Log(BaseModel):
 
 class QuestionVote(BaseModel):
     question = ForeignKeyField(Question, backref="votes", on_delete="CASCADE")
-    user_id = TextField()
+    user_id = BigIntegerField()
     vote_type = TextField()  # "up" or "down"
 
+    class Meta:
+        indexes = ((("question", "user_id"), True),)  # one vote per member per question
+
 
 class QuestionSuggestionQueue(BaseModel):
     id = AutoField()
@@ -180,7 +253,7 @@ class MRP_Blacklist_Data(BaseModel):
 class PortalbotProfile(BaseModel):
     entryid = AutoField()
     DiscordName = TextField()
-    DiscordLongID = TextField()
+    DiscordLongID = BigIntegerField(index=True)
     Timezone = TextField(default="None")
     XBOX = TextField(default="None")
     Playstation = TextField(default="None")
@@ -262,7 +335,7 @@ class RealmCheckIn(BaseModel):
 
 class Administrators(BaseModel):
     id = AutoField()
-    discordID = TextField(unique=True)
+    discordID = BigIntegerField(unique=True)
     discord_name = TextField()
     TierLevel = IntegerField(default=1)
 
@@ -270,22 +343,46 @@ class Administrators(BaseModel):
 class ServerScores(BaseModel):
     ScoreID = AutoField()
     DiscordName = TextField()
-    DiscordLongID = TextField()
-    ServerID = TextField()
+    DiscordLongID = BigIntegerField()
+    ServerID = BigIntegerField()
     Score = IntegerField()
     Level = IntegerField(default=0)
     Progress = IntegerField(default=0)
     LastMessageTimestamp = DateTimeField(default=0)
     TatsuXP = IntegerField(default=0)
 
+    class Meta:
+        indexes = (
+            (("ServerID", "DiscordLongID"), True),  # one row per member per guild
+            (("ServerID", "Score"), False),  # leaderboard / rank ordering
+        )
+
+
+class XPDaily(BaseModel):
+    """Per-member XP earned per UTC day; rolling leaderboards sum these buckets."""
+
+    ServerID = BigIntegerField()
+    Day = DateField()
+    DiscordLongID = BigIntegerField()
+    XP = IntegerField(default=0)
+
+    class Meta:
+        table_name = "xp_daily"
+        # Clustered on (guild, day): a window is one contiguous range scan.
+        primary_key = CompositeKey("ServerID", "Day", "DiscordLongID")
+        indexes = ((("Day",), False),)  # retention pruning
+
 
 class LeveledRoles(BaseModel):
     id = AutoField()
     RoleName = TextField()
-    RoleID = TextField()
-    ServerID = TextField()
+    RoleID = BigIntegerField()
+    ServerID = BigIntegerField()
     LevelThreshold = IntegerField()
 
+    class Meta:
+        indexes = ((("ServerID", "LevelThreshold"), False),)
+
 
 class Reminder(BaseModel):
     id = AutoField()
@@ -368,90 +465,95 @@ class BuildVote(BaseModel):
         indexes = ((("season", "voter_id"), True),)  # one vote per user per season
 
 
-# --------------------------------------------------------------------
-# Table creation on startup
-# --------------------------------------------------------------------
+class TatsuImportState(BaseModel):
+    """Checkpoint for a guild's Tatsu XP import so an interrupted run can resume."""
 
+    guild_id = BigIntegerField(primary_key=True)
+    mode = TextField()  # "rankings" (paged guild rankings) or "members" (per-member fallback)
+    cursor = BigIntegerField(default=0)  # rankings offset, or the last member ID done
+    processed = IntegerField(default=0)
+    updated = IntegerField(default=0)
+    failed_ids = TextField(null=True)  # JSON list of member IDs whose lookup failed; retried on resume
+    started_at = DateTimeField(default=datetime.datetime.utcnow)
+    updated_at = DateTimeField(default=datetime.datetime.utcnow)
+    completed_at = DateTimeField(null=True)
 
-def create_all_tables():
-    """
-    Create any missing tables in a single batch to satisfy FK constraints.
-    Call this during bot startup.
-    """
-    ensure_database_connection()
-    models_in_order = [
-        # core
-        Tag,
-        Question,
-        QuestionVote,
-        QuestionSuggestionQueue,
-        MRP_Blacklist_Data,
-        PortalbotProfile,
-        RealmApplications,
-        RealmProfile,
-        RealmCheckIn,
-        Administrators,
-        ServerScores,
-        LeveledRoles,
-        Reminder,
-        Rule,
-        BotData,
-        # build comp (parents before children)
-        BuildConfig,
-        BuildSeason,
-        BuildEntry,
-        BuildVote,
-    ]
-    to_create = [m for m in models_in_order if not m.table_exists()]
-    if to_create:
-        db.create_tables(to_create)
-        _log.info(
-            "Created tables: %s", ", ".join(m._meta.table_name for m in to_create)
-        )
-    ensure_schema_columns()
+    class Meta:
+        table_name = "tatsu_import_state"
 
 
-def ensure_schema_columns():
-    """
-    Add columns introduced after a table already exists.
+class ScheduledJobRun(BaseModel):
+    """Last-run marker per scheduler job; claiming a fire time here prevents double runs."""
 
-    Peewee's create_tables() is intentionally non-destructive and will not alter
-    existing MySQL tables, so lightweight ALTER statements keep older
-    deployments compatible when new model fields are added.
-    """
-    realm_profile_columns = {column.name for column in db.get_columns("realmprofile")}
-    if "last_checkin_at" not in realm_profile_columns:
-        db.execute_sql("ALTER TABLE realmprofile ADD COLUMN last_checkin_at DATETIME NULL")
-        _log.info("Added missing realmprofile.last_checkin_at column.")
-
-    if "checkin" not in realm_profile_columns:
-        db.execute_sql(
-            "ALTER TABLE realmprofile ADD COLUMN checkin BOOL NOT NULL DEFAULT 0"
-        )
-        _log.info("Added missing realmprofile.checkin column.")
+    name = CharField(max_length=64, primary_key=True)
+    last_fire = DateTimeField(null=True)  # scheduled slot (UTC) most recently claimed
+    last_started = DateTimeField(null=True)
+    last_finished = DateTimeField(null=True)
+    last_status = CharField(max_length=16, null=True)  # running, ok, failed
+    last_error = TextField(null=True)
+    last_duration_ms = IntegerField(null=True)
 
-    bot_data_columns = {column.name for column in db.get_columns("botdata")}
-    if "monthly_checkin_channel" not in bot_data_columns:
-        db.execute_sql(
-            "ALTER TABLE botdata ADD COLUMN monthly_checkin_channel TEXT "
-            "DEFAULT '587673548160630804'"
-        )
-        _log.info("Added missing botdata.monthly_checkin_channel column.")
+    class Meta:
+        table_name = "scheduled_job_run"
 
-    if "last_realm_checkin_posted_month" not in bot_data_columns:
-        db.execute_sql(
-            "ALTER TABLE botdata ADD COLUMN last_realm_checkin_posted_month TEXT NULL"
-        )
-        _log.info("Added missing botdata.last_realm_checkin_posted_month column.")
+
+class SchemaVersion(BaseModel):
+    version = IntegerField(primary_key=True)
+    description = TextField()
+    applied_at = DateTimeField(default=datetime.datetime.utcnow)
+
+    class Meta:
+        table_name = "schema_version"
+
+
+# --------------------------------------------------------------------
+# Schema management on startup
+# --------------------------------------------------------------------
+
+# Parents before children so FK constraints resolve when tables are created.
+MODELS = [
+    # core
+    Tag,
+    Question,
+    QuestionDeckState,
+    Daily_Question_Log,
+    QuestionVote,
+    QuestionSuggestionQueue,
+    MRP_Blacklist_Data,
+    PortalbotProfile,
+    RealmApplications,
+    RealmProfile,
+    RealmCheckIn,
+    Administrators,
+    ServerScores,
+    LeveledRoles,
+    Reminder,
+    Rule,
+    BotData,
+    # build comp (parents before children)
+    BuildConfig,
+    BuildSeason,
+    BuildEntry,
+    BuildVote,
+    # level system
+    TatsuImportState,
+    XPDaily,
+    # scheduler
+    ScheduledJobRun,
+]
 
 
 def init_database():
     """
     Public entrypoint for app startup.
-    Ensures the DB is connected and tables are present.
+    Brings the schema up to date via the versioned migrations in
+    utils/database/migrations. Costs a single query when nothing is pending.
     """
-    create_all_tables()
-    _log.info("Database initialized and tables verified.")
+    from utils.database.__migrations import run_migrations
+
+    with connection():
+        version = run_migrations(db)
+    _log.info(f"Database initialized at schema version {version}.")
 
 
 # Back-compat alias some code uses elsewhere
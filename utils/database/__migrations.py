@@ -0,0 +1,223 @@
+# utils/database/__migrations.py
+
+import importlib
+import pkgutil
+import re
+from types import ModuleType
+
+from peewee import ProgrammingError
+
+from utils.database import __database as database
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+MIGRATIONS_PACKAGE = "utils.database.migrations"
+# Migration modules are dunder-named (e.g. __0001_baseline.py) so the extension
+# auto-loader in main.py skips them.
+_MIGRATION_NAME = re.compile(r"^__(\d{4})_\w+$")
+_LOCK_NAME = "portalbot_schema_migrations"
+_LOCK_TIMEOUT = 60
+
+_SNAPSHOT_SQL = """
+    SELECT 'column', TABLE_NAME, COLUMN_NAME, DATA_TYPE, NULL
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+    UNION ALL
+    SELECT 'index', TABLE_NAME, INDEX_NAME, COLUMN_NAME, SEQ_IN_INDEX
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+"""
+
+
+class SchemaSnapshot:
+    """
+    In-memory view of the live schema, loaded with one information_schema query.
+
+    Migrations use it to make every step idempotent: DDL is only issued when the
+    snapshot says the table/column/index is missing or has the wrong type.
+    MySQL commits DDL implicitly, so a half-applied migration must be safe to
+    run again.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.columns: dict[str, dict[str, str]] = {}
+        self.indexes: dict[str, dict[str, list[str]]] = {}
+        self._stale = True
+
+    def refresh(self):
+        columns: dict[str, dict[str, str]] = {}
+        index_parts: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        for kind, table, name, detail, seq in self.db.execute_sql(_SNAPSHOT_SQL):
+            table = table.lower()
+            if kind == "column":
+                columns.setdefault(table, {})[name] = detail.lower()
+            else:
+                index_parts.setdefault(table, {}).setdefault(name, []).append(
+                    (int(seq), detail)
+                )
+        self.columns = columns
+        self.indexes = {
+            table: {name: [col for _, col in sorted(parts)] for name, parts in idx.items()}
+            for table, idx in index_parts.items()
+        }
+        self._stale = False
+
+    def _fresh(self):
+        if self._stale:
+            self.refresh()
+
+    # ---------- queries ----------
+
+    def has_table(self, table: str) -> bool:
+        self._fresh()
+        return table.lower() in self.columns
+
+    def has_column(self, table: str, column: str) -> bool:
+        self._fresh()
+        return column in self.columns.get(table.lower(), {})
+
+    def column_type(self, table: str, column: str) -> str | None:
+        self._fresh()
+        return self.columns.get(table.lower(), {}).get(column)
+
+    def has_index(self, table: str, name: str) -> bool:
+        self._fresh()
+        return name in self.indexes.get(table.lower(), {})
+
+    def find_index(self, table: str, columns: list[str]) -> str | None:
+        """Name of an existing index covering exactly these columns, in order."""
+        self._fresh()
+        for name, cols in self.indexes.get(table.lower(), {}).items():
+            if cols == list(columns):
+                return name
+        return None
+
+    # ---------- idempotent DDL ----------
+
+    def create_tables(self, models):
+        missing = [m for m in models if not self.has_table(m._meta.table_name)]
+        if not missing:
+            return
+        self.db.create_tables(missing, safe=True)
+        _log.info(
+            f"🧱 Created tables: {', '.join(m._meta.table_name for m in missing)}"
+        )
+        self._stale = True
+
+    def add_column(self, table: str, column: str, ddl: str):
+        if self.has_column(table, column):
+            return
+        self.db.execute_sql(f"ALTER TABLE `{table}` ADD COLUMN `{column}` {ddl}")
+        _log.info(f"➕ Added column {table}.{column}.")
+        self._stale = True
+
+    def modify_columns(self, table: str, columns: dict[str, str]):
+        """
+        Change column definitions in one ALTER (one table rebuild), skipping
+        columns whose current DATA_TYPE already matches the first word of the DDL.
+        """
+        pending = {
+            col: ddl
+            for col, ddl in columns.items()
+            if self.column_type(table, col) != ddl.split()[0].lower()
+        }
+        if not pending:
+            return
+        clauses = ", ".join(f"MODIFY `{col}` {ddl}" for col, ddl in pending.items())
+        self.db.execute_sql(f"ALTER TABLE `{table}` {clauses}")
+        _log.info(f"🔧 Modified {table} columns: {', '.join(pending)}.")
+        self._stale = True
+
+    def add_index(self, table: str, name: str, columns: list[str], unique: bool = False):
+        if self.has_index(table, name):
+            return
+        cols = ", ".join(f"`{c}`" for c in columns)
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        self.db.execute_sql(f"CREATE {kind} `{name}` ON `{table}` ({cols})")
+        _log.info(f"📇 Created {kind.lower()} {name} on {table}({', '.join(columns)}).")
+        self._stale = True
+
+    def drop_index(self, table: str, name: str):
+        if not self.has_index(table, name):
+            return
+        self.db.execute_sql(f"DROP INDEX `{name}` ON `{table}`")
+        _log.info(f"🗑️ Dropped index {name} on {table}.")
+        self._stale = True
+
+
+def discover_migrations() -> list[tuple[int, ModuleType]]:
+    """Import every migration module, ordered by its numeric prefix."""
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+    found = []
+    for info in pkgutil.iter_modules(package.__path__):
+        match = _MIGRATION_NAME.match(info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{MIGRATIONS_PACKAGE}.{info.name}")
+        version = int(match.group(1))
+        if getattr(module, "VERSION", version) != version:
+            raise RuntimeError(
+                f"Migration {info.name} declares VERSION={module.VERSION}, expected {version}"
+            )
+        found.append((version, module))
+
+    found.sort(key=lambda item: item[0])
+    versions = [v for v, _ in found]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions: {versions}")
+    return found
+
+
+def current_version(db) -> int:
+    """Highest applied migration, or 0 on a database that predates schema_version."""
+    try:
+        row = db.execute_sql("SELECT MAX(version) FROM schema_version").fetchone()
+    except ProgrammingError:
+        return 0
+    return int(row[0] or 0)
+
+
+def run_migrations(db=None) -> int:
+    """
+    Apply pending migrations in order and return the resulting schema version.
+
+    When the schema is current this is a single SELECT. Otherwise a MySQL
+    advisory lock serialises concurrent instances, the schema is snapshotted
+    once and each pending migration runs and is recorded in schema_version.
+    """
+    db = db or database.db
+    migrations = discover_migrations()
+    latest = migrations[-1][0] if migrations else 0
+
+    version = current_version(db)
+    if version >= latest:
+        return version
+
+    acquired = db.execute_sql("SELECT GET_LOCK(%s, %s)", (_LOCK_NAME, _LOCK_TIMEOUT)).fetchone()[0]
+    if acquired != 1:
+        raise RuntimeError("Timed out waiting for the schema migration lock.")
+    try:
+        database.SchemaVersion.create_table(safe=True)
+        # Another instance may have migrated while we waited for the lock.
+        version = current_version(db)
+        schema = SchemaSnapshot(db)
+
+        for number, module in migrations:
+            if number <= version:
+                continue
+            description = getattr(module, "DESCRIPTION", module.__name__)
+            _log.info(f"🛠️ Applying migration {number:04d}: {description}")
+            try:
+                module.migrate(db, schema)
+            except Exception:
+                _log.exception(f"❌ Migration {number:04d} failed; schema left at {version}.")
+                raise
+            database.SchemaVersion.create(version=number, description=description)
+            version = number
+            _log.info(f"✅ Migration {number:04d} applied.")
+    finally:
+        db.execute_sql("SELECT RELEASE_LOCK(%s)", (_LOCK_NAME,))
+
+    return version
@@ -0,0 +1,22 @@
+# utils/database/migrations/__0001_baseline.py
+
+from utils.database import __database as database
+
+VERSION = 1
+DESCRIPTION = "Baseline: create missing tables and legacy check-in columns"
+
+
+def migrate(db, schema):
+    # Fresh installs get every table; existing deployments only the missing ones
+    # (daily_question_log was never in the old create_all_tables list).
+    schema.create_tables(database.MODELS)
+
+    # Columns previously patched in by ensure_schema_columns().
+    schema.add_column("realmprofile", "last_checkin_at", "DATETIME NULL")
+    schema.add_column("realmprofile", "checkin", "BOOL NOT NULL DEFAULT 0")
+    schema.add_column(
+        "botdata",
+        "monthly_checkin_channel",
+        "TEXT DEFAULT '587673548160630804'",
+    )
+    schema.add_column("botdata", "last_realm_checkin_posted_month", "TEXT NULL")
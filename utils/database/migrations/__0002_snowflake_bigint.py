@@ -0,0 +1,84 @@
+# utils/database/migrations/__0002_snowflake_bigint.py
+
+VERSION = 2
+DESCRIPTION = "Store Discord snowflakes as BIGINT and index hot lookups"
+
+_NUMERIC = "'^[0-9]+$'"
+
+# table -> columns converted from TEXT to BIGINT
+_SNOWFLAKE_COLUMNS = {
+    "serverscores": ["ServerID", "DiscordLongID"],
+    "botdata": ["server_id"],
+    "administrators": ["discordID"],
+    "leveledroles": ["ServerID", "RoleID"],
+    "questionvote": ["user_id"],
+    "portalbotprofile": ["DiscordLongID"],
+}
+
+
+def _drop_text_indexes(schema, table: str, columns: list[str]):
+    # Any prefix index left on a TEXT column blocks MODIFY ... BIGINT.
+    for name, cols in list(schema.indexes.get(table, {}).items()):
+        if name != "PRIMARY" and set(cols) & set(columns):
+            schema.drop_index(table, name)
+
+
+def migrate(db, schema):
+    for table, columns in _SNOWFLAKE_COLUMNS.items():
+        if all(schema.column_type(table, c) == "bigint" for c in columns):
+            continue
+
+        # Rows whose IDs can never match a Discord snowflake would make the
+        # ALTER fail under strict mode. BotData rows are repaired instead of
+        # dropped; bootstrap rewrites server_id for every guild we are in.
+        if table == "botdata":
+            db.execute_sql(
+                f"UPDATE botdata SET server_id = '0' WHERE server_id NOT REGEXP {_NUMERIC}"
+            )
+        else:
+            bad = " OR ".join(f"`{c}` NOT REGEXP {_NUMERIC}" for c in columns)
+            db.execute_sql(f"DELETE FROM `{table}` WHERE {bad}")
+
+        schema.refresh()
+        _drop_text_indexes(schema, table, columns)
+        schema.modify_columns(
+            table,
+            {
+                c: "BIGINT NOT NULL DEFAULT 0" if table == "botdata" else "BIGINT NOT NULL"
+                for c in columns
+            },
+        )
+
+    # One score row per member per guild: keep the highest score, then the oldest row.
+    if not schema.has_index("serverscores", "serverscores_ServerID_DiscordLongID"):
+        db.execute_sql(
+            """
+            DELETE s1 FROM serverscores s1
+            JOIN serverscores s2
+              ON s1.ServerID = s2.ServerID
+             AND s1.DiscordLongID = s2.DiscordLongID
+             AND (s1.Score < s2.Score OR (s1.Score = s2.Score AND s1.ScoreID > s2.ScoreID))
+            """
+        )
+    if not schema.has_index("administrators", "administrators_discordID"):
+        db.execute_sql(
+            """
+            DELETE a1 FROM administrators a1
+            JOIN administrators a2
+              ON a1.discordID = a2.discordID
+             AND (a1.TierLevel < a2.TierLevel OR (a1.TierLevel = a2.TierLevel AND a1.id > a2.id))
+            """
+        )
+
+    # Names match what Peewee generates from the model Meta, so fresh installs
+    # (created by 0001) and migrated deployments end up identical.
+    schema.add_index(
+        "serverscores", "serverscores_ServerID_DiscordLongID", ["ServerID", "DiscordLongID"], unique=True
+    )
+    schema.add_index("serverscores", "serverscores_ServerID_Score", ["ServerID", "Score"])
+    schema.add_index("botdata", "botdata_server_id", ["server_id"])
+    schema.add_index("administrators", "administrators_discordID", ["discordID"], unique=True)
+    schema.add_index(
+        "leveledroles", "leveledroles_ServerID_LevelThreshold", ["ServerID", "LevelThreshold"]
+    )
+    schema.add_index("portalbotprofile", "portalbotprofile_DiscordLongID", ["DiscordLongID"])
@@ -0,0 +1,10 @@
+# utils/database/migrations/__0003_tatsu_import_state.py
+
+from utils.database import __database as database
+
+VERSION = 3
+DESCRIPTION = "Checkpoint table for resumable Tatsu XP imports"
+
+
+def migrate(db, schema):
+    schema.create_tables([database.TatsuImportState])
@@ -0,0 +1,10 @@
+# utils/database/migrations/__0004_xp_daily.py
+
+from utils.database import __database as database
+
+VERSION = 4
+DESCRIPTION = "Daily XP buckets for weekly/monthly leaderboards"
+
+
+def migrate(db, schema):
+    schema.create_tables([database.XPDaily])
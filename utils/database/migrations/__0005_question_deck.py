@@ -0,0 +1,22 @@
+# utils/database/migrations/__0005_question_deck.py
+
+from utils.database import __database as database
+
+VERSION = 5
+DESCRIPTION = "Persisted shuffled deck for the daily question"
+
+
+def migrate(db, schema):
+    schema.add_column("question", "deck_key", "DOUBLE NULL")
+    schema.add_index("question", "question_deck_key", ["deck_key"])
+    schema.create_tables([database.QuestionDeckState])
+
+    # Seed the first deck so the current cycle carries on without repeats:
+    # questions not yet used this cycle come first, used ones after them.
+    db.execute_sql(
+        "UPDATE question SET deck_key = -LN(1 - RAND()) + IF(`usage`, 1000, 0) "
+        "WHERE deck_key IS NULL"
+    )
+    db.execute_sql(
+        "INSERT IGNORE INTO question_deck_state (id, last_key, weighted, cycle) VALUES (1, 0, 0, 0)"
+    )
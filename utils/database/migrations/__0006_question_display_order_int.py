@@ -0,0 +1,28 @@
+# utils/database/migrations/__0006_question_display_order_int.py
+
+VERSION = 6
+DESCRIPTION = "Store Question.display_order as an indexed INT"
+
+
+def migrate(db, schema):
+    if schema.column_type("question", "display_order") != "int":
+        # Anything non-numeric is renumbered below; it cannot survive the ALTER.
+        # The baseline column is TEXT NOT NULL, so allow NULL before clearing.
+        db.execute_sql("ALTER TABLE question MODIFY display_order TEXT NULL")
+        db.execute_sql(
+            "UPDATE question SET display_order = NULL WHERE display_order NOT REGEXP '^[0-9]+$'"
+        )
+        schema.modify_columns("question", {"display_order": "INT NULL"})
+
+    schema.add_index("question", "question_display_order", ["display_order"])
+
+    # Close any gaps left by earlier deletes in one statement.
+    db.execute_sql(
+        """
+        UPDATE question q
+        JOIN (SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS rn FROM question) r
+          ON q.id = r.id
+        SET q.display_order = r.rn
+        WHERE q.display_order IS NULL OR q.display_order <> r.rn
+        """
+    )
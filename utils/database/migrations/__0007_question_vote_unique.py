@@ -0,0 +1,36 @@
+# utils/database/migrations/__0007_question_vote_unique.py
+
+VERSION = 7
+DESCRIPTION = "One vote per member per question; counters rebuilt from votes"
+
+
+def migrate(db, schema):
+    if not schema.has_index("questionvote", "questionvote_question_id_user_id"):
+        # Racing clicks could leave several rows for one member; keep the first.
+        db.execute_sql(
+            """
+            DELETE v FROM questionvote v
+            JOIN questionvote keep
+              ON keep.question_id = v.question_id
+             AND keep.user_id = v.user_id
+             AND keep.id < v.id
+            """
+        )
+        schema.add_index(
+            "questionvote", "questionvote_question_id_user_id", ["question_id", "user_id"], unique=True
+        )
+
+    # Lost updates left the denormalised counters drifting; recount them once.
+    db.execute_sql(
+        """
+        UPDATE question q
+        LEFT JOIN (
+            SELECT question_id,
+                   SUM(vote_type = 'up') AS up,
+                   SUM(vote_type = 'down') AS down
+            FROM questionvote
+            GROUP BY question_id
+        ) v ON v.question_id = q.id
+        SET q.upvotes = COALESCE(v.up, 0), q.downvotes = COALESCE(v.down, 0)
+        """
+    )
@@ -0,0 +1,10 @@
+# utils/database/migrations/__0008_scheduled_job_run.py
+
+from utils.database import __database as database
+
+VERSION = 8
+DESCRIPTION = "Last-run markers for the central job scheduler"
+
+
+def migrate(db, schema):
+    schema.create_tables([database.ScheduledJobRun])
@@ -0,0 +1,8 @@
+# utils/database/migrations/__0009_tatsu_failed_ids.py
+
+VERSION = 9
+DESCRIPTION = "Remember failed Tatsu member lookups so a resumed import retries them"
+
+
+def migrate(db, schema):
+    schema.add_column("tatsu_import_state", "failed_ids", "TEXT NULL")
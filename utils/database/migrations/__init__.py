@@ -0,0 +1,12 @@
+# utils/database/migrations/__init__.py
+#
+# Versioned schema migrations, applied in order by utils/database/__migrations.py.
+#
+# Each module is named __NNNN_short_name.py and defines:
+#     VERSION: int          -- must match NNNN
+#     DESCRIPTION: str
+#     def migrate(db, schema) -> None
+#
+# `schema` is a SchemaSnapshot; use its helpers (create_tables, add_column,
+# add_index, ...) so every step is idempotent. Never edit a migration that has
+# shipped — add a new one instead.
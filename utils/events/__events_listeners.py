@@ -1,7 +1,9 @@
 import discord
 from discord.ext import commands
-from utils.database import __database as database
-from utils.admin.bot_management.__bm_logic import get_bot_data_for_server
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
+from utils.events.__events_logic import handle_profile_update
+from utils.helpers.__log_dispatcher import log_dispatcher
 from utils.helpers.__logging_module import get_log
 
 _log = get_log(__name__)
@@ -15,34 +17,20 @@ class MemberJoinListener(commands.Cog):
     async def on_member_join(self, member: discord.Member):
         guild = member.guild
         guild_id = str(guild.id)
-        user_id = str(member.id)
         discordname = f"{member.name}#{member.discriminator}"
 
         log_channel = discord.utils.get(guild.channels, name="member-log")
         _log.info(f"Member joined: {discordname} in guild: {guild.name} ({guild_id})")
 
         try:
-            database.db.connect(reuse_if_open=True)
-
-            profile, created = database.PortalbotProfile.get_or_create(
-                DiscordLongID=user_id, defaults={"DiscordName": discordname}
-            )
-
-            if created:
-                message = (
-                    f"{profile.DiscordName}'s profile has been created successfully."
-                )
-                _log.info(f"Profile created for {discordname}")
-            else:
-                profile.DiscordName = discordname
-                profile.save()
-                message = (
-                    f"{profile.DiscordName}'s profile has been updated successfully."
-                )
-                _log.info(f"Profile updated for {discordname}")
+            # The connection is only checked out while the upsert runs, never
+            # across the channel sends below.
+            message = await run_db(handle_profile_update, member)
 
             if log_channel:
-                await log_channel.send(message)
+                log_dispatcher.post(
+                    log_channel, "📥 Member Joins", message, color=discord.Color.blurple()
+                )
             else:
                 _log.warning(f"Log channel not found in guild: {guild.name}")
 
@@ -51,13 +39,12 @@ class MemberJoinListener(commands.Cog):
                 f"Error processing join event for {discordname}: {e}", exc_info=True
             )
             if log_channel:
-                await log_channel.send(
-                    f"An error occurred while processing {discordname}'s join event."
+                log_dispatcher.post(
+                    log_channel,
+                    "⚠️ Join Errors",
+                    f"An error occurred while processing {discordname}'s join event.",
+                    color=discord.Color.red(),
                 )
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
-                _log.debug("Database connection closed.")
 
         await self.send_welcome_message(member)
 
@@ -65,20 +52,20 @@ class MemberJoinListener(commands.Cog):
         try:
             guild = member.guild
             guild_id = str(guild.id)
-            bot_data = get_bot_data_for_server(guild_id)
+            bot_data = await fetch_bot_data_for_server(guild.id)
 
             if not bot_data:
                 _log.warning(f"No cached bot data found for guild {guild_id}")
                 return
 
-            welcome_channel_id = bot_data.welcome_channel
+            welcome_channel_id = bot_data.channel_id("welcome_channel")
             if not welcome_channel_id:
                 _log.warning(
                     f"No welcome message channel configured for guild {guild_id}"
                 )
                 return
 
-            channel = guild.get_channel(int(welcome_channel_id))
+            channel = guild.get_channel(welcome_channel_id)
             if not channel:
                 _log.warning(
                     f"Channel with ID {welcome_channel_id} not found in guild {guild_id}"
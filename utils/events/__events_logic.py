@@ -9,11 +9,10 @@ _log = get_log(__name__)
 
 def handle_profile_update(member: discord.Member) -> str:
     """Create or update the user's profile when they join."""
-    user_id = str(member.id)
+    user_id = member.id
     discordname = f"{member.name}#{member.discriminator}"
 
-    try:
-        database.db.connect(reuse_if_open=True)
+    with database.connection():
         profile, created = database.PortalbotProfile.get_or_create(
             DiscordLongID=user_id, defaults={"DiscordName": discordname}
         )
@@ -25,10 +24,6 @@ def handle_profile_update(member: discord.Member) -> str:
             profile.save()
             _log.info(f"Profile updated for {discordname}")
             return f"{profile.DiscordName}'s profile has been updated successfully."
-    finally:
-        if not database.db.is_closed():
-            database.db.close()
-            _log.debug("Database connection closed.")
 
 
 def build_welcome_embed(guild: discord.Guild, member: discord.Member) -> discord.Embed:
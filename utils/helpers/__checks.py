@@ -10,6 +10,7 @@ from peewee import OperationalError
 import logging
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 
 _log = logging.getLogger(__name__)
 
@@ -19,6 +20,18 @@ PORTAL_SERVER_ID = 448488274562908170
 REALM_CATEGORY_ID = 587627871216861244
 
 
+def _is_administrator(user_id: int, min_tier: int = 1) -> bool:
+    """Blocking Administrators lookup; run it through run_db from async code."""
+    return (
+        database.Administrators.select()
+        .where(
+            (database.Administrators.TierLevel >= min_tier)
+            & (database.Administrators.discordID == user_id)
+        )
+        .exists()
+    )
+
+
 def has_admin_level(required_level: int):
     """
     Decorator to check if a user has the required admin level.
@@ -32,20 +45,9 @@ def has_admin_level(required_level: int):
             return obj.user.id
         return None
 
-    def check_permission(user_id: int) -> bool:
-        """Check if the given user ID has the required admin tier."""
+    def _has_required_tier(user_id: int) -> bool:
         try:
-            database.db.connect(reuse_if_open=True)
-            result = (
-                database.Administrators.select()
-                .where(
-                    (database.Administrators.TierLevel >= required_level)
-                    & (
-                        database.Administrators.discordID == str(user_id)
-                    )  # IDs now stored as strings
-                )
-                .exists()
-            )
+            result = _is_administrator(user_id, required_level)
             _log.info(
                 f"Admin check {'passed' if result else 'failed'} for user {user_id} (level {required_level})"
             )
@@ -53,9 +55,10 @@ def has_admin_level(required_level: int):
         except OperationalError as e:
             _log.error(f"Database error during admin check: {e}")
             return False
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
+
+    async def check_permission(user_id: int) -> bool:
+        """Check if the given user ID has the required admin tier."""
+        return await run_db(_has_required_tier, user_id)
 
     def decorator(func: Callable):
         """Actual decorator logic"""
@@ -72,7 +75,7 @@ def has_admin_level(required_level: int):
                 return
 
             user_id = get_user_id(ctx_or_interaction)
-            if user_id and check_permission(user_id):
+            if user_id and await check_permission(user_id):
                 return await func(*args, **kwargs)
 
             _log.warning(f"Permission denied for {func.__name__} by user {user_id}")
@@ -96,28 +99,19 @@ def owns_realm_channel(category_id=REALM_CATEGORY_ID):
     This is based on the role name matching channel name pattern.
     """
 
-    def predicate(interaction: discord.Interaction) -> bool:
+    async def predicate(interaction: discord.Interaction) -> bool:
         _log.debug(f"Checking if user {interaction.user.id} owns realm channel.")
         if interaction.channel.category_id != category_id:
             _log.info(f"User {interaction.user.id} is not in the correct category.")
             return False
 
         try:
-            database.db.connect(reuse_if_open=True)
-            query = database.Administrators.select().where(
-                (database.Administrators.TierLevel >= 1)
-                & (database.Administrators.discordID == str(interaction.user.id))
-            )
-            if query.exists():
+            if await run_db(_is_administrator, interaction.user.id):
                 _log.info(f"User {interaction.user.id} has admin privileges.")
                 return True
         except OperationalError as e:
             _log.error(f"Database connection error: {e}")
             return False
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
-                _log.debug("Database connection closed.")
 
         try:
             realm_name = interaction.channel.name.rsplit("-", 1)[0]
@@ -149,25 +143,16 @@ def is_realm_op():
     Used for managing realm-level permissions.
     """
 
-    def predicate(interaction: discord.Interaction) -> bool:
+    async def predicate(interaction: discord.Interaction) -> bool:
         _log.debug(f"Checking if user {interaction.user.id} is a Realm OP.")
 
         try:
-            database.db.connect(reuse_if_open=True)
-            query = database.Administrators.select().where(
-                (database.Administrators.TierLevel >= 1)
-                & (database.Administrators.discordID == str(interaction.user.id))
-            )
-            if query.exists():
+            if await run_db(_is_administrator, interaction.user.id):
                 _log.info(f"User {interaction.user.id} has admin privileges.")
                 return True
         except OperationalError as e:
             _log.error(f"Database connection error: {e}")
             return False
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
-                _log.debug("Database connection closed.")
 
         try:
             member = interaction.guild.get_member(interaction.user.id)
@@ -0,0 +1,158 @@
+# utils/helpers/__fanout.py
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterable
+
+import aiohttp
+import discord
+
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# Guilds worked on at once, seconds allowed per attempt, and retries after the first.
+FANOUT_CONCURRENCY = max(1, int(os.getenv("fanout_concurrency", "8")))
+FANOUT_TIMEOUT = max(1.0, float(os.getenv("fanout_timeout", "30")))
+FANOUT_RETRIES = max(0, int(os.getenv("fanout_retries", "2")))
+_BACKOFF_BASE = 1.5
+
+
+class SkipGuild(Exception):
+    """Raised by a fan-out job when a guild is not configured for it; not retried."""
+
+
+class GuildOutcome:
+    __slots__ = ("guild_id", "guild_name", "status", "attempts", "elapsed_ms", "detail", "result")
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id = guild.id
+        self.guild_name = guild.name
+        self.status = "pending"  # ok, skipped, failed, timeout
+        self.attempts = 0
+        self.elapsed_ms = 0
+        self.detail: str | None = None
+        self.result: Any = None
+
+
+class FanoutReport:
+    """Per-guild outcomes of one broadcast."""
+
+    __slots__ = ("name", "outcomes", "elapsed")
+
+    def __init__(self, name: str, outcomes: list[GuildOutcome], elapsed: float):
+        self.name = name
+        self.outcomes = outcomes
+        self.elapsed = elapsed
+
+    def with_status(self, status: str) -> list[GuildOutcome]:
+        return [o for o in self.outcomes if o.status == status]
+
+    @property
+    def ok(self) -> list[GuildOutcome]:
+        return self.with_status("ok")
+
+    @property
+    def failed(self) -> list[GuildOutcome]:
+        return [o for o in self.outcomes if o.status in ("failed", "timeout")]
+
+    def summary(self) -> str:
+        counts: dict[str, int] = {}
+        for outcome in self.outcomes:
+            counts[outcome.status] = counts.get(outcome.status, 0) + 1
+        parts = ", ".join(f"{n} {status}" for status, n in sorted(counts.items())) or "no guilds"
+        return f"{self.name}: {parts} in {self.elapsed:.1f}s"
+
+    def to_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"📡 {self.name}",
+            description=self.summary(),
+            color=discord.Color.red() if self.failed else discord.Color.green(),
+            timestamp=discord.utils.utcnow(),
+        )
+        if self.failed:
+            lines = [
+                f"**{o.guild_name}** ({o.guild_id}): {o.status} after {o.attempts} attempt(s)"
+                + (f" — {o.detail}" if o.detail else "")
+                for o in self.failed[:15]
+            ]
+            if len(self.failed) > 15:
+                lines.append(f"… {len(self.failed) - 15} more")
+            embed.add_field(name="Failures", value="\n".join(lines)[:1024], inline=False)
+        return embed
+
+
+def _retryable(error: BaseException) -> bool:
+    if isinstance(error, (discord.Forbidden, discord.NotFound)):
+        return False
+    if isinstance(error, discord.HTTPException):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError, OSError))
+
+
+async def _run_guild(guild, job, outcome: GuildOutcome, timeout: float, retries: int):
+    started = time.monotonic()
+    while True:
+        outcome.attempts += 1
+        try:
+            outcome.result = await asyncio.wait_for(job(guild), timeout)
+            outcome.status = "ok"
+            break
+        except SkipGuild as e:
+            outcome.status, outcome.detail = "skipped", str(e) or None
+            break
+        except Exception as e:
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            outcome.status = "timeout" if timed_out else "failed"
+            outcome.detail = f"timed out after {timeout:g}s" if timed_out else f"{type(e).__name__}: {e}"[:300]
+            if outcome.attempts > retries or not _retryable(e):
+                if not timed_out:
+                    _log.warning(f"Fan-out job failed in {guild.name} ({guild.id}): {e}", exc_info=True)
+                break
+            delay = _BACKOFF_BASE ** outcome.attempts + random.uniform(0, 1)
+            await asyncio.sleep(delay)
+    outcome.elapsed_ms = int((time.monotonic() - started) * 1000)
+
+
+async def fan_out(
+    name: str,
+    guilds: Iterable[discord.Guild],
+    job: Callable[[discord.Guild], Awaitable[Any]],
+    *,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    retries: int | None = None,
+) -> FanoutReport:
+    """
+    Run `job(guild)` for every guild, at most `concurrency` at a time.
+
+    Each attempt gets `timeout` seconds. Rate limits, 5xx responses, timeouts and
+    connection errors are retried up to `retries` times with backoff; anything
+    else (including Forbidden/NotFound) fails the guild at once. A job raises
+    SkipGuild for guilds that are not set up for it. One slow guild never
+    holds up the rest.
+    """
+    concurrency = concurrency or FANOUT_CONCURRENCY
+    timeout = timeout or FANOUT_TIMEOUT
+    retries = FANOUT_RETRIES if retries is None else retries
+
+    guilds = list(guilds)
+    outcomes = [GuildOutcome(guild) for guild in guilds]
+    pending = iter(zip(guilds, outcomes))
+    started = time.monotonic()
+
+    async def worker():
+        # Workers share one iterator, so at most `concurrency` guilds are in flight.
+        for guild, outcome in pending:
+            await _run_guild(guild, job, outcome, timeout, retries)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(guilds)))))
+
+    report = FanoutReport(name, outcomes, time.monotonic() - started)
+    if report.failed:
+        _log.warning(f"📡 {report.summary()}")
+    else:
+        _log.info(f"📡 {report.summary()}")
+    return report
@@ -0,0 +1,197 @@
+# utils/helpers/__log_dispatcher.py
+
+import asyncio
+import os
+from collections import deque
+
+import discord
+
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# Seconds entries wait in a channel's queue so bursts merge into one message.
+LOG_DISPATCH_WINDOW = max(0.5, float(os.getenv("log_dispatch_window", "3")))
+
+# Discord limits per message / per embed.
+_MAX_EMBEDS = 10
+_MAX_MESSAGE_CHARS = 6000
+_MAX_DESCRIPTION = 4096
+_MAX_LINE = 1000
+
+
+class _Entry:
+    __slots__ = ("title", "line", "color", "embed", "content", "file")
+
+    def __init__(self, title=None, line=None, color=None, embed=None, content=None, file=None):
+        self.title = title
+        self.line = line
+        self.color = color
+        self.embed = embed
+        self.content = content
+        self.file = file
+
+
+class _MessageBuilder:
+    """Packs entries into as few messages as the embed limits allow."""
+
+    def __init__(self):
+        self.messages: list[dict] = []
+        self._embeds: list[discord.Embed] = []
+        self._chars = 0
+        self._open: tuple | None = None  # (title, color) of the embed still taking lines
+        self._open_count = 0
+
+    def _close_open(self):
+        if self._open is not None and self._open_count > 1:
+            embed = self._embeds[-1]
+            embed.set_footer(text=f"{self._open_count} entries")
+            self._chars += len(embed.footer.text)
+        self._open = None
+        self._open_count = 0
+
+    def _finish_message(self):
+        self._close_open()
+        if self._embeds:
+            self.messages.append({"embeds": self._embeds})
+        self._embeds = []
+        self._chars = 0
+
+    def _make_room(self, size: int):
+        if len(self._embeds) >= _MAX_EMBEDS or self._chars + size > _MAX_MESSAGE_CHARS:
+            self._finish_message()
+
+    def add(self, entry: _Entry):
+        if entry.file is not None or entry.content is not None:
+            # Attachments and plain content go out on their own, in order.
+            self._finish_message()
+            message = {"content": entry.content, "file": entry.file}
+            if entry.embed is not None:
+                message["embeds"] = [entry.embed]
+            self.messages.append(message)
+            return
+
+        if entry.embed is not None:
+            self._close_open()
+            self._make_room(len(entry.embed))
+            self._embeds.append(entry.embed)
+            self._chars += len(entry.embed)
+            return
+
+        line = entry.line if len(entry.line) <= _MAX_LINE else entry.line[: _MAX_LINE - 1] + "…"
+        key = (entry.title, entry.color)
+        if self._open == key:
+            embed = self._embeds[-1]
+            added = len(line) + 1
+            if (
+                len(embed.description) + added <= _MAX_DESCRIPTION
+                and self._chars + added + 16 <= _MAX_MESSAGE_CHARS  # leave room for the footer
+            ):
+                embed.description += "\n" + line
+                self._chars += added
+                self._open_count += 1
+                return
+
+        self._close_open()
+        self._make_room(len(entry.title or "") + len(line) + 16)
+        embed = discord.Embed(
+            title=entry.title,
+            description=line,
+            color=entry.color,
+            timestamp=discord.utils.utcnow(),
+        )
+        self._embeds.append(embed)
+        self._chars += len(entry.title or "") + len(line)
+        self._open = key
+        self._open_count = 1
+
+    def build(self) -> list[dict]:
+        self._finish_message()
+        return self.messages
+
+
+class _ChannelQueue:
+    __slots__ = ("channel", "entries", "task", "wake")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.entries: deque[_Entry] = deque()
+        self.task: asyncio.Task | None = None
+        self.wake = asyncio.Event()
+
+
+class LogDispatcher:
+    """
+    Per-channel log queue. Entries posted within LOG_DISPATCH_WINDOW of each
+    other are merged: lines with the same title become one embed, and embeds are
+    packed up to 10 per message / 6000 characters. A burst of level-ups or joins
+    therefore costs a handful of messages instead of one per event.
+    """
+
+    def __init__(self):
+        self._queues: dict[int, _ChannelQueue] = {}
+
+    def _enqueue(self, channel: discord.abc.Messageable, entry: _Entry):
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = _ChannelQueue(channel)
+        queue.channel = channel
+        queue.entries.append(entry)
+        if queue.task is None or queue.task.done():
+            queue.wake.clear()
+            queue.task = asyncio.create_task(self._drain(queue))
+
+    def post(
+        self,
+        channel: discord.abc.Messageable,
+        title: str,
+        line: str,
+        color: discord.Color | int | None = None,
+    ):
+        """Queue one line; lines sharing a title and color are merged into one embed."""
+        self._enqueue(channel, _Entry(title=title, line=line, color=color))
+
+    def send(
+        self,
+        channel: discord.abc.Messageable,
+        *,
+        embed: discord.Embed | None = None,
+        content: str | None = None,
+        file: discord.File | None = None,
+    ):
+        """Queue a prebuilt embed (packed with others) or a message with content/attachment."""
+        self._enqueue(channel, _Entry(embed=embed, content=content, file=file))
+
+    async def _drain(self, queue: _ChannelQueue):
+        try:
+            await asyncio.wait_for(queue.wake.wait(), LOG_DISPATCH_WINDOW)
+        except asyncio.TimeoutError:
+            pass
+        while queue.entries:
+            builder = _MessageBuilder()
+            while queue.entries:
+                builder.add(queue.entries.popleft())
+            for message in builder.build():
+                await self._deliver(queue.channel, message)
+
+    async def _deliver(self, channel, message: dict):
+        kwargs = {k: v for k, v in message.items() if v is not None}
+        try:
+            await channel.send(**kwargs)
+        except discord.Forbidden:
+            _log.warning(f"Cannot send log messages to #{getattr(channel, 'name', channel)}")
+        except discord.HTTPException as e:
+            _log.warning(f"Failed to send log message to #{getattr(channel, 'name', channel)}: {e}")
+
+    async def flush(self):
+        """Deliver everything queued right away (e.g. on shutdown)."""
+        tasks = []
+        for queue in self._queues.values():
+            if queue.task is not None and not queue.task.done():
+                queue.wake.set()
+                tasks.append(queue.task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+log_dispatcher = LogDispatcher()
@@ -0,0 +1,42 @@
+# utils/helpers/__rate_limit.py
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket. `rate` tokens are added per second up to `burst`;
+    acquire() waits until enough tokens are available. Used to keep bulk jobs
+    (audits, imports) under a REST budget instead of leaning on 429 retries.
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = max(0.01, float(rate))
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int = 1):
+        # The lock keeps waiters in FIFO order so a burst cannot starve anyone.
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
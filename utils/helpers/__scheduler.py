@@ -0,0 +1,369 @@
+# utils/helpers/__scheduler.py
+
+import asyncio
+import datetime
+import os
+import time
+from typing import Awaitable, Callable
+from zoneinfo import ZoneInfo
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# Longest single sleep. Bounds the effect of clock jumps, and planner jobs are
+# re-planned at least this often in case a reschedule() call was missed.
+SCHEDULER_MAX_SLEEP = max(30, int(os.getenv("scheduler_max_sleep", "900")))
+# Delay before a planner job whose planned time has already passed runs again.
+SCHEDULER_RETRY_DELAY = max(5, int(os.getenv("scheduler_retry_delay", "60")))
+
+UTC = datetime.timezone.utc
+
+
+class CronError(ValueError):
+    pass
+
+
+def _parse_field(text: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise CronError(f"Invalid step in '{text}'.")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            first, last = part.split("-", 1)
+            start, end = int(first), int(last)
+        else:
+            start = int(part)
+            end = high if step > 1 else start  # "5/15" means 5, 20, 35, ...
+        if start < low or end > high or start > end:
+            raise CronError(f"'{text}' is outside {low}-{high}.")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """Five-field cron (minute hour day-of-month month day-of-week), evaluated in a time zone."""
+
+    __slots__ = (
+        "expression", "tz", "minutes", "hours", "days", "months", "weekdays",
+        "_any_day", "_any_weekday",
+    )
+
+    def __init__(self, expression: str, tz: str = "UTC"):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise CronError(f"Cron expression needs 5 fields: '{expression}'.")
+        self.expression = expression
+        self.tz = ZoneInfo(tz)
+        try:
+            self.minutes = _parse_field(fields[0], 0, 59)
+            self.hours = _parse_field(fields[1], 0, 23)
+            self.days = _parse_field(fields[2], 1, 31)
+            self.months = _parse_field(fields[3], 1, 12)
+            # cron weekdays: 0 (or 7) = Sunday
+            self.weekdays = frozenset(d % 7 for d in _parse_field(fields[4], 0, 7))
+        except ValueError as e:
+            raise CronError(f"Invalid cron expression '{expression}': {e}") from None
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, day: datetime.date) -> bool:
+        weekday = (day.weekday() + 1) % 7
+        if self._any_day and self._any_weekday:
+            return True
+        if self._any_day:
+            return weekday in self.weekdays
+        if self._any_weekday:
+            return day.day in self.days
+        # Both restricted: standard cron fires when either matches.
+        return day.day in self.days or weekday in self.weekdays
+
+    def next_after(self, after: datetime.datetime) -> datetime.datetime:
+        """First fire time strictly after `after` (aware), as an aware UTC datetime."""
+        local = after.astimezone(self.tz).replace(tzinfo=None, second=0, microsecond=0)
+        local += datetime.timedelta(minutes=1)
+        limit = local + datetime.timedelta(days=366 * 5)
+        minute = datetime.timedelta(minutes=1)
+        while local < limit:
+            if local.month not in self.months:
+                year, month = divmod(local.month, 12)
+                local = local.replace(year=local.year + year, month=month + 1, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(local.date()):
+                local = local.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+                continue
+            if local.hour not in self.hours:
+                local = local.replace(minute=0) + datetime.timedelta(hours=1)
+                continue
+            if local.minute not in self.minutes:
+                local += minute
+                continue
+            fire = local.replace(tzinfo=self.tz).astimezone(UTC)
+            # Skip wall times that don't exist (DST gap) or were already passed.
+            if fire.astimezone(self.tz).replace(tzinfo=None) != local or fire <= after:
+                local += minute
+                continue
+            return fire
+        raise CronError(f"'{self.expression}' never fires.")
+
+    def __str__(self) -> str:
+        return f"{self.expression} ({self.tz.key})"
+
+
+class Job:
+    __slots__ = (
+        "name", "func", "schedule", "planner", "grace", "description", "next_fire",
+        "last_fire", "last_status", "last_error", "last_duration_ms", "last_finished",
+        "needs_plan", "planned_at", "task",
+    )
+
+    def __init__(self, name, func, schedule, planner, grace, description):
+        self.name = name
+        self.func = func
+        self.schedule: CronSchedule | None = schedule
+        self.planner = planner
+        self.grace = grace
+        self.description = description
+        self.next_fire: datetime.datetime | None = None
+        self.last_fire: datetime.datetime | None = None
+        self.last_status: str | None = None
+        self.last_error: str | None = None
+        self.last_duration_ms: int | None = None
+        self.last_finished: datetime.datetime | None = None
+        self.needs_plan = True
+        self.planned_at = 0.0
+        self.task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    @property
+    def schedule_text(self) -> str:
+        return str(self.schedule) if self.schedule is not None else "event-driven"
+
+
+def _utc(value: datetime.datetime | None) -> datetime.datetime | None:
+    # Stored as naive UTC like every other timestamp in the schema.
+    return value.replace(tzinfo=UTC) if value is not None and value.tzinfo is None else value
+
+
+def _naive(value: datetime.datetime) -> datetime.datetime:
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _load_markers(names: list[str]) -> dict:
+    j = database.ScheduledJobRun
+    return {row.name: row for row in j.select().where(j.name.in_(names))}
+
+
+def _claim(name: str, fire: datetime.datetime, started: datetime.datetime) -> bool:
+    """Atomically take a fire slot; False if it (or a later one) was already taken."""
+    j = database.ScheduledJobRun
+    j.insert(name=name).on_conflict_ignore().execute()
+    claimed = (
+        j.update(last_fire=fire, last_started=started, last_status="running", last_error=None)
+        .where((j.name == name) & (j.last_fire.is_null() | (j.last_fire < fire)))
+        .execute()
+    )
+    return claimed == 1
+
+
+def _finish(name: str, finished: datetime.datetime, status: str, error: str | None, duration_ms: int):
+    j = database.ScheduledJobRun
+    j.update(
+        last_finished=finished,
+        last_status=status,
+        last_error=error,
+        last_duration_ms=duration_ms,
+    ).where(j.name == name).execute()
+
+
+class Scheduler:
+    """
+    One task that sleeps until the earliest job is due, instead of each cog
+    polling on its own loop.
+
+    Cron jobs compute their next fire time from the persisted last fire, so a
+    restart neither repeats a slot nor (within `grace` seconds) misses one.
+    Event-driven jobs supply an async planner returning their next UTC time;
+    call reschedule() when the data it reads changes.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, Job] = {}
+        self._wake = asyncio.Event()
+        self._runner: asyncio.Task | None = None
+        self._bot = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        *,
+        cron: str | None = None,
+        tz: str = "UTC",
+        planner: Callable[[], Awaitable[datetime.datetime | None]] | None = None,
+        grace: int = 0,
+        description: str = "",
+    ):
+        if (cron is None) == (planner is None):
+            raise ValueError("A job needs exactly one of cron= or planner=.")
+        schedule = CronSchedule(cron, tz) if cron is not None else None
+        previous = self._jobs.get(name)
+        if previous is not None and previous.running:
+            previous.task.cancel()
+        self._jobs[name] = Job(name, func, schedule, planner, grace, description)
+        self._wake.set()
+
+    def remove_job(self, name: str):
+        job = self._jobs.pop(name, None)
+        if job is not None and job.running:
+            job.task.cancel()
+        self._wake.set()
+
+    def reschedule(self, name: str):
+        """Re-run a job's planner (e.g. after the data it schedules from changed)."""
+        job = self._jobs.get(name)
+        if job is not None:
+            job.needs_plan = True
+            self._wake.set()
+
+    def jobs(self) -> list[Job]:
+        far = datetime.datetime.max.replace(tzinfo=UTC)
+        return sorted(self._jobs.values(), key=lambda j: (j.next_fire or far, j.name))
+
+    def start(self, bot):
+        """Start the runner once; jobs first fire after the bot is ready."""
+        self._bot = bot
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+    # ---------- runner ----------
+
+    async def _run(self):
+        await self._bot.wait_until_ready()
+        _log.info(f"⏱️ Scheduler started with {len(self._jobs)} job(s).")
+        while True:
+            try:
+                await self._plan()
+            except Exception as e:
+                _log.error(f"❌ Scheduler planning failed: {e}", exc_info=True)
+
+            now = datetime.datetime.now(UTC)
+            for job in list(self._jobs.values()):
+                if job.next_fire is not None and job.next_fire <= now and not job.running:
+                    job.task = asyncio.create_task(self._execute(job, job.next_fire))
+
+            upcoming = [
+                job.next_fire for job in self._jobs.values()
+                if job.next_fire is not None and not job.running
+            ]
+            delay = SCHEDULER_MAX_SLEEP
+            if upcoming:
+                delay = min(delay, max(0.0, (min(upcoming) - now).total_seconds()))
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _plan(self):
+        stale = time.monotonic() - SCHEDULER_MAX_SLEEP
+        pending = [
+            job for job in self._jobs.values()
+            if not job.running
+            and (job.needs_plan or (job.planner is not None and job.planned_at < stale))
+        ]
+        if not pending:
+            return
+
+        markers = await run_db(_load_markers, [job.name for job in pending])
+        now = datetime.datetime.now(UTC)
+        for job in pending:
+            marker = markers.get(job.name)
+            if marker is not None:
+                job.last_fire = _utc(marker.last_fire)
+                job.last_status = marker.last_status
+                job.last_error = marker.last_error
+                job.last_duration_ms = marker.last_duration_ms
+                job.last_finished = _utc(marker.last_finished)
+
+            if job.schedule is not None:
+                # Slots missed by more than `grace` seconds are skipped.
+                anchor = now - datetime.timedelta(seconds=job.grace)
+                if job.last_fire is not None and job.last_fire > anchor:
+                    anchor = job.last_fire
+                job.next_fire = job.schedule.next_after(anchor)
+            else:
+                planned = await job.planner()
+                if planned is not None and job.last_finished is not None and planned <= job.last_finished:
+                    # Already handled at or after this time; don't spin if the
+                    # job could not move its data past it.
+                    planned = job.last_finished + datetime.timedelta(seconds=SCHEDULER_RETRY_DELAY)
+                job.next_fire = planned
+            job.needs_plan = False
+            job.planned_at = time.monotonic()
+
+    async def _execute(self, job: Job, fire: datetime.datetime):
+        started = datetime.datetime.now(UTC)
+        # Event-driven jobs claim their actual start time: the work they do is
+        # state-driven, so only overlap needs preventing, not repeats.
+        slot = fire if job.schedule is not None else started
+        try:
+            if not await run_db(_claim, job.name, _naive(slot), _naive(started)):
+                _log.info(f"⏭️ Job {job.name} already ran for {slot:%Y-%m-%d %H:%M} UTC; skipping.")
+                if job.schedule is not None:
+                    # Re-planning reads the newer marker and moves past this slot.
+                    job.needs_plan = True
+                else:
+                    # Another instance holds the claim; look again once it is likely done.
+                    job.next_fire = datetime.datetime.now(UTC) + datetime.timedelta(
+                        seconds=SCHEDULER_RETRY_DELAY
+                    )
+                return
+
+            job.last_fire = slot
+            job.last_status = "running"
+            status, error = "ok", None
+            clock = time.perf_counter()
+            try:
+                await job.func()
+            except asyncio.CancelledError:
+                status, error = "failed", "cancelled"
+                raise
+            except Exception as e:
+                status, error = "failed", f"{type(e).__name__}: {e}"[:1000]
+                _log.error(f"❌ Job {job.name} failed: {e}", exc_info=True)
+            finally:
+                duration_ms = int((time.perf_counter() - clock) * 1000)
+                finished = datetime.datetime.now(UTC)
+                job.last_status, job.last_error = status, error
+                job.last_duration_ms, job.last_finished = duration_ms, finished
+                try:
+                    await run_db(_finish, job.name, _naive(finished), status, error, duration_ms)
+                except Exception as e:
+                    _log.warning(f"Failed to record run of job {job.name}: {e}")
+            _log.info(f"⏱️ Job {job.name} finished ({status}) in {duration_ms} ms.")
+        except Exception as e:
+            # Usually the database is unreachable; retry the same slot later.
+            _log.error(f"❌ Could not run job {job.name}: {e}", exc_info=True)
+            job.next_fire = datetime.datetime.now(UTC) + datetime.timedelta(
+                seconds=SCHEDULER_RETRY_DELAY
+            )
+        else:
+            job.needs_plan = True
+        finally:
+            self._wake.set()
+
+
+scheduler = Scheduler()
@@ -0,0 +1,341 @@
+# utils/level_system/__ls_accumulator.py
+
+import asyncio
+import contextlib
+import datetime
+import os
+import random
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.core_features.__common import calculate_level
+from utils.helpers.__logging_module import get_log
+from utils.level_system.__ls_cooldowns import cooldown_gate
+
+_log = get_log("level_system.accumulator")
+
+# Crash-safety bounds: at most XP_FLUSH_INTERVAL seconds or XP_FLUSH_MAX_PENDING
+# members' worth of XP can be lost if the process dies without a clean shutdown.
+XP_FLUSH_INTERVAL = max(1.0, float(os.getenv("xp_flush_interval", "10")))
+XP_FLUSH_MAX_PENDING = max(1, int(os.getenv("xp_flush_max_pending", "500")))
+# Members with nothing pending are dropped from memory after this long idle.
+XP_IDLE_TTL = max(60, int(os.getenv("xp_idle_ttl", "3600")))
+
+_UPSERT_PREFIX = (
+    "INSERT INTO serverscores "
+    "(ServerID, DiscordLongID, DiscordName, Score, Level, Progress, LastMessageTimestamp, TatsuXP) "
+    "VALUES "
+)
+_UPSERT_SUFFIX = (
+    " ON DUPLICATE KEY UPDATE "
+    "Score = Score + VALUES(Score), "
+    "Level = VALUES(Level), "
+    "Progress = VALUES(Progress), "
+    "DiscordName = VALUES(DiscordName), "
+    "LastMessageTimestamp = VALUES(LastMessageTimestamp)"
+)
+_UPSERT_ROW = "(%s, %s, %s, %s, %s, %s, %s, 0)"
+_UPSERT_BATCH = 500
+
+
+class _MemberXP:
+    """In-memory score state for one member of one guild."""
+
+    __slots__ = ("score", "pending", "level", "progress", "name", "last_award")
+
+    def __init__(self, score: int, level: int, progress: int, last_award):
+        self.score = score
+        self.pending = 0
+        self.level = level
+        self.progress = progress
+        self.name = ""
+        self.last_award = last_award
+
+
+def _normalize_timestamp(value, now: datetime.datetime):
+    # Older rows may store epoch seconds; strings/zero dates are treated as unset.
+    if isinstance(value, (int, float)):
+        value = datetime.datetime.utcfromtimestamp(value) if value else None
+    if not isinstance(value, datetime.datetime):
+        return None
+    return min(value, now)  # guard against future timestamps
+
+
+def _load_member(guild_id: int, user_id: int):
+    row = (
+        database.ServerScores.select(
+            database.ServerScores.Score,
+            database.ServerScores.Level,
+            database.ServerScores.Progress,
+            database.ServerScores.LastMessageTimestamp,
+        )
+        .where(
+            (database.ServerScores.ServerID == guild_id)
+            & (database.ServerScores.DiscordLongID == user_id)
+        )
+        .first()
+    )
+    if row is None:
+        return None
+    return row.Score or 0, row.Level or 0, row.Progress or 0, row.LastMessageTimestamp
+
+
+def _write_batch(rows: list[tuple]):
+    """
+    Multi-row upserts in chunks; relies on the unique (ServerID, DiscordLongID)
+    index. All chunks share one transaction: the caller re-queues the whole
+    batch on failure, so a partially committed batch would be counted twice.
+    """
+    with database.db.atomic():
+        for start in range(0, len(rows), _UPSERT_BATCH):
+            chunk = rows[start : start + _UPSERT_BATCH]
+            sql = _UPSERT_PREFIX + ", ".join([_UPSERT_ROW] * len(chunk)) + _UPSERT_SUFFIX
+            params = [value for row in chunk for value in row]
+            database.db.execute_sql(sql, params)
+
+
+class XPAccumulator:
+    """
+    Write-behind store for message XP.
+
+    award() works entirely in memory once a member's row has been loaded, so
+    level-ups are detected immediately. Deltas are written back by flush() as a
+    single INSERT ... ON DUPLICATE KEY UPDATE Score = Score + delta.
+    """
+
+    def __init__(self):
+        self._members: dict[tuple[int, int], _MemberXP] = {}
+        self._loading: dict[tuple[int, int], asyncio.Future] = {}
+        self._dirty: set[tuple[int, int]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._early_flush: asyncio.Task | None = None
+        self._paused: dict[int, asyncio.Event] = {}
+        self._active: dict[int, int] = {}
+        self._drained: dict[int, asyncio.Event] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._dirty)
+
+    async def _get_member(self, guild_id: int, user_id: int) -> _MemberXP:
+        key = (guild_id, user_id)
+        entry = self._members.get(key)
+        if entry is not None:
+            return entry
+
+        # Coalesce concurrent first messages from the same member into one read.
+        loading = self._loading.get(key)
+        if loading is None:
+            loading = asyncio.get_running_loop().create_future()
+            self._loading[key] = loading
+            try:
+                row = await run_db(_load_member, guild_id, user_id)
+                now = datetime.datetime.utcnow()
+                if row is None:
+                    entry = _MemberXP(0, 1, 0, None)
+                else:
+                    score, level, progress, last = row
+                    entry = _MemberXP(score, level, progress, _normalize_timestamp(last, now))
+                    cooldown_gate.seed(guild_id, user_id, entry.last_award)
+                loading.set_result(entry)
+            except Exception as e:
+                loading.set_exception(e)
+                # Make sure the exception is marked retrieved if nobody else waits.
+                loading.exception()
+                raise
+            finally:
+                self._loading.pop(key, None)
+        else:
+            entry = await loading
+        # setdefault: a flush may have evicted the fresh entry while we waited.
+        return self._members.setdefault(key, entry)
+
+    async def award(
+        self,
+        guild_id: int,
+        user_id: int,
+        username: str,
+        cooldown_time: int,
+        points_per_message: int,
+    ):
+        """
+        Apply one message's XP. Returns (previous_level, new_level, gained), or
+        None if the member is still on cooldown.
+        """
+        while (gate := self._paused.get(guild_id)) is not None:
+            await gate.wait()
+        self._active[guild_id] = self._active.get(guild_id, 0) + 1
+        try:
+            return await self._award(guild_id, user_id, username, cooldown_time, points_per_message)
+        finally:
+            self._active[guild_id] -= 1
+            if not self._active[guild_id]:
+                del self._active[guild_id]
+                drained = self._drained.pop(guild_id, None)
+                if drained is not None:
+                    drained.set()
+
+    async def _award(
+        self,
+        guild_id: int,
+        user_id: int,
+        username: str,
+        cooldown_time: int,
+        points_per_message: int,
+    ):
+        entry = await self._get_member(guild_id, user_id)
+
+        # Re-check: loading the member may have seeded a persisted timestamp,
+        # and another message may have been awarded while we awaited.
+        if cooldown_gate.on_cooldown(guild_id, user_id, cooldown_time):
+            _log.debug(f"{username} is on cooldown.")
+            return None
+        now = datetime.datetime.utcnow()
+        cooldown_gate.mark(guild_id, user_id)
+
+        # Ensure positive bounds; if points_per_message is 0, grant 0
+        lower = max(0, points_per_message)
+        upper = max(lower, points_per_message * 3)
+        increment = random.randint(lower, upper) if upper > 0 else 0
+
+        previous_level = entry.level
+        entry.score += increment
+        entry.pending += increment
+        entry.level, entry.progress, next_level_score = calculate_level(entry.score)
+        entry.name = username
+        entry.last_award = now
+        self._dirty.add((guild_id, user_id))
+
+        _log.debug(
+            f"{username} gained {increment} XP → Score: {entry.score}, "
+            f"Level: {previous_level} → {entry.level}, Next threshold: {next_level_score}"
+        )
+
+        if len(self._dirty) >= XP_FLUSH_MAX_PENDING and (
+            self._early_flush is None or self._early_flush.done()
+        ):
+            self._early_flush = asyncio.create_task(self.flush())
+
+        return previous_level, entry.level, increment
+
+    def peek_score(self, guild_id: int, user_id: int) -> int | None:
+        entry = self._members.get((guild_id, user_id))
+        return entry.score if entry is not None else None
+
+    def loaded_scores(self, guild_id: int) -> dict[int, int]:
+        """Current in-memory scores (including unflushed XP) for one guild."""
+        return {
+            user_id: entry.score
+            for (gid, user_id), entry in self._members.items()
+            if gid == guild_id
+        }
+
+    def peek_level(self, guild_id: int, user_id: int) -> int | None:
+        """Level from memory if the member is loaded; never touches the database."""
+        entry = self._members.get((guild_id, user_id))
+        return entry.level if entry is not None else None
+
+    async def forget(self, guild_id: int, user_id: int):
+        """
+        Flush and drop a member's cached state. Call before writing their
+        ServerScores row directly (e.g. Tatsu sync) so the next award reloads it.
+        """
+        await self.forget_many(guild_id, [user_id])
+
+    async def forget_many(self, guild_id: int, user_ids):
+        """
+        forget() for a batch of members with at most one flush. Raises
+        RuntimeError, keeping the members in memory, if their XP could not be
+        flushed.
+        """
+        keys = [(guild_id, user_id) for user_id in user_ids]
+        if any(key in self._dirty for key in keys):
+            await self.flush()
+            if any(key in self._dirty for key in keys):
+                raise RuntimeError(f"Could not flush pending XP for guild {guild_id}.")
+        for key in keys:
+            self._members.pop(key, None)
+
+    @contextlib.asynccontextmanager
+    async def paused(self, guild_id: int):
+        """
+        Hold awards for a guild, flush and drop its cached members, and keep
+        them out of memory until the block exits. Wrap bulk rewrites of a
+        guild's ServerScores (economy changes) in this, so no award flushes a
+        Level computed from the old scores on top of the new ones.
+        """
+        while (gate := self._paused.get(guild_id)) is not None:
+            await gate.wait()
+        gate = self._paused[guild_id] = asyncio.Event()
+        try:
+            if self._active.get(guild_id):
+                await self._drained.setdefault(guild_id, asyncio.Event()).wait()
+            keys = [key for key in self._members if key[0] == guild_id]
+            if any(key in self._dirty for key in keys):
+                await self.flush()
+                if any(key in self._dirty for key in keys):
+                    raise RuntimeError(f"Could not flush pending XP for guild {guild_id}.")
+            for key in keys:
+                self._members.pop(key, None)
+            yield
+        finally:
+            del self._paused[guild_id]
+            gate.set()
+
+    async def flush(self) -> int:
+        """Write all pending deltas to the database. Returns the number of members written."""
+        async with self._flush_lock:
+            if not self._dirty:
+                self._evict_idle()
+                return 0
+
+            keys = list(self._dirty)
+            self._dirty.clear()
+            batch = []
+            taken = []
+            for key in keys:
+                entry = self._members.get(key)
+                if entry is None:
+                    continue
+                guild_id, user_id = key
+                batch.append(
+                    (
+                        guild_id,
+                        user_id,
+                        entry.name,
+                        entry.pending,
+                        entry.level,
+                        entry.progress,
+                        entry.last_award,
+                    )
+                )
+                taken.append((key, entry, entry.pending))
+                entry.pending = 0
+
+            try:
+                await run_db(_write_batch, batch)
+            except Exception as e:
+                # Put the deltas back so the next flush retries them.
+                for key, entry, delta in taken:
+                    entry.pending += delta
+                    self._dirty.add(key)
+                _log.error(f"❌ Failed to flush XP for {len(batch)} member(s): {e}", exc_info=True)
+                return 0
+
+            _log.debug(f"💾 Flushed XP for {len(batch)} member(s).")
+            self._evict_idle()
+            return len(batch)
+
+    def _evict_idle(self):
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=XP_IDLE_TTL)
+        stale = [
+            key
+            for key, entry in self._members.items()
+            if key not in self._dirty
+            and (entry.last_award is None or entry.last_award < cutoff)
+        ]
+        for key in stale:
+            self._members.pop(key, None)
+
+
+xp_accumulator = XPAccumulator()
@@ -0,0 +1,139 @@
+# utils/level_system/__ls_activity.py
+
+import asyncio
+import datetime
+import os
+from array import array
+
+from peewee import fn
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+
+_log = get_log("level_system.activity")
+
+# Days of buckets kept; anything older than the longest window is pruned.
+XP_DAILY_RETENTION_DAYS = max(31, int(os.getenv("xp_daily_retention_days", "90")))
+
+PERIOD_DAYS = {"weekly": 7, "monthly": 30}
+
+_UPSERT_PREFIX = "INSERT INTO xp_daily (ServerID, Day, DiscordLongID, XP) VALUES "
+_UPSERT_SUFFIX = " ON DUPLICATE KEY UPDATE XP = XP + VALUES(XP)"
+_UPSERT_BATCH = 500
+
+
+class _DayBuffer:
+    """XP earned in one guild on one day: user -> slot, with totals in a flat array."""
+
+    __slots__ = ("slots", "xp")
+
+    def __init__(self):
+        self.slots: dict[int, int] = {}
+        self.xp = array("L")
+
+    def add(self, user_id: int, amount: int):
+        slot = self.slots.get(user_id)
+        if slot is None:
+            self.slots[user_id] = len(self.xp)
+            self.xp.append(amount)
+        else:
+            self.xp[slot] += amount
+
+    def rows(self):
+        xp = self.xp
+        return ((user_id, xp[slot]) for user_id, slot in self.slots.items())
+
+
+def _today() -> datetime.date:
+    return datetime.datetime.utcnow().date()
+
+
+def _write_rows(rows: list[tuple]):
+    for start in range(0, len(rows), _UPSERT_BATCH):
+        chunk = rows[start : start + _UPSERT_BATCH]
+        sql = _UPSERT_PREFIX + ", ".join(["(%s, %s, %s, %s)"] * len(chunk)) + _UPSERT_SUFFIX
+        with database.db.atomic():
+            database.db.execute_sql(sql, [value for row in chunk for value in row])
+
+
+def _prune(cutoff: datetime.date) -> int:
+    return database.XPDaily.delete().where(database.XPDaily.Day < cutoff).execute()
+
+
+def _window_totals(guild_id: int, since: datetime.date, limit: int) -> list[tuple[int, int]]:
+    d = database.XPDaily
+    total = fn.SUM(d.XP)
+    query = (
+        d.select(d.DiscordLongID, total)
+        .where((d.ServerID == guild_id) & (d.Day >= since))
+        .group_by(d.DiscordLongID)
+        .order_by(total.desc(), d.DiscordLongID.desc())
+        .limit(limit)
+        .tuples()
+    )
+    return [(int(user_id), int(xp or 0)) for user_id, xp in query]
+
+
+class XPActivity:
+    """
+    Write-behind per-day XP counters. record() only touches memory; flush()
+    turns every buffered (guild, day, member) total into one row of a batched
+    upsert, so storage grows with active members per day, not with messages.
+    """
+
+    def __init__(self):
+        self._buffers: dict[tuple[int, datetime.date], _DayBuffer] = {}
+        self._flush_lock = asyncio.Lock()
+        self._pruned_on: datetime.date | None = None
+
+    def record(self, guild_id: int, user_id: int, amount: int):
+        if amount <= 0:
+            return
+        key = (guild_id, _today())
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = _DayBuffer()
+        buffer.add(user_id, amount)
+
+    async def flush(self) -> int:
+        """Write buffered buckets. Returns the number of rows upserted."""
+        async with self._flush_lock:
+            buffers, self._buffers = self._buffers, {}
+            rows = [
+                (guild_id, day, user_id, xp)
+                for (guild_id, day), buffer in buffers.items()
+                for user_id, xp in buffer.rows()
+            ]
+            if rows:
+                try:
+                    await run_db(_write_rows, rows)
+                except Exception as e:
+                    # Merge back so the next flush retries.
+                    for guild_id, day, user_id, xp in rows:
+                        key = (guild_id, day)
+                        self._buffers.setdefault(key, _DayBuffer()).add(user_id, xp)
+                    _log.error(f"❌ Failed to flush daily XP ({len(rows)} rows): {e}", exc_info=True)
+                    return 0
+
+            today = _today()
+            if self._pruned_on != today:
+                self._pruned_on = today
+                cutoff = today - datetime.timedelta(days=XP_DAILY_RETENTION_DAYS)
+                try:
+                    pruned = await run_db(_prune, cutoff)
+                    if pruned:
+                        _log.info(f"🧹 Pruned {pruned} daily XP rows older than {cutoff}.")
+                except Exception as e:
+                    _log.warning(f"Failed to prune daily XP rows: {e}")
+            return len(rows)
+
+    async def top(self, guild_id: int, period: str, limit: int) -> list[tuple[int, int]]:
+        """[(user_id, xp)] for the rolling window, highest first."""
+        # Buffered XP is at most one flush interval old; write it so the rollup is current.
+        await self.flush()
+        since = _today() - datetime.timedelta(days=PERIOD_DAYS[period] - 1)
+        return await run_db(_window_totals, guild_id, since, limit)
+
+
+xp_activity = XPActivity()
@@ -0,0 +1,285 @@
+# utils/level_system/__ls_audit.py
+
+import asyncio
+import csv
+import io
+import os
+import time
+
+import discord
+from peewee import Case
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.core_features.__common import calculate_level
+from utils.helpers.__log_dispatcher import log_dispatcher
+from utils.helpers.__logging_module import get_log
+from utils.helpers.__rate_limit import TokenBucket
+from .__ls_accumulator import xp_accumulator
+from .__ls_dirty import dirty_members
+from .__ls_reconcile import RolePlan, apply_role_plan, plan_level_roles
+from .__ls_role_map import level_role_map
+
+_log = get_log("level_system.audit")
+
+# Role edits in flight at once, and the REST budget they share across guilds.
+AUDIT_CONCURRENCY = max(1, int(os.getenv("audit_concurrency", "4")))
+AUDIT_REST_RATE = max(0.1, float(os.getenv("audit_rest_rate", "5")))
+AUDIT_REST_BURST = max(1, int(os.getenv("audit_rest_burst", "5")))
+
+_LEVEL_WRITE_CHUNK = 500
+_SCORE_LOOKUP_CHUNK = 1000
+
+_rest_budget = TokenBucket(AUDIT_REST_RATE, AUDIT_REST_BURST)
+
+
+class AuditEntry:
+    """One member whose stored level or level roles disagree with their score."""
+
+    __slots__ = ("member", "score_id", "score", "stored_level", "level", "progress", "plan", "status")
+
+    def __init__(self, member, score_id, score, stored_level, level, progress, plan):
+        self.member: discord.Member = member
+        self.score_id: int = score_id
+        self.score: int = score
+        self.stored_level: int = stored_level
+        self.level: int = level
+        self.progress: float = progress
+        self.plan: RolePlan = plan
+        self.status = "planned"
+
+    @property
+    def level_drift(self) -> bool:
+        return self.stored_level != self.level
+
+
+class AuditReport:
+    __slots__ = (
+        "guild", "dry_run", "full", "scanned", "entries", "levels_fixed", "applied", "failed", "elapsed"
+    )
+
+    def __init__(self, guild: discord.Guild, dry_run: bool, full: bool):
+        self.guild = guild
+        self.dry_run = dry_run
+        self.full = full
+        self.scanned = 0
+        self.entries: list[AuditEntry] = []
+        self.levels_fixed = 0
+        self.applied = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    @property
+    def role_changes(self) -> int:
+        return sum(1 for e in self.entries if e.plan)
+
+    def to_embed(self) -> discord.Embed:
+        title = "🧪 Level Role Audit (dry run)" if self.dry_run else "🔄 Level Role Audit"
+        embed = discord.Embed(
+            title=title,
+            color=discord.Color.blurple() if self.dry_run else discord.Color.teal(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(name="Members Scanned", value=str(self.scanned))
+        embed.add_field(name="Role Changes", value=str(self.role_changes))
+        embed.add_field(
+            name="Level Drift",
+            value=str(sum(1 for e in self.entries if e.level_drift)),
+        )
+        if not self.dry_run:
+            embed.add_field(name="Applied", value=str(self.applied))
+            embed.add_field(name="Failed", value=str(self.failed))
+            embed.add_field(name="Levels Rewritten", value=str(self.levels_fixed))
+        mode = "full sweep" if self.full else "changed members"
+        embed.set_footer(text=f"{self.guild.name} • {mode} • {self.elapsed:.1f}s")
+        return embed
+
+    def to_file(self) -> discord.File | None:
+        if not self.entries:
+            return None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(
+            ["user_id", "name", "score", "stored_level", "level", "target_role", "add", "remove", "status"]
+        )
+        for e in self.entries:
+            writer.writerow(
+                [
+                    e.member.id,
+                    e.member.name,
+                    e.score,
+                    e.stored_level,
+                    e.level,
+                    e.plan.target.name if e.plan.target else "",
+                    ";".join(r.name for r in e.plan.add),
+                    ";".join(r.name for r in e.plan.remove),
+                    e.status,
+                ]
+            )
+        data = io.BytesIO(buffer.getvalue().encode("utf-8"))
+        stamp = discord.utils.utcnow().strftime("%Y%m%d-%H%M")
+        return discord.File(data, filename=f"level_audit_{self.guild.id}_{stamp}.csv")
+
+
+def _load_scores(
+    guild_id: int, user_ids: list[int] | None = None
+) -> dict[int, tuple[int, int, int]]:
+    """
+    {user_id: (ScoreID, Score, Level)} for the whole guild in one query, or for
+    just `user_ids` via the (ServerID, DiscordLongID) index.
+    """
+    s = database.ServerScores
+    base = s.select(s.DiscordLongID, s.ScoreID, s.Score, s.Level).where(s.ServerID == guild_id)
+    if user_ids is None:
+        queries = [base]
+    else:
+        queries = [
+            base.where(s.DiscordLongID.in_(user_ids[i : i + _SCORE_LOOKUP_CHUNK]))
+            for i in range(0, len(user_ids), _SCORE_LOOKUP_CHUNK)
+        ]
+    return {
+        int(user_id): (score_id, int(score or 0), int(level or 0))
+        for query in queries
+        for user_id, score_id, score, level in query.tuples()
+    }
+
+
+def _write_levels(rows: list[tuple[int, int, float]]) -> int:
+    """Rewrite Level/Progress for many rows with one CASE update per chunk."""
+    s = database.ServerScores
+    written = 0
+    with database.db.atomic():
+        for i in range(0, len(rows), _LEVEL_WRITE_CHUNK):
+            chunk = rows[i : i + _LEVEL_WRITE_CHUNK]
+            written += (
+                s.update(
+                    Level=Case(s.ScoreID, [(sid, level) for sid, level, _ in chunk]),
+                    Progress=Case(s.ScoreID, [(sid, progress) for sid, _, progress in chunk]),
+                )
+                .where(s.ScoreID.in_([sid for sid, _, _ in chunk]))
+                .execute()
+            )
+    return written
+
+
+async def build_audit_plan(
+    guild: discord.Guild, user_ids: set[int] | None = None
+) -> tuple[int, list[AuditEntry]]:
+    """
+    Diff members against their scores: two queries (scores and the role map),
+    then pure in-memory planning. With `user_ids` only those members are
+    checked; otherwise the whole guild. Returns (members scanned, entries).
+    """
+    if user_ids is not None:
+        members = [m for m in map(guild.get_member, user_ids) if m is not None]
+        if not members:
+            return 0, []
+    else:
+        members = guild.members
+
+    # Buffered XP must be on disk before the snapshot or we would plan stale levels.
+    await xp_accumulator.flush()
+    lookup = None if user_ids is None else [m.id for m in members]
+    scores = await run_db(_load_scores, guild.id, lookup)
+    roles = await level_role_map.refresh(guild.id)
+
+    scanned = 0
+    entries: list[AuditEntry] = []
+    for member in members:
+        if member.bot:
+            continue
+        row = scores.get(member.id)
+        if row is None:
+            continue
+        scanned += 1
+
+        score_id, score, stored_level = row
+        level, progress, _ = calculate_level(score)
+        role_id = roles.role_id_for(level)
+        target = guild.get_role(role_id) if role_id else None
+        plan = plan_level_roles(member, target, roles.role_ids)
+
+        if plan or level != stored_level:
+            entries.append(AuditEntry(member, score_id, score, stored_level, level, progress, plan))
+
+    return scanned, entries
+
+
+async def _apply_plans(entries: list[AuditEntry], reason: str):
+    pending = iter([e for e in entries if e.plan])
+
+    async def worker():
+        # Workers share one iterator, so at most AUDIT_CONCURRENCY edits are in flight.
+        for entry in pending:
+            await _rest_budget.acquire()
+            ok = await apply_role_plan(entry.member, entry.plan, reason)
+            entry.status = "applied" if ok else "failed"
+
+    await asyncio.gather(*(worker() for _ in range(AUDIT_CONCURRENCY)))
+
+
+async def run_level_audit(
+    guild: discord.Guild,
+    *,
+    dry_run: bool = False,
+    full: bool = False,
+    reason: str = "Level role audit",
+) -> AuditReport:
+    """
+    Plan and (unless dry_run) apply level and level-role fixes for a guild.
+
+    By default only members marked in `dirty_members` are checked. A full sweep
+    runs when asked for, on the first audit since boot, and after the guild's
+    level roles changed.
+    """
+    started = time.monotonic()
+    full = full or dirty_members.needs_full(guild.id)
+    report = AuditReport(guild, dry_run, full)
+
+    if dry_run:
+        # Previewing must not consume the dirty set.
+        user_ids = None if full else set(dirty_members.peek(guild.id))
+    else:
+        # Taken up front so members marked while we work wait for the next run.
+        user_ids = dirty_members.take(guild.id)
+        if full:
+            user_ids = None
+
+    try:
+        report.scanned, report.entries = await build_audit_plan(guild, user_ids)
+    except Exception:
+        if user_ids:
+            dirty_members.mark_many(guild.id, user_ids)
+        raise
+
+    if dry_run:
+        for entry in report.entries:
+            entry.status = "dry run"
+    else:
+        drift = [(e.score_id, e.level, e.progress) for e in report.entries if e.level_drift]
+        if drift:
+            report.levels_fixed = await run_db(_write_levels, drift)
+        for entry in report.entries:
+            if not entry.plan:
+                entry.status = "level only"
+        await _apply_plans(report.entries, reason)
+        report.applied = sum(1 for e in report.entries if e.status == "applied")
+        failed = [e.member.id for e in report.entries if e.status == "failed"]
+        report.failed = len(failed)
+        # Retry failures on the next run.
+        dirty_members.mark_many(guild.id, failed)
+        if full:
+            dirty_members.swept(guild.id)
+
+    report.elapsed = time.monotonic() - started
+    _log.info(
+        f"🔍 Level audit for {guild.name}: {report.scanned} scanned, "
+        f"{report.role_changes} role changes, {report.applied} applied, "
+        f"{report.failed} failed{' (dry run)' if dry_run else ''}{' [full]' if full else ''}."
+    )
+    return report
+
+
+async def post_audit_report(channel: discord.abc.Messageable, report: AuditReport):
+    """Queue the summary embed with the per-member CSV attached."""
+    log_dispatcher.send(channel, embed=report.to_embed(), file=report.to_file())
@@ -1,28 +1,42 @@
 # utils/level_system/__ls_commands.py
 
+from typing import Literal
+
 import discord
 from discord.ext import commands
 from discord import app_commands, Embed, Color, File
 
-import asyncio
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.admin.admin_core.__admin_commands import has_admin_level
-from utils.admin.bot_management.__bm_logic import config
+from utils.admin.bot_management.__bm_logic import config, fetch_bot_data_for_server
 from utils.helpers.__logging_module import get_log
 from utils.core_features.__common import calculate_level
 from .__ls_logic import (
     create_and_order_roles,
-    sync_tatsu_score_for_user,
-    get_role_for_level,
-    get_tatsu_score,
     score_required_for_level,
 )
 
-from .__ls_views import LeaderboardView  # Add this import at the top
+from .__ls_audit import post_audit_report, run_level_audit
+from .__ls_economy import plan_economy
+from .__ls_leaderboard import leaderboard_for
+from .__ls_rank_index import rank_index
+from .__ls_role_map import level_role_map
+from .__ls_tatsu_import import TatsuError, tatsu_importer
+from .__ls_views import EconomyConfirmView, LeaderboardView
 
 _log = get_log(__name__)
 
 
+def _load_score(guild_id: int, user_id: int) -> int | None:
+    s = database.ServerScores
+    return (
+        s.select(s.Score)
+        .where((s.ServerID == guild_id) & (s.DiscordLongID == user_id))
+        .scalar()
+    )
+
+
 class LevelSystemCommands(commands.GroupCog, name="levels"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -67,8 +81,9 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
         name="sync_tatsu",
         description="Sync scores from Tatsu for all users (MRP guild only).",
     )
-    async def sync_tatsu_scores(self, interaction: discord.Interaction):
-        """Fetch and update Tatsu XP only for users with outdated scores."""
+    @app_commands.describe(restart="Start over instead of resuming an interrupted sync.")
+    async def sync_tatsu_scores(self, interaction: discord.Interaction, restart: bool = False):
+        """Import Tatsu XP for all members, resuming an interrupted run when possible."""
         await interaction.response.defer(ephemeral=True)
 
         MRPguild_id = config.get("MRP")
@@ -78,79 +93,58 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
             )
             return
 
-        members = [m for m in interaction.guild.members if not m.bot]
-        _log.info(
-            f"Starting Tatsu sync (only outdated) for {len(members)} members in {interaction.guild.name}"
-        )
+        if tatsu_importer.is_running(interaction.guild.id):
+            await interaction.followup.send(
+                "⏳ A Tatsu sync is already running for this server.", ephemeral=True
+            )
+            return
 
-        updated = 0
-        skipped = 0
-        failed = 0
-
-        for index, member in enumerate(members, start=1):
-            try:
-                # Get local XP from ServerScores
-                local_entry = database.ServerScores.get_or_none(
-                    (database.ServerScores.ServerID == str(interaction.guild.id))
-                    & (database.ServerScores.DiscordLongID == str(member.id))
-                )
-                local_xp = (
-                    int(local_entry.Score) if local_entry and local_entry.Score else 0
-                )
-
-                # Get current Tatsu XP via API
-                result = await get_tatsu_score(member.id, member.guild.id)
-                current_xp = int(result.score) if result else 0
-                _log.debug(
-                    f"Fetching Tatsu score for user {result.user_id} in server {local_entry.ServerID}.Tatsu Score is:{current_xp}, Portalbot scor is:{local_xp}"
-                )
-
-                # Compare and update if different
-                if current_xp != local_xp:
-                    await sync_tatsu_score_for_user(
-                        self.bot,
-                        guild_id=member.guild.id,
-                        user_id=member.id,
-                        user_name=member.name,
-                    )
-                    updated += 1
-                else:
-                    skipped += 1
-
-            except Exception as e:
-                _log.warning(f"Tatsu sync failed for {member.name}: {e}", exc_info=True)
-                failed += 1
-
-            await asyncio.sleep(1.2)  # Respect Tatsu API rate limits
-
-            if index % 10 == 0:
-                _log.info(f"Tatsu sync progress: {index}/{len(members)}")
+        try:
+            result = await tatsu_importer.run(interaction.guild, restart=restart)
+        except TatsuError as e:
+            _log.warning(f"Tatsu sync stopped in {interaction.guild.name}: {e}")
+            await interaction.followup.send(
+                f"⚠️ Tatsu sync stopped: {e}\nRun the command again to resume.",
+                ephemeral=True,
+            )
+            return
+        except Exception as e:
+            _log.exception(f"Tatsu sync failed in {interaction.guild.name}: {e}")
+            await interaction.followup.send(
+                "❌ The Tatsu sync hit an unexpected error. Progress so far is saved; "
+                "run the command again to resume.",
+                ephemeral=True,
+            )
+            return
 
-        await interaction.followup.send(
-            f"✅ Tatsu sync completed.\nUpdated: **{updated}**\nSkipped (already up to date): **{skipped}**\nFailed: **{failed}**",
-            ephemeral=True,
+        message = (
+            f"✅ Tatsu sync completed{' (resumed)' if result.resumed else ''}.\n"
+            f"Updated: **{result.updated}**\nSkipped (already up to date): **{result.unchanged}**\n"
+            f"Failed: **{result.failed}**"
         )
+        if result.failed:
+            message += "\nRun the command again to retry the failed members."
+        await interaction.followup.send(message, ephemeral=True)
 
     @app_commands.command(
         name="leaderboard",
         description="View the top XP earners in this server (paginated).",
     )
-    async def leaderboard(self, interaction: discord.Interaction):
+    @app_commands.describe(period="All-time totals, or XP earned over the last 7/30 days.")
+    async def leaderboard(
+        self,
+        interaction: discord.Interaction,
+        period: Literal["all-time", "weekly", "monthly"] = "all-time",
+    ):
         await interaction.response.defer()
 
-        top_scores = (
-            database.ServerScores.select()
-            .where(database.ServerScores.ServerID == str(interaction.guild.id))
-            .order_by(database.ServerScores.Score.desc())
-        )
-
-        entries = list(top_scores)
-        if not entries:
+        source = leaderboard_for(period)
+        page = await source.first_page(interaction.guild.id, per_page=10)
+        if not page.rows:
             await interaction.followup.send("No users with XP found for this server.")
             return
 
-        view = LeaderboardView(interaction, entries)
-        view.update_buttons()
+        view = LeaderboardView(interaction, page, per_page=10, source=source)
 
         await interaction.followup.send(embed=view.get_embed(), view=view)
 
@@ -163,35 +157,21 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
 
         target = user or interaction.user
 
-        # Get this user's score
-        score_entry = database.ServerScores.get_or_none(
-            (database.ServerScores.DiscordLongID == str(target.id))
-            & (database.ServerScores.ServerID == str(interaction.guild.id))
-        )
+        # Rank and score from the in-memory index (SQL range count while it warms up)
+        standing = await rank_index.standing(interaction.guild.id, target.id)
+        if standing is not None:
+            rank, current_score = standing.rank, standing.score
+        else:
+            rank, current_score = "?", await run_db(_load_score, interaction.guild.id, target.id)
 
-        if not score_entry:
+        if current_score is None:
             await interaction.followup.send(
                 f"{target.display_name} has no XP recorded."
             )
             return
 
-        # Calculate their rank
-        all_scores = (
-            database.ServerScores.select()
-            .where(database.ServerScores.ServerID == str(interaction.guild.id))
-            .order_by(database.ServerScores.Score.desc())
-        )
-
-        rank = 1
-        for entry in all_scores:
-            if entry.DiscordLongID == str(target.id):
-                break
-            rank += 1
-
         # Progress to next level
-        current_level = score_entry.Level
-        current_score = score_entry.Score
-        _, progress, next_level_score = calculate_level(current_score)
+        current_level, progress, next_level_score = calculate_level(current_score)
         to_next = next_level_score - current_score
 
         embed = discord.Embed(
@@ -202,20 +182,34 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
         embed.add_field(name="XP", value=str(current_score))
         embed.add_field(name="Rank", value=f"#{rank}")
         embed.add_field(name="XP to Next Level", value=str(to_next))
+        if standing:
+            embed.add_field(name="Top", value=f"{standing.top_percent:.1f}%")
+
+        nearby = await rank_index.around(interaction.guild.id, target.id, radius=2)
+        if len(nearby) > 1:
+            lines = []
+            for position, user_id, score in nearby:
+                marker = "➡️ " if user_id == target.id else ""
+                lines.append(f"{marker}#{position} <@{user_id}> — {score} XP")
+            embed.add_field(name="Around You", value="\n".join(lines), inline=False)
 
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(
         name="audit_roles",
-        description="Recheck and fix level roles for all server members.",
+        description="Recheck and fix level roles for members changed since the last audit.",
+    )
+    @app_commands.describe(
+        dry_run="Only report what would change without editing roles.",
+        full="Check every member instead of only those changed since the last audit.",
     )
     @has_admin_level(3)
-    async def audit_roles(self, interaction: discord.Interaction):
+    async def audit_roles(
+        self, interaction: discord.Interaction, dry_run: bool = False, full: bool = False
+    ):
         guild = interaction.guild
 
-        bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(guild.id)
-        )
+        bot_data = await fetch_bot_data_for_server(guild.id)
         if not bot_data or not bot_data.member_log:
             await interaction.response.send_message(
                 "⚠️ No member log channel configured in BotData.", ephemeral=True
@@ -231,74 +225,47 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
 
         await interaction.response.defer(ephemeral=True)
 
-        level_roles = database.LeveledRoles.select().where(
-            database.LeveledRoles.ServerID == str(guild.id)
+        report = await run_level_audit(
+            guild, dry_run=dry_run, full=full, reason=f"Level audit by {interaction.user}"
         )
-        level_role_ids = {int(role.RoleID) for role in level_roles if role.RoleID}
-
-        updated_count = 0
+        await post_audit_report(log_channel, report)
 
-        for member in guild.members:
-            if member.bot:
-                continue
-
-            score = database.ServerScores.get_or_none(
-                (database.ServerScores.DiscordLongID == str(member.id))
-                & (database.ServerScores.ServerID == str(guild.id))
+        if dry_run:
+            await interaction.followup.send(
+                f"🧪 Dry run complete. {report.role_changes} member(s) would have level roles fixed. "
+                f"Details posted in {log_channel.mention}."
             )
-            if not score:
-                continue
+        else:
+            await interaction.followup.send(
+                f"✅ Audit complete. {report.applied} member(s) had level roles fixed"
+                f"{f', {report.failed} failed' if report.failed else ''}."
+            )
+
+    @app_commands.command(
+        name="economy",
+        description="Preview and apply XP decay, resets or a full re-level for this server.",
+    )
+    @app_commands.describe(
+        operation="relevel: recompute levels, decay: remove percent of XP, reset: keep percent of XP",
+        percent="Percentage used by decay/reset (ignored for relevel).",
+    )
+    @has_admin_level(4)
+    async def economy(
+        self,
+        interaction: discord.Interaction,
+        operation: Literal["relevel", "decay", "reset"],
+        percent: app_commands.Range[float, 0, 100] = 0.0,
+    ):
+        await interaction.response.defer(ephemeral=True)
 
-            # ✅ Ensure level is correct
-            new_level, progress, next_level_score = calculate_level(score.Score)
-            if score.Level != new_level or score.Progress != progress:
-                score.Level = new_level
-                score.Progress = progress
-                score.save()
-
-            # Determine correct role based on updated level
-            correct_role = await get_role_for_level(score.Level, guild)
-            current_roles = [r for r in member.roles if r.id in level_role_ids]
-
-            needs_fix = False
-
-            # Remove incorrect roles
-            to_remove = [
-                r
-                for r in current_roles
-                if correct_role is None or r.id != correct_role.id
-            ]
-            if to_remove:
-                await member.remove_roles(*to_remove)
-                needs_fix = True
-
-            # Add correct role if not already assigned
-            if correct_role and correct_role not in member.roles:
-                await member.add_roles(correct_role)
-                needs_fix = True
-
-            if needs_fix:
-                updated_count += 1
-                embed = discord.Embed(
-                    title="🔧 Leveled Role Adjusted",
-                    description=(
-                        f"**User:** {member.mention} (`{member.name}`)\n"
-                        f"**Level:** {score.Level}\n"
-                        f"**Assigned Role:** {correct_role.mention if correct_role else '❌ None'}"
-                    ),
-                    color=discord.Color.orange(),
-                    timestamp=discord.utils.utcnow(),
-                )
-                embed.set_footer(text=f"User ID: {member.id}")
-                embed.set_thumbnail(url=member.display_avatar.url)
-
-                try:
-                    await log_channel.send(embed=embed)
-                except discord.Forbidden:
-                    _log.warning(f"Cannot send audit log to #{log_channel.name}")
+        plan = await plan_economy(interaction.guild.id, operation, percent)
+        if not len(plan):
+            await interaction.followup.send("No users with XP found for this server.")
+            return
 
+        view = EconomyConfirmView(interaction, operation, percent)
         await interaction.followup.send(
-            f"✅ Audit complete. {updated_count} member(s) had level roles fixed."
+            embed=plan.to_embed(interaction.guild.name), view=view, ephemeral=True
         )
 
     @app_commands.command(
@@ -307,13 +274,9 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
     async def list_roles(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=False)
 
-        roles = (
-            database.LeveledRoles.select()
-            .where(database.LeveledRoles.ServerID == str(interaction.guild.id))
-            .order_by(database.LeveledRoles.LevelThreshold.asc())
-        )
+        level_roles = await level_role_map.get(interaction.guild.id)
 
-        if not roles:
+        if not level_roles.role_ids:
             await interaction.followup.send(
                 "⚠️ No level roles are configured for this server."
             )
@@ -333,10 +296,11 @@ class LevelSystemCommands(commands.GroupCog, name="levels"):
         )
 
         lines = []
-        for i, role_entry in enumerate(roles, start=1):
-            level = int(role_entry.LevelThreshold)
+        for level, role_id in enumerate(level_roles.by_level):
+            if not role_id:
+                continue
             score = score_required_for_level(level)
-            role = interaction.guild.get_role(int(role_entry.RoleID))
+            role = interaction.guild.get_role(role_id)
             if role:
                 lines.append(f"[{level}] {role.mention} ({score})")
 
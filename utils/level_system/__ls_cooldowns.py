@@ -0,0 +1,66 @@
+# utils/level_system/__ls_cooldowns.py
+
+import datetime
+import time
+
+from utils.helpers.__logging_module import get_log
+
+_log = get_log("level_system.cooldowns")
+
+
+class CooldownGate:
+    """
+    Per-guild table of user_id -> epoch seconds of the last XP award.
+
+    Consulted before any I/O in on_message. Unknown users are not on cooldown;
+    the accumulator seeds the table from LastMessageTimestamp when it first
+    loads a member, and entries older than their guild's cooldown are evicted
+    by sweep() since they can no longer block anything.
+    """
+
+    def __init__(self):
+        self._last_award: dict[int, dict[int, float]] = {}
+        self._cooldowns: dict[int, int] = {}
+
+    def on_cooldown(self, guild_id: int, user_id: int, cooldown_time: int) -> bool:
+        self._cooldowns[guild_id] = cooldown_time
+        if cooldown_time <= 0:
+            return False
+        last = self._last_award.get(guild_id, {}).get(user_id)
+        return last is not None and time.time() - last < cooldown_time
+
+    def mark(self, guild_id: int, user_id: int, when: float | None = None):
+        self._last_award.setdefault(guild_id, {})[user_id] = (
+            time.time() if when is None else when
+        )
+
+    def seed(self, guild_id: int, user_id: int, last: datetime.datetime | None):
+        """Record a persisted LastMessageTimestamp (naive UTC) unless we already know better."""
+        if last is None:
+            return
+        when = last.replace(tzinfo=datetime.timezone.utc).timestamp()
+        table = self._last_award.setdefault(guild_id, {})
+        if table.get(user_id, 0.0) < when:
+            table[user_id] = when
+
+    def sweep(self) -> int:
+        """Evict entries that have outlived their guild's cooldown. Returns the count removed."""
+        now = time.time()
+        removed = 0
+        for guild_id, table in list(self._last_award.items()):
+            ttl = self._cooldowns.get(guild_id, 0)
+            expired = [uid for uid, ts in table.items() if now - ts >= ttl]
+            for uid in expired:
+                del table[uid]
+            removed += len(expired)
+            if not table:
+                del self._last_award[guild_id]
+        if removed:
+            _log.debug(f"🧹 Evicted {removed} expired XP cooldown entries.")
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._last_award.values())
+
+
+cooldown_gate = CooldownGate()
@@ -0,0 +1,52 @@
+# utils/level_system/__ls_dirty.py
+
+from utils.helpers.__logging_module import get_log
+
+_log = get_log("level_system.dirty")
+
+
+class DirtyMembers:
+    """
+    (guild, member) pairs whose level roles may be out of date since the last
+    audit. Level transitions, score imports and level-role edits mark members;
+    scheduled audits then only look at those instead of the whole guild.
+
+    The set lives in memory, so a guild is due a full sweep until one has
+    completed since boot, and again whenever its role map changes.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, set[int]] = {}
+        self._needs_full: set[int] = set()
+        self._swept: set[int] = set()
+
+    def mark(self, guild_id: int, user_id: int):
+        self._guilds.setdefault(guild_id, set()).add(user_id)
+
+    def mark_many(self, guild_id: int, user_ids):
+        self._guilds.setdefault(guild_id, set()).update(user_ids)
+
+    def require_full(self, guild_id: int):
+        """Every member may be affected (e.g. the level roles were rebuilt)."""
+        self._needs_full.add(guild_id)
+
+    def needs_full(self, guild_id: int) -> bool:
+        return guild_id in self._needs_full or guild_id not in self._swept
+
+    def peek(self, guild_id: int) -> frozenset[int]:
+        return frozenset(self._guilds.get(guild_id, ()))
+
+    def take(self, guild_id: int) -> set[int]:
+        """Remove and return the guild's dirty members. Marks made later are kept."""
+        return self._guilds.pop(guild_id, set())
+
+    def swept(self, guild_id: int):
+        """A full sweep finished; anything marked before it is covered."""
+        self._swept.add(guild_id)
+        self._needs_full.discard(guild_id)
+
+    def count(self, guild_id: int) -> int:
+        return len(self._guilds.get(guild_id, ()))
+
+
+dirty_members = DirtyMembers()
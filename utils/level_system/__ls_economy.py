@@ -0,0 +1,245 @@
+# utils/level_system/__ls_economy.py
+
+import time
+
+import discord
+
+try:
+    import numpy as np
+except ImportError:  # optional: fall back to calculate_level per row
+    np = None
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.core_features.__common import calculate_level
+from utils.helpers.__logging_module import get_log
+from .__ls_accumulator import xp_accumulator
+from .__ls_dirty import dirty_members
+from .__ls_leaderboard import leaderboard
+from .__ls_rank_index import rank_index
+
+_log = get_log("level_system.economy")
+
+OPERATIONS = {
+    "relevel": "Recompute Level/Progress from the current scores",
+    "decay": "Remove a percentage of everyone's XP",
+    "reset": "Keep only a percentage of everyone's XP (0 = full reset)",
+}
+
+_TEMP_TABLE = "tmp_score_rebalance"
+_INSERT_CHUNK = 1000
+
+
+def levels_for_scores(scores):
+    """
+    Vectorised calculate_level over a score column. Returns (levels, progress)
+    with exactly the values calculate_level would give for each score.
+    """
+    if np is None:
+        pairs = [calculate_level(int(s))[:2] for s in scores]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    s = np.maximum(np.asarray(scores, dtype=np.int64), 0)
+    high = np.floor(np.sqrt(s // 100)).astype(np.int64)
+    levels = np.where(s == 0, 0, np.where(s < 400, 1, high))
+    prev = high**2 * 100
+    span = (high + 1) ** 2 * 100 - prev
+    progress = np.where(
+        s == 0, 0.0, np.where(s < 400, s / 400.0, (s - prev) / np.maximum(span, 1))
+    )
+    return levels, progress
+
+
+def _factor_bp(operation: str, percent: float) -> int:
+    """Share of each score kept, in basis points (integer maths matches SQL exactly)."""
+    kept = 100 - percent if operation == "decay" else percent
+    return min(10000, max(0, round(kept * 100)))
+
+
+def _apply_operation(scores, operation: str, percent: float):
+    if operation == "relevel":
+        return scores
+    bp = _factor_bp(operation, percent)
+    if np is None:
+        return [s * bp // 10000 for s in scores]
+    return np.asarray(scores, dtype=np.int64) * bp // 10000
+
+
+class EconomyPlan:
+    """Before/after columns for every score row of a guild."""
+
+    __slots__ = (
+        "guild_id", "operation", "percent", "score_ids", "old_scores", "old_levels",
+        "old_progress", "new_scores", "new_levels", "new_progress", "compute_ms",
+    )
+
+    def __init__(self, guild_id: int, operation: str, percent: float, columns):
+        self.guild_id = guild_id
+        self.operation = operation
+        self.percent = percent
+        self.score_ids, self.old_scores, self.old_levels, self.old_progress = columns
+
+        started = time.perf_counter()
+        self.new_scores = _apply_operation(self.old_scores, operation, percent)
+        self.new_levels, self.new_progress = levels_for_scores(self.new_scores)
+        self.compute_ms = (time.perf_counter() - started) * 1000
+
+    def __len__(self) -> int:
+        return len(self.score_ids)
+
+    def changed_rows(self) -> list[tuple[int, int, int, float]]:
+        """(ScoreID, Score, Level, Progress) for rows whose stored values would change."""
+        if np is not None:
+            mask = (
+                (self.new_scores != self.old_scores)
+                | (self.new_levels != self.old_levels)
+                | (np.rint(self.new_progress) != self.old_progress)
+            )
+            idx = np.flatnonzero(mask)
+            return list(
+                zip(
+                    self.score_ids[idx].tolist(),
+                    self.new_scores[idx].tolist(),
+                    self.new_levels[idx].tolist(),
+                    self.new_progress[idx].tolist(),
+                )
+            )
+        return [
+            row
+            for row, old in zip(
+                zip(self.score_ids, self.new_scores, self.new_levels, self.new_progress),
+                zip(self.old_scores, self.old_levels, self.old_progress),
+            )
+            if (row[1], row[2], round(row[3])) != old
+        ]
+
+    def histogram(self) -> list[tuple[int, int]]:
+        """[(level delta, members)] sorted by delta."""
+        if np is not None:
+            deltas, counts = np.unique(self.new_levels - self.old_levels, return_counts=True)
+            return list(zip(deltas.tolist(), counts.tolist()))
+        counts: dict[int, int] = {}
+        for new, old in zip(self.new_levels, self.old_levels):
+            counts[new - old] = counts.get(new - old, 0) + 1
+        return sorted(counts.items())
+
+    def to_embed(self, guild_name: str, applied: bool = False) -> discord.Embed:
+        label = OPERATIONS[self.operation]
+        if self.operation != "relevel":
+            label += f" ({self.percent:g}%)"
+        embed = discord.Embed(
+            title=f"{'✅ Economy Updated' if applied else '📊 Economy Preview'}: {self.operation}",
+            description=label,
+            color=discord.Color.green() if applied else discord.Color.gold(),
+            timestamp=discord.utils.utcnow(),
+        )
+
+        histogram = self.histogram()
+        if histogram:
+            widest = max(count for _, count in histogram)
+            lines = [
+                f"{delta:+4d} │{'█' * max(1, round(20 * count / widest))} {count}"
+                for delta, count in histogram[:15]
+            ]
+            if len(histogram) > 15:
+                lines.append(f"… {len(histogram) - 15} more")
+            embed.add_field(
+                name="Level change → members", value="```\n" + "\n".join(lines) + "\n```", inline=False
+            )
+
+        old_total = int(np.sum(self.old_scores)) if np is not None else sum(self.old_scores)
+        new_total = int(np.sum(self.new_scores)) if np is not None else sum(self.new_scores)
+        embed.add_field(name="Rows", value=str(len(self)))
+        embed.add_field(name="Rows Changed", value=str(len(self.changed_rows())))
+        embed.add_field(name="Total XP", value=f"{old_total:,} → {new_total:,}")
+        embed.set_footer(text=f"{guild_name} • computed in {self.compute_ms:.1f} ms")
+        return embed
+
+
+def _load_columns(guild_id: int, for_update: bool = False):
+    s = database.ServerScores
+    query = s.select(s.ScoreID, s.Score, s.Level, s.Progress).where(s.ServerID == guild_id)
+    if for_update:
+        query = query.for_update()
+    rows = list(query.tuples())
+    if np is None:
+        return (
+            [r[0] for r in rows],
+            [int(r[1] or 0) for r in rows],
+            [int(r[2] or 0) for r in rows],
+            [int(r[3] or 0) for r in rows],
+        )
+    table = np.array(rows, dtype=np.int64).reshape(-1, 4) if rows else np.zeros((0, 4), np.int64)
+    return table[:, 0], table[:, 1], table[:, 2], table[:, 3]
+
+
+def _apply_plan(guild_id: int, operation: str, percent: float) -> tuple[EconomyPlan, int]:
+    """
+    Lock the guild's score rows, plan from them, and write every changed row
+    with one UPDATE ... JOIN against a temporary table of new Level/Progress.
+
+    Scores are rewritten from the live column (Score * bp DIV 10000), never
+    from the snapshot, and relevel leaves them alone entirely. The rows stay
+    locked until commit, so the staged levels match the scores written.
+    Everything runs on a single pooled connection.
+    """
+    db = database.db
+    db.execute_sql(f"DROP TEMPORARY TABLE IF EXISTS {_TEMP_TABLE}")
+    db.execute_sql(
+        f"CREATE TEMPORARY TABLE {_TEMP_TABLE} "
+        "(ScoreID INT PRIMARY KEY, Level INT NOT NULL, Progress DOUBLE NOT NULL)"
+    )
+    try:
+        with db.atomic():
+            plan = EconomyPlan(guild_id, operation, percent, _load_columns(guild_id, for_update=True))
+            rows = [(score_id, level, progress) for score_id, _, level, progress in plan.changed_rows()]
+            if not rows:
+                return plan, 0
+            for i in range(0, len(rows), _INSERT_CHUNK):
+                chunk = rows[i : i + _INSERT_CHUNK]
+                sql = (
+                    f"INSERT INTO {_TEMP_TABLE} (ScoreID, Level, Progress) VALUES "
+                    + ", ".join(["(%s, %s, %s)"] * len(chunk))
+                )
+                db.execute_sql(sql, [value for row in chunk for value in row])
+            if operation == "relevel":
+                cursor = db.execute_sql(
+                    f"UPDATE serverscores s JOIN {_TEMP_TABLE} t ON s.ScoreID = t.ScoreID "
+                    "SET s.Level = t.Level, s.Progress = t.Progress"
+                )
+            else:
+                cursor = db.execute_sql(
+                    f"UPDATE serverscores s JOIN {_TEMP_TABLE} t ON s.ScoreID = t.ScoreID "
+                    "SET s.Score = s.Score * %s DIV 10000, s.Level = t.Level, s.Progress = t.Progress",
+                    (_factor_bp(operation, percent),),
+                )
+        return plan, cursor.rowcount
+    finally:
+        db.execute_sql(f"DROP TEMPORARY TABLE IF EXISTS {_TEMP_TABLE}")
+
+
+async def plan_economy(guild_id: int, operation: str, percent: float = 0) -> EconomyPlan:
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown economy operation: {operation}")
+    # Buffered XP belongs in the snapshot, otherwise it would escape the change.
+    await xp_accumulator.flush()
+    columns = await run_db(_load_columns, guild_id)
+    return EconomyPlan(guild_id, operation, percent, columns)
+
+
+async def apply_economy(guild_id: int, operation: str, percent: float = 0) -> EconomyPlan:
+    """Re-plan from locked, fresh rows and write every changed row in one set-based update."""
+    # Awards for the guild wait until the write commits; its cached members are
+    # flushed first and reload the new scores and levels afterwards.
+    async with xp_accumulator.paused(guild_id):
+        plan, written = await run_db(_apply_plan, guild_id, operation, percent)
+
+    rank_index.invalidate(guild_id)
+    leaderboard.invalidate(guild_id)
+    dirty_members.require_full(guild_id)
+
+    _log.info(
+        f"⚖️ Economy {operation} ({percent:g}%) on guild {guild_id}: "
+        f"{written}/{len(plan)} rows updated, computed in {plan.compute_ms:.1f} ms."
+    )
+    return plan
@@ -0,0 +1,207 @@
+# utils/level_system/__ls_leaderboard.py
+
+import os
+import time
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+from .__ls_activity import PERIOD_DAYS, xp_activity
+
+_log = get_log("level_system.leaderboard")
+
+# Top-N rows per guild kept in memory and refreshed at most every TTL seconds.
+LEADERBOARD_SNAPSHOT_SIZE = max(10, int(os.getenv("leaderboard_snapshot_size", "100")))
+LEADERBOARD_SNAPSHOT_TTL = max(5, int(os.getenv("leaderboard_snapshot_ttl", "60")))
+
+
+class LeaderboardRow:
+    __slots__ = ("score_id", "user_id", "name", "level", "score")
+
+    def __init__(self, score_id: int, user_id: int, name: str, level: int, score: int):
+        self.score_id = score_id
+        self.user_id = user_id
+        self.name = name
+        self.level = level
+        self.score = score
+
+    @property
+    def cursor(self) -> tuple[int, int]:
+        return self.score, self.score_id
+
+
+class LeaderboardPage:
+    __slots__ = ("rows", "has_prev", "has_next")
+
+    def __init__(self, rows: list[LeaderboardRow], has_prev: bool, has_next: bool):
+        self.rows = rows
+        self.has_prev = has_prev
+        self.has_next = has_next
+
+
+def _select():
+    s = database.ServerScores
+    return s.select(s.ScoreID, s.DiscordLongID, s.DiscordName, s.Level, s.Score)
+
+
+def _rows(query) -> list[LeaderboardRow]:
+    return [LeaderboardRow(*row) for row in query.tuples()]
+
+
+def _fetch_after(guild_id: int, cursor: tuple[int, int] | None, limit: int):
+    """Rows ranked below `cursor` (or the top rows), highest first. Keyset on (Score, ScoreID)."""
+    s = database.ServerScores
+    query = _select().where(s.ServerID == guild_id)
+    if cursor is not None:
+        score, score_id = cursor
+        query = query.where((s.Score < score) | ((s.Score == score) & (s.ScoreID < score_id)))
+    return _rows(query.order_by(s.Score.desc(), s.ScoreID.desc()).limit(limit))
+
+
+def _fetch_before(guild_id: int, cursor: tuple[int, int], limit: int):
+    """Rows ranked directly above `cursor`, returned highest first."""
+    s = database.ServerScores
+    score, score_id = cursor
+    query = (
+        _select()
+        .where(
+            (s.ServerID == guild_id)
+            & ((s.Score > score) | ((s.Score == score) & (s.ScoreID > score_id)))
+        )
+        .order_by(s.Score.asc(), s.ScoreID.asc())
+        .limit(limit)
+    )
+    return list(reversed(_rows(query)))
+
+
+class _Snapshot:
+    __slots__ = ("rows", "complete", "loaded_at")
+
+    def __init__(self, rows: list[LeaderboardRow], complete: bool):
+        self.rows = rows
+        self.complete = complete  # True when the guild has no rows beyond these
+        self.loaded_at = time.monotonic()
+
+    def index_of(self, cursor: tuple[int, int]) -> int | None:
+        for i, row in enumerate(self.rows):
+            if row.cursor == cursor:
+                return i
+        return None
+
+
+class Leaderboard:
+    """
+    Page source for /levels leaderboard. The first pages come from a cached
+    top-N snapshot; anything deeper is a keyset query, so each page costs the
+    same regardless of guild size and nothing beyond one page is kept alive.
+    """
+
+    description = "Top XP earners"
+
+    def __init__(self):
+        self._snapshots: dict[int, _Snapshot] = {}
+
+    async def _load(self, guild_id: int) -> _Snapshot:
+        rows = await run_db(_fetch_after, guild_id, None, LEADERBOARD_SNAPSHOT_SIZE + 1)
+        return _Snapshot(rows[:LEADERBOARD_SNAPSHOT_SIZE], len(rows) <= LEADERBOARD_SNAPSHOT_SIZE)
+
+    async def _after(self, guild_id: int, cursor: tuple[int, int], limit: int):
+        return await run_db(_fetch_after, guild_id, cursor, limit)
+
+    async def _before(self, guild_id: int, cursor: tuple[int, int], limit: int):
+        return await run_db(_fetch_before, guild_id, cursor, limit)
+
+    async def _snapshot(self, guild_id: int) -> _Snapshot:
+        snap = self._snapshots.get(guild_id)
+        if snap is None or time.monotonic() - snap.loaded_at > LEADERBOARD_SNAPSHOT_TTL:
+            snap = await self._load(guild_id)
+            self._snapshots[guild_id] = snap
+        return snap
+
+    def invalidate(self, guild_id: int | None = None):
+        if guild_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(guild_id, None)
+
+    async def first_page(self, guild_id: int, per_page: int) -> LeaderboardPage:
+        snap = await self._snapshot(guild_id)
+        rows = snap.rows[:per_page]
+        has_next = len(snap.rows) > per_page or not snap.complete
+        return LeaderboardPage(rows, False, has_next and bool(rows))
+
+    async def page_after(
+        self, guild_id: int, cursor: tuple[int, int], per_page: int
+    ) -> LeaderboardPage:
+        snap = await self._snapshot(guild_id)
+        i = snap.index_of(cursor)
+        if i is not None and (i + 1 + per_page < len(snap.rows) or snap.complete):
+            rows = snap.rows[i + 1 : i + 1 + per_page]
+            has_next = i + 1 + per_page < len(snap.rows) or not snap.complete
+            return LeaderboardPage(rows, True, has_next)
+
+        rows = await self._after(guild_id, cursor, per_page + 1)
+        return LeaderboardPage(rows[:per_page], True, len(rows) > per_page)
+
+    async def page_before(
+        self, guild_id: int, cursor: tuple[int, int], per_page: int
+    ) -> LeaderboardPage:
+        snap = await self._snapshot(guild_id)
+        i = snap.index_of(cursor)
+        if i is not None:
+            start = max(0, i - per_page)
+            return LeaderboardPage(snap.rows[start:i], start > 0, True)
+
+        rows = await self._before(guild_id, cursor, per_page + 1)
+        return LeaderboardPage(rows[-per_page:], len(rows) > per_page, True)
+
+
+def _member_details(guild_id: int, user_ids: list[int]) -> dict[int, tuple[str, int]]:
+    s = database.ServerScores
+    query = (
+        s.select(s.DiscordLongID, s.DiscordName, s.Level)
+        .where((s.ServerID == guild_id) & s.DiscordLongID.in_(user_ids))
+        .tuples()
+    )
+    return {int(user_id): (name, level) for user_id, name, level in query}
+
+
+class PeriodLeaderboard(Leaderboard):
+    """
+    Most XP earned in a rolling window, summed from the daily buckets. Only the
+    top-N snapshot is served; rows carry window XP as their score and the user
+    ID as the tie-breaking cursor.
+    """
+
+    def __init__(self, period: str):
+        super().__init__()
+        self.period = period
+        self.description = f"Most XP earned in the last {PERIOD_DAYS[period]} days"
+
+    async def _load(self, guild_id: int) -> _Snapshot:
+        totals = await xp_activity.top(guild_id, self.period, LEADERBOARD_SNAPSHOT_SIZE)
+        details = (
+            await run_db(_member_details, guild_id, [user_id for user_id, _ in totals])
+            if totals
+            else {}
+        )
+        rows = [
+            LeaderboardRow(user_id, user_id, *details.get(user_id, (None, 0)), xp)
+            for user_id, xp in totals
+        ]
+        return _Snapshot(rows, True)
+
+    async def _after(self, guild_id: int, cursor: tuple[int, int], limit: int):
+        return []  # cursor fell out of the refreshed snapshot; the view restarts
+
+    async def _before(self, guild_id: int, cursor: tuple[int, int], limit: int):
+        return []
+
+
+leaderboard = Leaderboard()
+period_leaderboards = {period: PeriodLeaderboard(period) for period in PERIOD_DAYS}
+
+
+def leaderboard_for(period: str) -> Leaderboard:
+    """The page source for a /levels leaderboard period ("all-time", "weekly", "monthly")."""
+    return period_leaderboards.get(period, leaderboard)
@@ -1,14 +1,21 @@
 # utils/level_system/__ls_listeners.py
 
 import discord
-from discord.ext import commands
-import random
-import datetime
+from discord.ext import commands, tasks
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
+from utils.helpers.__log_dispatcher import log_dispatcher
 from utils.helpers.__logging_module import get_log
-from utils.core_features.__common import calculate_level
-from .__ls_logic import get_role_for_level
+from .__ls_logic import get_level_role_ids
+from .__ls_reconcile import current_level, reconcile_member
+from .__ls_role_map import level_role_map
+from .__ls_accumulator import XP_FLUSH_INTERVAL, xp_accumulator
+from .__ls_activity import xp_activity
+from .__ls_cooldowns import cooldown_gate
+from .__ls_dirty import dirty_members
+from .__ls_rank_index import rank_index
 
 _log = get_log("level_system")
 score_log = get_log("level_system.score")
@@ -17,6 +24,25 @@ score_log = get_log("level_system.score")
 class LevelSystemListener(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.flush_xp.start()
+
+    async def cog_unload(self):
+        # Runs on reload and on bot.close(); write out whatever is still pending.
+        self.flush_xp.cancel()
+        flushed = await xp_accumulator.flush()
+        await xp_activity.flush()
+        await log_dispatcher.flush()
+        _log.info(f"💾 Flushed pending XP for {flushed} member(s) on unload.")
+
+    @tasks.loop(seconds=XP_FLUSH_INTERVAL)
+    async def flush_xp(self):
+        await xp_accumulator.flush()
+        await xp_activity.flush()
+        cooldown_gate.sweep()
+
+    @flush_xp.error
+    async def flush_xp_error(self, error: Exception):
+        _log.error(f"XP flush loop stopped: {error}", exc_info=error)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -26,143 +52,50 @@ class LevelSystemListener(commands.Cog):
 
         try:
             # Load server config
-            bot_data = database.BotData.get_or_none(
-                database.BotData.server_id == str(message.guild.id)
-            )
+            bot_data = await fetch_bot_data_for_server(message.guild.id)
             if not bot_data:
                 return
 
-            # Respect blocked channels
-            blocked_channels = bot_data.get_blocked_channels()
-            if message.channel.id in blocked_channels:
+            # Respect blocked channels (pre-parsed frozenset on the cached entry)
+            if message.channel.id in bot_data.blocked_channels:
                 return
 
+            # Cooldown gate: answered from memory, before any database I/O
             cooldown_time = int(bot_data.cooldown_time or 0)
-            points_per_message = int(bot_data.points_per_message or 0)
-            user_id = str(message.author.id)
-            username = str(message.author.name)
-
-            # Use a timezone-naive UTC datetime for storage/comparison (consistent)
-            now = datetime.datetime.utcnow()
-            cooldown_delta = datetime.timedelta(seconds=cooldown_time)
-
-            database.db.connect(reuse_if_open=True)
+            if cooldown_gate.on_cooldown(
+                message.guild.id, message.author.id, cooldown_time
+            ):
+                return
 
-            # Ensure a score row exists for this user
-            score, created = database.ServerScores.get_or_create(
-                DiscordLongID=user_id,
-                ServerID=str(message.guild.id),
-                defaults={"Score": 0, "Level": 1, "Progress": 0},
+            username = str(message.author.name)
+            result = await xp_accumulator.award(
+                message.guild.id,
+                message.author.id,
+                username,
+                cooldown_time,
+                int(bot_data.points_per_message or 0),
+            )
+            if result is None:
+                return
+            previous_level, new_level, gained = result
+            xp_activity.record(message.guild.id, message.author.id, gained)
+            rank_index.update(
+                message.guild.id,
+                message.author.id,
+                xp_accumulator.peek_score(message.guild.id, message.author.id),
             )
 
-            # Normalize LastMessageTimestamp to a datetime
-            last = score.LastMessageTimestamp
-            if isinstance(last, (int, float)):
-                # Older rows may store epoch seconds
-                last = datetime.datetime.utcfromtimestamp(last)
-            # If stored as string in some legacy case, ignore and treat as None
-
-            # Guard against future timestamps
-            if isinstance(last, datetime.datetime) and last > now:
+            # Roles only change on level transitions; drift from manual edits is
+            # handled by on_member_update and the audits.
+            if new_level == previous_level:
+                return
+            dirty_members.mark(message.guild.id, message.author.id)
+            plan = await reconcile_member(message.author, new_level)
+            target_role = plan.target
+            if not target_role:
                 score_log.warning(
-                    f"{username}'s timestamp was in the future. Resetting."
+                    f"No mapped role for Level {new_level} in {message.guild.name}"
                 )
-                last = now
-
-            # Cooldown check
-            if isinstance(last, datetime.datetime) and cooldown_time > 0:
-                elapsed = now - last
-                if elapsed < cooldown_delta:
-                    remaining = (cooldown_delta - elapsed).total_seconds()
-                    score_log.debug(
-                        f"{username} is on cooldown ({remaining:.2f}s left)."
-                    )
-                    return
-
-            # Gain XP and recalc level
-            # Ensure positive bounds; if points_per_message is 0, grant 0
-            lower = max(0, points_per_message)
-            upper = max(lower, points_per_message * 3)
-            score_increment = random.randint(lower, upper) if upper > 0 else 0
-
-            previous_level = score.Level
-            score.Score += score_increment
-            new_level, progress, next_level_score = calculate_level(score.Score)
-
-            score_log.debug(
-                f"{username} gained {score_increment} XP → Score: {score.Score}, "
-                f"Level: {previous_level} → {new_level}, Next threshold: {next_level_score}"
-            )
-
-            # Persist
-            score.DiscordName = username
-            score.Level = new_level
-            score.Progress = progress  # store progress within the current level
-            score.LastMessageTimestamp = now
-            score.save()
-
-            # -------------------------------
-            # Sync level role every message
-            # -------------------------------
-            # Collect all configured level-role IDs for this server
-            all_roles = database.LeveledRoles.select().where(
-                database.LeveledRoles.ServerID == str(message.guild.id)
-            )
-            level_role_ids = {int(entry.RoleID) for entry in all_roles if entry.RoleID}
-
-            # Determine correct role for the member's current level
-            target_role = await get_role_for_level(new_level, message.guild)
-
-            # Find any existing level roles on the member
-            member_level_roles = [
-                r for r in message.author.roles if r.id in level_role_ids
-            ]
-            member_level_role_ids = {r.id for r in member_level_roles}
-
-            need_role_change = (
-                target_role and target_role.id not in member_level_role_ids
-            ) or (not target_role and bool(member_level_roles))
-
-            if need_role_change:
-                # Remove any old level roles
-                if member_level_roles:
-                    try:
-                        await message.author.remove_roles(
-                            *member_level_roles, reason="Level role sync"
-                        )
-                        score_log.debug(
-                            f"Removed old level roles from {username}: {[r.name for r in member_level_roles]}"
-                        )
-                    except discord.Forbidden:
-                        score_log.warning(
-                            f"Missing permissions to remove roles from {username}."
-                        )
-                    except discord.HTTPException as e:
-                        score_log.warning(
-                            f"HTTP error removing roles from {username}: {e}"
-                        )
-
-                # Assign the correct role for the current level
-                if target_role:
-                    try:
-                        await message.author.add_roles(
-                            target_role, reason="Level role sync"
-                        )
-                        score_log.info(
-                            f"Assigned role '{target_role.name}' to {username}"
-                        )
-                    except discord.Forbidden:
-                        score_log.warning(
-                            f"Missing permissions to add role '{target_role}' to {username}."
-                        )
-                    except discord.HTTPException as e:
-                        score_log.warning(
-                            f"HTTP error adding role '{target_role}' to {username}: {e}"
-                        )
-                else:
-                    score_log.warning(
-                        f"No mapped role for Level {new_level} in {message.guild.name}"
-                    )
 
             # Announce only on actual level-up
             if new_level > previous_level:
@@ -185,38 +118,62 @@ class LevelSystemListener(commands.Cog):
                             "Cannot send level-up message in this channel (Missing permissions)."
                         )
 
-                # Send level-up log to member_log channel if configured
-                if bot_data.member_log:
-                    log_channel = message.guild.get_channel(int(bot_data.member_log))
+                # Level-up log to member_log; the dispatcher merges bursts into one embed
+                member_log_id = bot_data.channel_id("member_log")
+                if member_log_id:
+                    log_channel = message.guild.get_channel(member_log_id)
                     if log_channel:
-                        embed = discord.Embed(
-                            title=f"📈 {username} leveled up!",
-                            description=(
-                                f"**User:** {message.author.mention} (`{username}`)\n"
-                                f"**New Level:** {new_level}\n"
-                                f"**Assigned Role:** {target_role.mention if target_role else 'None'}\n"
-                                f"**Server:** {message.guild.name}"
-                            ),
+                        log_dispatcher.post(
+                            log_channel,
+                            "📈 Level Ups",
+                            f"{message.author.mention} (`{username}`) reached **Level {new_level}**"
+                            + (f" → {target_role.mention}" if target_role else ""),
                             color=discord.Color.green(),
-                            timestamp=discord.utils.utcnow(),
                         )
-                        embed.set_footer(text=f"User ID: {message.author.id}")
-                        embed.set_thumbnail(url=message.author.display_avatar.url)
-                        try:
-                            await log_channel.send(embed=embed)
-                        except discord.Forbidden:
-                            score_log.warning(
-                                f"Cannot send level-up embed to #{log_channel.name} (Missing permissions)."
-                            )
-                        except discord.HTTPException as e:
-                            score_log.warning(f"HTTP error sending level-up embed: {e}")
 
         except Exception as e:
             _log.error(f"Error processing XP for {message.author}: {e}", exc_info=True)
 
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if after.bot or before.roles == after.roles:
+            return
+        level_role_ids = await get_level_role_ids(after.guild.id)
+        changed = {r.id for r in before.roles} ^ {r.id for r in after.roles}
+        if not changed & level_role_ids:
+            return
+        dirty_members.mark(after.guild.id, after.id)
+        level = await current_level(after.guild.id, after.id)
+        if level is None:
+            return
+        # Our own edits land here too; they produce an empty plan and stop.
+        plan = await reconcile_member(after, level, reason="Level role drift")
+        if plan:
+            score_log.info(f"Reconciled level roles for {after} after a manual change.")
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        roles = level_role_map.peek(role.guild.id)
+        if roles is not None and role.id not in roles.role_ids:
+            return
+        # A deleted level role can never be assigned again; drop its mapping.
+        await run_db(
+            database.LeveledRoles.delete()
+            .where(
+                (database.LeveledRoles.ServerID == role.guild.id)
+                & (database.LeveledRoles.RoleID == role.id)
+            )
+            .execute
+        )
+        await level_role_map.refresh(role.guild.id)
+        dirty_members.require_full(role.guild.id)
+        _log.info(f"🗑️ Level role '{role.name}' deleted in {role.guild.name}; role map refreshed.")
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        roles = level_role_map.peek(after.guild.id)
+        if roles is not None and after.id in roles.role_ids:
+            level_role_map.invalidate(after.guild.id)
 
 
 async def setup(bot: commands.Bot):
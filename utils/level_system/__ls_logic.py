@@ -2,17 +2,16 @@
 
 import aiohttp
 
-import os
 import discord
-from tatsu.wrapper import ApiWrapper
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
 from utils.core_features.__common import calculate_level
+from utils.level_system.__ls_role_map import level_role_map
+from utils.level_system.__ls_dirty import dirty_members
 
 _log = get_log(__name__)
-wrapper = ApiWrapper(os.getenv("tatsu_api_key"))
-_log.info(f"Tatsu API key loaded: {bool(wrapper.key)}")
 
 
 async def create_and_order_roles(guild: discord.Guild):
@@ -119,9 +118,10 @@ async def create_and_order_roles(guild: discord.Guild):
 
         created_roles.append((role, level))
 
-        database.LeveledRoles.get_or_create(
+        await run_db(
+            database.LeveledRoles.get_or_create,
             RoleID=role.id,
-            ServerID=str(guild.id),
+            ServerID=guild.id,
             defaults={"RoleName": role_name, "LevelThreshold": level},
         )
 
@@ -130,69 +130,27 @@ async def create_and_order_roles(guild: discord.Guild):
     await guild.edit_role_positions(
         positions={r: i + 1 for i, (r, _) in enumerate(sorted_roles)}
     )
+    await level_role_map.refresh(guild.id)
+    dirty_members.require_full(guild.id)
 
     _log.info(f"Leveled roles created and ordered in {guild.name}.")
 
 
-async def get_tatsu_score(user_id: int, server_id: int):
-    try:
-        result = await wrapper.get_member_ranking(server_id, user_id)
-        return result
-    except Exception as e:
-        _log.warning(
-            f"Failed to fetch Tatsu stats for {user_id} in {server_id}: {e}",
-            exc_info=True,
-        )
-        return None
-
-
-async def sync_tatsu_score_for_user(bot, guild_id: int, user_id: int, user_name: str):
-    """
-    Syncs a user's Tatsu XP and level from the API and updates their ServerScores entry.
-    """
-
-    stats = await get_tatsu_score(user_id, guild_id)
-    if not stats:
-        return
-
-    score = stats.score
-
-    entry = database.ServerScores.get_or_none(
-        (database.ServerScores.ServerID == str(guild_id))
-        & (database.ServerScores.DiscordLongID == str(user_id))
-    )
-
-    if entry:
-        if str(entry.Score) == str(score):
-            entry.TatsuXP = score
-            return  # No update needed
-        entry.Score = score
-        entry.TatsuXP = score
-        entry.DiscordName = user_name
-        entry.save()
-    else:
-        database.ServerScores.create(
-            ServerID=str(guild_id),
-            DiscordLongID=str(user_id),
-            DiscordName=user_name,
-            Score=score,
-            TatsuXP=score,
-        )
-
-
 async def get_role_for_level(level: int, guild: discord.Guild) -> discord.Role | None:
     try:
-        entry = database.LeveledRoles.get_or_none(
-            (database.LeveledRoles.LevelThreshold == level)
-            & (database.LeveledRoles.ServerID == str(guild.id))
-        )
-        if entry:
-            return discord.utils.get(guild.roles, id=int(entry.RoleID))  # ← FIXED HERE
+        role_id = (await level_role_map.get(guild.id)).role_id_for(level)
+        if role_id:
+            return guild.get_role(role_id)
     except Exception as e:
         _log.error(f"Error retrieving role for level {level}: {e}")
     return None
 
 
+async def get_level_role_ids(guild_id: int) -> frozenset[int]:
+    """All role IDs configured as level roles in the guild (cached)."""
+    return (await level_role_map.get(guild_id)).role_ids
+
+
 def score_required_for_level(level: int) -> int:
     if level == 1:
         return 1  # unlock level 1 at 1 point
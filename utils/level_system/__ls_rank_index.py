@@ -0,0 +1,267 @@
+# utils/level_system/__ls_rank_index.py
+
+import asyncio
+import os
+from bisect import bisect_left, bisect_right, insort
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+from .__ls_accumulator import xp_accumulator
+
+_log = get_log("level_system.rank_index")
+
+# XP per bucket. Wider buckets mean a smaller tree but longer per-bucket lists.
+RANK_BUCKET_WIDTH = max(1, int(os.getenv("rank_bucket_width", "100")))
+
+
+class _Fenwick:
+    """Binary indexed tree of member counts per score bucket."""
+
+    __slots__ = ("tree",)
+
+    def __init__(self, size: int):
+        self.tree = [0] * (size + 1)
+
+    @property
+    def size(self) -> int:
+        return len(self.tree) - 1
+
+    def add(self, index: int, delta: int):
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """Sum of buckets [0, index]."""
+        total = 0
+        i = min(index + 1, self.size)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k: int) -> int:
+        """Smallest bucket index whose prefix sum reaches k (1-based)."""
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+class GuildRankIndex:
+    """
+    Order-statistics index over one guild's scores.
+
+    A Fenwick tree counts members per score bucket and each bucket keeps a
+    sorted list of (score, user_id), so rank and k-th lookups are a tree walk
+    plus a bisect. Ranks are competition style: 1 + members with a higher score,
+    the same as the SQL fallback.
+    """
+
+    def __init__(self, scores: dict[int, int]):
+        self.scores: dict[int, int] = {}
+        self.buckets: dict[int, list[tuple[int, int]]] = {}
+        top_bucket = max(scores.values(), default=0) // RANK_BUCKET_WIDTH
+        self.tree = _Fenwick(max(16, 1 << (top_bucket + 1).bit_length()))
+        for user_id, score in scores.items():
+            self.set(user_id, score)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def _bucket(self, score: int) -> int:
+        return max(0, score) // RANK_BUCKET_WIDTH
+
+    def _grow(self, bucket: int):
+        size = self.tree.size
+        while size <= bucket:
+            size *= 2
+        tree = _Fenwick(size)
+        for index, members in self.buckets.items():
+            tree.add(index, len(members))
+        self.tree = tree
+
+    def set(self, user_id: int, score: int):
+        old = self.scores.get(user_id)
+        if old == score:
+            return
+        if old is not None:
+            bucket = self._bucket(old)
+            members = self.buckets[bucket]
+            del members[bisect_left(members, (old, user_id))]
+            if not members:
+                del self.buckets[bucket]
+            self.tree.add(bucket, -1)
+
+        bucket = self._bucket(score)
+        if bucket >= self.tree.size:
+            self._grow(bucket)
+        insort(self.buckets.setdefault(bucket, []), (score, user_id))
+        self.tree.add(bucket, 1)
+        self.scores[user_id] = score
+
+    def count_above(self, score: int) -> int:
+        bucket = self._bucket(score)
+        above = len(self.scores) - self.tree.prefix(bucket)
+        members = self.buckets.get(bucket, ())
+        return above + len(members) - bisect_right(members, (score, float("inf")))
+
+    def rank_of(self, user_id: int) -> int | None:
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        return self.count_above(score) + 1
+
+    def position_of(self, user_id: int) -> int | None:
+        """1-based position in leaderboard order (ties broken by user ID)."""
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        bucket = self._bucket(score)
+        members = self.buckets[bucket]
+        above = len(self.scores) - self.tree.prefix(bucket)
+        return above + len(members) - bisect_left(members, (score, user_id))
+
+    def at(self, position: int) -> tuple[int, int] | None:
+        """(user_id, score) at 1-based position, highest score first."""
+        n = len(self.scores)
+        if not 1 <= position <= n:
+            return None
+        k = n - position + 1  # k-th lowest
+        bucket = self.tree.find(k)
+        members = self.buckets[bucket]
+        k -= self.tree.prefix(bucket - 1) if bucket > 0 else 0
+        score, user_id = members[k - 1]
+        return user_id, score
+
+
+class RankStanding:
+    __slots__ = ("rank", "total", "score")
+
+    def __init__(self, rank: int, total: int, score: int):
+        self.rank = rank
+        self.total = total
+        self.score = score
+
+    @property
+    def top_percent(self) -> float:
+        """Share of the guild at or above this member, e.g. 5.0 for "top 5%"."""
+        return 100.0 * self.rank / self.total if self.total else 100.0
+
+
+def _load_guild_scores(guild_id: int) -> dict[int, int]:
+    query = (
+        database.ServerScores.select(
+            database.ServerScores.DiscordLongID, database.ServerScores.Score
+        )
+        .where(database.ServerScores.ServerID == guild_id)
+        .tuples()
+    )
+    return {int(user_id): int(score or 0) for user_id, score in query}
+
+
+def _sql_standing(guild_id: int, user_id: int, score: int | None):
+    """Cold-start fallback: two index range counts on (ServerID, Score)."""
+    if score is None:
+        row = (
+            database.ServerScores.select(database.ServerScores.Score)
+            .where(
+                (database.ServerScores.ServerID == guild_id)
+                & (database.ServerScores.DiscordLongID == user_id)
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        score = row.Score
+    base = database.ServerScores.select().where(database.ServerScores.ServerID == guild_id)
+    above = base.where(database.ServerScores.Score > score).count()
+    return above + 1, base.count(), score
+
+
+class RankIndex:
+    """Per-guild GuildRankIndex instances, built lazily and updated as XP changes."""
+
+    def __init__(self):
+        self._guilds: dict[int, GuildRankIndex] = {}
+        self._loading: dict[int, asyncio.Task] = {}
+
+    def update(self, guild_id: int, user_id: int, score: int):
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.set(user_id, score)
+
+    def invalidate(self, guild_id: int | None = None):
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    async def _build(self, guild_id: int):
+        try:
+            scores = await run_db(_load_guild_scores, guild_id)
+            # Overlay buffered XP that has not been flushed yet.
+            scores.update(xp_accumulator.loaded_scores(guild_id))
+            self._guilds[guild_id] = GuildRankIndex(scores)
+            _log.info(f"🏅 Built rank index for guild {guild_id} ({len(scores)} members).")
+        except Exception as e:
+            _log.error(f"Failed to build rank index for guild {guild_id}: {e}", exc_info=True)
+        finally:
+            self._loading.pop(guild_id, None)
+
+    def _ensure_loading(self, guild_id: int):
+        if guild_id not in self._guilds and guild_id not in self._loading:
+            self._loading[guild_id] = asyncio.create_task(self._build(guild_id))
+
+    def get(self, guild_id: int) -> GuildRankIndex | None:
+        """The built index, or None (and start building it) on a cold guild."""
+        index = self._guilds.get(guild_id)
+        if index is None:
+            self._ensure_loading(guild_id)
+        return index
+
+    async def standing(self, guild_id: int, user_id: int) -> RankStanding | None:
+        index = self.get(guild_id)
+        if index is not None:
+            rank = index.rank_of(user_id)
+            if rank is None:
+                return None
+            return RankStanding(rank, len(index), index.scores[user_id])
+
+        buffered = xp_accumulator.peek_score(guild_id, user_id)
+        result = await run_db(_sql_standing, guild_id, user_id, buffered)
+        return RankStanding(*result) if result else None
+
+    async def around(
+        self, guild_id: int, user_id: int, radius: int = 2
+    ) -> list[tuple[int, int, int]]:
+        """[(rank position, user_id, score)] for members around the user. Needs a built index."""
+        index = self.get(guild_id)
+        if index is None:
+            index = await self.wait_for(guild_id)
+        position = index.position_of(user_id) if index is not None else None
+        if position is None:
+            return []
+        result = []
+        for pos in range(max(1, position - radius), min(len(index), position + radius) + 1):
+            entry = index.at(pos)
+            if entry:
+                result.append((pos, entry[0], entry[1]))
+        return result
+
+    async def wait_for(self, guild_id: int) -> GuildRankIndex | None:
+        self._ensure_loading(guild_id)
+        task = self._loading.get(guild_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return self._guilds.get(guild_id)
+
+
+rank_index = RankIndex()
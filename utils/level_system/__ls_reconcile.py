@@ -0,0 +1,105 @@
+# utils/level_system/__ls_reconcile.py
+
+import discord
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+from .__ls_accumulator import xp_accumulator
+from .__ls_logic import get_level_role_ids, get_role_for_level
+
+_log = get_log("level_system.reconcile")
+
+
+class RolePlan:
+    """Minimal change that leaves a member holding exactly one correct level role."""
+
+    __slots__ = ("target", "add", "remove")
+
+    def __init__(self, target: discord.Role | None, add: list, remove: list):
+        self.target = target
+        self.add = add
+        self.remove = remove
+
+    def __bool__(self) -> bool:
+        return bool(self.add or self.remove)
+
+
+def plan_level_roles(
+    member: discord.Member,
+    target: discord.Role | None,
+    level_role_ids: frozenset[int],
+) -> RolePlan:
+    held = [r for r in member.roles if r.id in level_role_ids]
+    remove = [r for r in held if target is None or r.id != target.id]
+    add = [target] if target is not None and target not in member.roles else []
+    return RolePlan(target, add, remove)
+
+
+async def apply_role_plan(
+    member: discord.Member, plan: RolePlan, reason: str = "Level role sync"
+) -> bool:
+    """
+    Apply a plan with as few REST calls as possible. A single change uses the
+    per-role endpoint, which cannot clobber concurrent role edits. Anything
+    larger becomes one member.edit(roles=...) instead of one call per role.
+    Returns True if Discord was called successfully.
+    """
+    if not plan:
+        return False
+    try:
+        if len(plan.add) + len(plan.remove) == 1:
+            if plan.add:
+                await member.add_roles(plan.add[0], reason=reason)
+            else:
+                await member.remove_roles(plan.remove[0], reason=reason)
+        else:
+            remove_ids = {r.id for r in plan.remove}
+            roles = [
+                r for r in member.roles if not r.is_default() and r.id not in remove_ids
+            ]
+            roles.extend(plan.add)
+            await member.edit(roles=roles, reason=reason)
+    except discord.Forbidden:
+        _log.warning(f"Missing permissions to update level roles for {member}.")
+        return False
+    except discord.HTTPException as e:
+        _log.warning(f"HTTP error updating level roles for {member}: {e}")
+        return False
+
+    _log.debug(
+        f"Level roles for {member}: +{[r.name for r in plan.add]} -{[r.name for r in plan.remove]}"
+    )
+    return True
+
+
+async def reconcile_member(
+    member: discord.Member, level: int, reason: str = "Level role sync"
+) -> RolePlan:
+    """Bring a member's level roles in line with `level`. Returns the plan that was applied."""
+    target = await get_role_for_level(level, member.guild)
+    level_role_ids = await get_level_role_ids(member.guild.id)
+    plan = plan_level_roles(member, target, level_role_ids)
+    if plan:
+        await apply_role_plan(member, plan, reason)
+    return plan
+
+
+def _stored_level(guild_id: int, user_id: int) -> int | None:
+    row = (
+        database.ServerScores.select(database.ServerScores.Level)
+        .where(
+            (database.ServerScores.ServerID == guild_id)
+            & (database.ServerScores.DiscordLongID == user_id)
+        )
+        .first()
+    )
+    return row.Level if row else None
+
+
+async def current_level(guild_id: int, user_id: int) -> int | None:
+    """Member's level from the XP buffer if loaded, otherwise from the database."""
+    level = xp_accumulator.peek_level(guild_id, user_id)
+    if level is not None:
+        return level
+    return await run_db(_stored_level, guild_id, user_id)
@@ -0,0 +1,66 @@
+# utils/level_system/__ls_role_map.py
+
+from array import array
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.helpers.__logging_module import get_log
+
+_log = get_log("level_system.role_map")
+
+
+class GuildLevelRoles:
+    """Level -> role ID table for one guild, indexed directly by level (0 = no role)."""
+
+    __slots__ = ("by_level", "role_ids")
+
+    def __init__(self, rows: list[tuple[int, int]]):
+        max_level = max((level for _, level in rows), default=0)
+        self.by_level = array("Q", bytes(8 * (max_level + 1)))
+        for role_id, level in rows:
+            if level >= 0 and role_id:
+                self.by_level[level] = role_id
+        self.role_ids = frozenset(role_id for role_id, _ in rows if role_id)
+
+    def role_id_for(self, level: int) -> int | None:
+        if 0 <= level < len(self.by_level):
+            return self.by_level[level] or None
+        return None
+
+
+def _load_guild_roles(guild_id: int) -> list[tuple[int, int]]:
+    query = database.LeveledRoles.select(
+        database.LeveledRoles.RoleID, database.LeveledRoles.LevelThreshold
+    ).where(database.LeveledRoles.ServerID == guild_id)
+    return [(int(row.RoleID), int(row.LevelThreshold)) for row in query]
+
+
+class LevelRoleMap:
+    """
+    Per-guild cache of LeveledRoles, built on first use and rebuilt whenever the
+    level roles change (create_and_order_roles, role delete/update events).
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, GuildLevelRoles] = {}
+
+    async def get(self, guild_id: int) -> GuildLevelRoles:
+        roles = self._guilds.get(guild_id)
+        if roles is None:
+            roles = await self.refresh(guild_id)
+        return roles
+
+    async def refresh(self, guild_id: int) -> GuildLevelRoles:
+        roles = GuildLevelRoles(await run_db(_load_guild_roles, guild_id))
+        self._guilds[guild_id] = roles
+        _log.debug(f"🗺️ Loaded {len(roles.role_ids)} level roles for guild {guild_id}.")
+        return roles
+
+    def peek(self, guild_id: int) -> GuildLevelRoles | None:
+        return self._guilds.get(guild_id)
+
+    def invalidate(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+
+level_role_map = LevelRoleMap()
@@ -0,0 +1,324 @@
+# utils/level_system/__ls_tatsu_import.py
+
+import asyncio
+import datetime
+import json
+import os
+import time
+
+import aiohttp
+import discord
+
+from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.core_features.__common import calculate_level
+from utils.helpers.__logging_module import get_log
+from utils.helpers.__rate_limit import TokenBucket
+from .__ls_accumulator import xp_accumulator
+from .__ls_dirty import dirty_members
+from .__ls_leaderboard import leaderboard
+from .__ls_rank_index import rank_index
+
+_log = get_log("level_system.tatsu_import")
+
+# Point tatsu_api_base at a local stub to exercise the importer without the real API.
+TATSU_API_BASE = os.getenv("tatsu_api_base", "https://api.tatsu.gg/v1").rstrip("/")
+# Tatsu allows 60 requests a minute per key; stay a little under it.
+TATSU_RATE_PER_MINUTE = max(1.0, float(os.getenv("tatsu_rate_per_minute", "55")))
+TATSU_BURST = max(1, int(os.getenv("tatsu_burst", "5")))
+TATSU_CONCURRENCY = max(1, int(os.getenv("tatsu_concurrency", "4")))
+TATSU_MAX_RETRIES = max(1, int(os.getenv("tatsu_max_retries", "5")))
+
+TATSU_PAGE_SIZE = 100  # rankings returned per page by the API
+_MEMBER_BATCH = 50  # per-member fallback: members fetched between checkpoints
+_LOOKUP_CHUNK = 1000
+
+_tatsu_budget = TokenBucket(TATSU_RATE_PER_MINUTE / 60, TATSU_BURST)
+
+
+class TatsuError(Exception):
+    """The Tatsu API refused a request or kept failing after retries."""
+
+
+class TatsuClient:
+    """Minimal Tatsu v1 client sharing one session and one request budget."""
+
+    def __init__(self, api_key: str | None, base_url: str | None = None):
+        self.api_key = api_key
+        self.base_url = base_url or TATSU_API_BASE
+        self._session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            headers={"Authorization": self.api_key or ""},
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        return False
+
+    @staticmethod
+    def _retry_after(resp: aiohttp.ClientResponse, attempt: int) -> float:
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            return max(0.5, float(retry_after))
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if reset:
+            return max(0.5, float(reset) - time.time())
+        return float(2**attempt)
+
+    async def _get(self, path: str, params: dict | None = None):
+        """GET a JSON document. Returns None on 404; raises TatsuError otherwise."""
+        url = f"{self.base_url}{path}"
+        for attempt in range(TATSU_MAX_RETRIES):
+            await _tatsu_budget.acquire()
+            try:
+                async with self._session.get(url, params=params) as resp:
+                    if resp.status == 404:
+                        return None
+                    if resp.status == 429 or resp.status >= 500:
+                        delay = self._retry_after(resp, attempt)
+                        _log.debug(f"Tatsu {resp.status} on {path}; retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    if resp.status != 200:
+                        raise TatsuError(f"{resp.status} from {path}")
+                    return await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _log.debug(f"Tatsu request to {path} failed: {e}")
+                await asyncio.sleep(2**attempt)
+        raise TatsuError(f"Gave up on {path} after {TATSU_MAX_RETRIES} attempts")
+
+    async def rankings_page(self, guild_id: int, offset: int) -> list[tuple[int, int]]:
+        """One page of all-time guild rankings as [(user_id, score)]."""
+        data = await self._get(f"/guilds/{guild_id}/rankings/all", {"offset": offset})
+        if data is None:
+            raise TatsuError("Guild rankings are not available")
+        return [(int(r["user_id"]), int(r["score"])) for r in data.get("rankings") or []]
+
+    async def member_score(self, guild_id: int, user_id: int) -> int | None:
+        data = await self._get(f"/guilds/{guild_id}/rankings/members/{user_id}/all")
+        return int(data["score"]) if data else None
+
+
+class ImportResult:
+    __slots__ = ("mode", "resumed", "fetched", "updated", "unchanged", "failed", "elapsed")
+
+    def __init__(self, mode: str, resumed: bool):
+        self.mode = mode
+        self.resumed = resumed
+        self.fetched = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+
+def _load_state(guild_id: int):
+    return database.TatsuImportState.get_or_none(
+        database.TatsuImportState.guild_id == guild_id
+    )
+
+
+def _reset_state(guild_id: int, mode: str):
+    database.TatsuImportState.delete().where(
+        database.TatsuImportState.guild_id == guild_id
+    ).execute()
+    return database.TatsuImportState.create(guild_id=guild_id, mode=mode)
+
+
+def _save_state(state):
+    state.updated_at = datetime.datetime.utcnow()
+    state.save()
+
+
+def _load_existing(guild_id: int, user_ids: list[int]) -> dict[int, int]:
+    s = database.ServerScores
+    existing = {}
+    for i in range(0, len(user_ids), _LOOKUP_CHUNK):
+        query = (
+            s.select(s.DiscordLongID, s.Score)
+            .where((s.ServerID == guild_id) & s.DiscordLongID.in_(user_ids[i : i + _LOOKUP_CHUNK]))
+            .tuples()
+        )
+        existing.update({int(uid): int(score or 0) for uid, score in query})
+    return existing
+
+
+def _upsert_scores(rows: list[dict]):
+    """Multi-row INSERT ... ON DUPLICATE KEY UPDATE on (ServerID, DiscordLongID)."""
+    s = database.ServerScores
+    with database.db.atomic():
+        for i in range(0, len(rows), 500):
+            (
+                s.insert_many(rows[i : i + 500])
+                .on_conflict(preserve=[s.DiscordName, s.Score, s.Level, s.Progress, s.TatsuXP])
+                .execute()
+            )
+
+
+class TatsuImporter:
+    """
+    Imports Tatsu XP into ServerScores. Guild rankings are pulled 100 members
+    per request; if that endpoint is unavailable it falls back to concurrent
+    per-member lookups. Both share one token bucket, write in bulk, and record a
+    checkpoint after every page/batch so an interrupted run picks up where it
+    stopped.
+    """
+
+    def __init__(self):
+        self._running: set[int] = set()
+
+    def is_running(self, guild_id: int) -> bool:
+        return guild_id in self._running
+
+    async def _apply(self, guild: discord.Guild, pairs: list[tuple[int, int]], result: ImportResult):
+        """Write scores that differ from what we store. One read and one write per batch."""
+        if not pairs:
+            return
+        existing = await run_db(_load_existing, guild.id, [uid for uid, _ in pairs])
+        changed = [(uid, score) for uid, score in pairs if existing.get(uid) != score]
+        result.unchanged += len(pairs) - len(changed)
+        if not changed:
+            return
+
+        changed_ids = [uid for uid, _ in changed]
+        # Tatsu scores overwrite Score; write out buffered message XP first.
+        await xp_accumulator.forget_many(guild.id, changed_ids)
+        rows = []
+        for uid, score in changed:
+            level, progress, _ = calculate_level(score)
+            member = guild.get_member(uid)
+            rows.append(
+                {
+                    "ServerID": guild.id,
+                    "DiscordLongID": uid,
+                    "DiscordName": member.name if member else str(uid),
+                    "Score": score,
+                    "Level": level,
+                    "Progress": progress,
+                    "TatsuXP": score,
+                }
+            )
+        await run_db(_upsert_scores, rows)
+        # Drop anything a message reloaded while the write was in flight.
+        await xp_accumulator.forget_many(guild.id, changed_ids)
+
+        for uid, score in changed:
+            rank_index.update(guild.id, uid, score)
+        dirty_members.mark_many(guild.id, changed_ids)
+        result.updated += len(changed)
+
+    async def _import_rankings(self, client: TatsuClient, guild: discord.Guild, state, result: ImportResult):
+        while True:
+            page = await client.rankings_page(guild.id, state.cursor)
+            result.fetched += len(page)
+            # Rankings include people who left; only import current members.
+            pairs = [
+                (uid, score)
+                for uid, score in page
+                if (m := guild.get_member(uid)) is not None and not m.bot
+            ]
+            await self._apply(guild, pairs, result)
+
+            state.cursor += len(page)
+            state.processed += len(pairs)
+            state.updated = result.updated
+            await run_db(_save_state, state)
+            _log.info(f"Tatsu import {guild.name}: {state.cursor} ranked users read.")
+            if len(page) < TATSU_PAGE_SIZE:
+                return
+
+    async def _import_members(self, client: TatsuClient, guild: discord.Guild, state, result: ImportResult):
+        # Sorted IDs make "last member done" a valid resume cursor; members whose
+        # lookup failed are kept in the checkpoint and tried again first.
+        outstanding = set(json.loads(state.failed_ids or "[]"))
+        member_ids = sorted(
+            m.id for m in guild.members if not m.bot and (m.id > state.cursor or m.id in outstanding)
+        )
+        semaphore = asyncio.Semaphore(TATSU_CONCURRENCY)
+
+        async def fetch(uid: int):
+            async with semaphore:
+                try:
+                    return uid, await client.member_score(guild.id, uid), True
+                except TatsuError as e:
+                    _log.warning(f"Tatsu lookup failed for {uid} in {guild.name}: {e}")
+                    return uid, None, False
+
+        for i in range(0, len(member_ids), _MEMBER_BATCH):
+            batch = member_ids[i : i + _MEMBER_BATCH]
+            scores = await asyncio.gather(*(fetch(uid) for uid in batch))
+            # Unranked members (404) have no Tatsu XP to import.
+            pairs = [(uid, score) for uid, score, ok in scores if score is not None]
+            result.fetched += len(pairs)
+            await self._apply(guild, pairs, result)
+
+            for uid, _, ok in scores:
+                if ok:
+                    outstanding.discard(uid)
+                else:
+                    outstanding.add(uid)
+            state.cursor = max(state.cursor, batch[-1])
+            state.failed_ids = json.dumps(sorted(outstanding)) if outstanding else None
+            state.processed += len(batch)
+            state.updated = result.updated
+            await run_db(_save_state, state)
+            _log.info(
+                f"Tatsu import {guild.name}: {i + len(batch)}/{len(member_ids)} members checked."
+            )
+        result.failed = len(outstanding)
+
+    async def run(self, guild: discord.Guild, *, restart: bool = False) -> ImportResult:
+        """Import (or resume importing) Tatsu XP for every member of `guild`."""
+        if guild.id in self._running:
+            raise RuntimeError(f"A Tatsu import is already running for {guild.name}.")
+        self._running.add(guild.id)
+        started = time.monotonic()
+        try:
+            state = await run_db(_load_state, guild.id)
+            resumed = bool(state and state.completed_at is None and not restart)
+            if not resumed:
+                state = await run_db(_reset_state, guild.id, "rankings")
+            result = ImportResult(state.mode, resumed)
+            _log.info(
+                f"{'Resuming' if resumed else 'Starting'} Tatsu import for {guild.name} "
+                f"({state.mode}, cursor {state.cursor})."
+            )
+
+            async with TatsuClient(os.getenv("tatsu_api_key")) as client:
+                if state.mode == "rankings":
+                    try:
+                        await self._import_rankings(client, guild, state, result)
+                    except TatsuError as e:
+                        if state.cursor:
+                            raise  # partway through; resume later rather than redo per member
+                        _log.warning(
+                            f"Tatsu rankings unavailable for {guild.name} ({e}); "
+                            "falling back to per-member lookups."
+                        )
+                        state.mode = result.mode = "members"
+                        state.cursor = 0
+                        await run_db(_save_state, state)
+                if state.mode == "members":
+                    await self._import_members(client, guild, state, result)
+
+            if not state.failed_ids:
+                # Otherwise leave the run open so the next one retries the failures.
+                state.completed_at = datetime.datetime.utcnow()
+            await run_db(_save_state, state)
+        finally:
+            self._running.discard(guild.id)
+            leaderboard.invalidate(guild.id)
+
+        result.elapsed = time.monotonic() - started
+        _log.info(
+            f"✅ Tatsu import for {guild.name}: {result.updated} updated, "
+            f"{result.unchanged} unchanged, {result.failed} failed in {result.elapsed:.1f}s."
+        )
+        return result
+
+
+tatsu_importer = TatsuImporter()
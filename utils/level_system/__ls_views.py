@@ -1,53 +1,55 @@
 import discord
 from discord.ui import View, Button
 
+from utils.helpers.__logging_module import get_log
+from .__ls_economy import apply_economy
+from .__ls_leaderboard import Leaderboard, LeaderboardPage, leaderboard
+
+_log = get_log("level_system.views")
+
 
 class LeaderboardView(View):
+    """
+    Paginated leaderboard that only holds the page on screen. Navigation uses
+    the first/last row of that page as a keyset cursor.
+    """
+
     def __init__(
-        self, interaction: discord.Interaction, entries: list, per_page: int = 10
+        self,
+        interaction: discord.Interaction,
+        page: LeaderboardPage,
+        per_page: int = 10,
+        source: Leaderboard = leaderboard,
     ):
         super().__init__(timeout=60)
         self.interaction = interaction
-        self.entries = entries
+        self.source = source
+        self.guild_id = interaction.guild.id
         self.per_page = per_page
         self.page = 0
+        self.current = page
         self.message = None
 
         self.update_buttons()
 
     def update_buttons(self):
-        self.clear_items()
-        if self.page > 0:
-            self.add_item(
-                Button(
-                    label="⬅️ Previous",
-                    style=discord.ButtonStyle.secondary,
-                    custom_id="prev",
-                )
-            )
-        if (self.page + 1) * self.per_page < len(self.entries):
-            self.add_item(
-                Button(
-                    label="Next ➡️",
-                    style=discord.ButtonStyle.secondary,
-                    custom_id="next",
-                )
-            )
+        # Toggle the decorated buttons; replacing them would drop their callbacks.
+        self.previous.disabled = not self.current.has_prev
+        self.next.disabled = not self.current.has_next
 
     def get_embed(self):
         start = self.page * self.per_page
-        end = start + self.per_page
         embed = discord.Embed(
             title=f"🏆 {self.interaction.guild.name} Leaderboard",
-            description=f"Top XP earners (Page {self.page + 1}/{(len(self.entries)-1)//self.per_page+1}):",
+            description=f"{self.source.description} (Page {self.page + 1}):",
             color=discord.Color.gold(),
         )
 
-        for i, entry in enumerate(self.entries[start:end], start=start + 1):
-            username = entry.DiscordName or f"<@{entry.DiscordLongID}>"
+        for i, entry in enumerate(self.current.rows, start=start + 1):
+            username = entry.name or f"<@{entry.user_id}>"
             embed.add_field(
                 name=f"{i}. {username}",
-                value=f"Level: {entry.Level} | XP: {entry.Score}",
+                value=f"Level: {entry.level} | XP: {entry.score}",
                 inline=False,
             )
 
@@ -56,18 +58,79 @@ class LeaderboardView(View):
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         return interaction.user.id == self.interaction.user.id
 
+    async def _show(self, interaction: discord.Interaction, page: LeaderboardPage, step: int):
+        if not page.rows:
+            # Scores moved under us; start over from the top.
+            page = await self.source.first_page(self.guild_id, self.per_page)
+            self.page = 0
+        else:
+            self.page = max(0, self.page + step)
+        self.current = page
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
     @discord.ui.button(
         label="⬅️ Previous", style=discord.ButtonStyle.secondary, custom_id="prev", row=0
     )
     async def previous(self, interaction: discord.Interaction, button: Button):
-        self.page -= 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+        page = await self.source.page_before(
+            self.guild_id, self.current.rows[0].cursor, self.per_page
+        )
+        await self._show(interaction, page, -1)
 
     @discord.ui.button(
         label="Next ➡️", style=discord.ButtonStyle.secondary, custom_id="next", row=0
     )
     async def next(self, interaction: discord.Interaction, button: Button):
-        self.page += 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+        page = await self.source.page_after(
+            self.guild_id, self.current.rows[-1].cursor, self.per_page
+        )
+        await self._show(interaction, page, 1)
+
+
+class EconomyConfirmView(View):
+    """Confirm/cancel for a previewed economy change; only the invoker can press."""
+
+    def __init__(self, interaction: discord.Interaction, operation: str, percent: float):
+        super().__init__(timeout=120)
+        self.interaction = interaction
+        self.operation = operation
+        self.percent = percent
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.interaction.user.id
+
+    @discord.ui.button(label="Apply", style=discord.ButtonStyle.danger, emoji="⚖️")
+    async def apply(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.edit_message(
+            embed=discord.Embed(
+                title="⏳ Applying economy change…", color=discord.Color.gold()
+            ),
+            view=None,
+        )
+        self.stop()
+        try:
+            plan = await apply_economy(interaction.guild.id, self.operation, self.percent)
+        except Exception as e:
+            _log.error(f"Economy {self.operation} failed in {interaction.guild.name}: {e}", exc_info=True)
+            await interaction.edit_original_response(
+                embed=discord.Embed(
+                    title="❌ Economy change failed",
+                    description=str(e),
+                    color=discord.Color.red(),
+                )
+            )
+            return
+        await interaction.edit_original_response(
+            embed=plan.to_embed(interaction.guild.name, applied=True)
+        )
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
+    async def cancel(self, interaction: discord.Interaction, button: Button):
+        self.stop()
+        await interaction.response.edit_message(
+            embed=discord.Embed(
+                title="Cancelled", description="No scores were changed.", color=discord.Color.red()
+            ),
+            view=None,
+        )
@@ -5,7 +5,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from discord import File
-from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
 from utils.core_features.__common import ensure_profile_exists
@@ -28,7 +28,7 @@ class ProfileCommands(commands.GroupCog, name="profile"):
     ):
         member = member or interaction.user
 
-        if ensure_profile_exists(member) is None:
+        if await run_db(ensure_profile_exists, member) is None:
             await interaction.response.send_message(
                 "An error occurred while loading your profile.", ephemeral=True
             )
@@ -58,34 +58,12 @@ class ProfileCommands(commands.GroupCog, name="profile"):
     ):
         member = member or interaction.user
 
-        if ensure_profile_exists(member) is None:
+        if await run_db(ensure_profile_exists, member) is None:
             await interaction.response.send_message(
                 "An error occurred while loading the profile.", ephemeral=True
             )
             return
 
-        user_id = str(member.id)
-        discordname = f"{member.name}#{member.discriminator}"
-
-        try:
-            database.db.connect(reuse_if_open=True)
-            profile_record, created = database.PortalbotProfile.get_or_create(
-                DiscordLongID=user_id, defaults={"DiscordName": discordname}
-            )
-            if created:
-                _log.info(f"Auto-created profile for {discordname} (embed fallback)")
-        except Exception as e:
-            _log.error(
-                f"Failed to auto-create profile for {discordname}: {e}", exc_info=True
-            )
-            await interaction.response.send_message(
-                "An error occurred while loading the profile.", ephemeral=True
-            )
-            return
-        finally:
-            if not database.db.is_closed():
-                database.db.close()
-
         embed = await generate_profile_embed(member, interaction.guild.id)
         if embed:
             await interaction.response.send_message(embed=embed)
@@ -97,7 +75,7 @@ class ProfileCommands(commands.GroupCog, name="profile"):
     @app_commands.command(name="edit", description="Edit your profile details.")
     async def edit(self, interaction: discord.Interaction):
         user = interaction.user
-        profile = ensure_profile_exists(user)
+        profile = await run_db(ensure_profile_exists, user)
         if profile is None:
             await interaction.response.send_message(
                 "An error occurred while preparing your profile.", ephemeral=True
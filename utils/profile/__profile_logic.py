@@ -3,11 +3,12 @@ import discord
 from PIL import Image, ImageDraw, ImageFont
 from discord import File, Embed, Member
 from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.core_features.__common import (
     calculate_level,
-    get_user_rank,
     ensure_profile_exists,
 )
+from utils.level_system.__ls_rank_index import rank_index
 from .__profile_views import RealmSelectionView
 
 # Constants
@@ -36,7 +37,7 @@ async def generate_profile_card(bot, interaction, profile):
     if profile is None:
         profile = interaction.user
 
-    if ensure_profile_exists(profile) is None:
+    if await run_db(ensure_profile_exists, profile) is None:
         return None, "An error occurred while loading your profile."
 
     try:
@@ -44,19 +45,6 @@ async def generate_profile_card(bot, interaction, profile):
     except Exception:
         pass
 
-    user_id = str(profile.id)
-    discordname = f"{profile.name}#{profile.discriminator}"
-    try:
-        database.db.connect(reuse_if_open=True)
-        profile_record, _ = database.PortalbotProfile.get_or_create(
-            DiscordLongID=user_id, defaults={"DiscordName": discordname}
-        )
-    except Exception:
-        return None, "An error occurred while loading your profile."
-    finally:
-        if not database.db.is_closed():
-            database.db.close()
-
     image = Image.open(BACKGROUND_IMAGE_PATH).convert("RGBA").copy()
 
     try:
@@ -71,14 +59,15 @@ async def generate_profile_card(bot, interaction, profile):
     except Exception:
         return None, "Failed to load avatar image."
 
-    query, server_score, next_role_name = fetch_profile_data(
-        profile, interaction.guild_id
+    query, server_score, next_role_name = await run_db(
+        fetch_profile_data, profile, interaction.guild_id
     )
     if query is None:
         return None, "No profile found for this user."
 
     level, progress, next_level_score = calculate_progress(server_score)
-    rank = get_user_rank(interaction.guild_id, profile.id)
+    standing = await rank_index.standing(interaction.guild_id, profile.id)
+    rank = standing.rank if standing else None
 
     draw_text_and_progress(
         image,
@@ -104,28 +93,18 @@ async def generate_profile_card(bot, interaction, profile):
 
 
 async def generate_profile_embed(profile: Member, guild_id: int) -> Embed | None:
-    if ensure_profile_exists(profile) is None:
+    query = await run_db(ensure_profile_exists, profile)
+    if query is None:
         return None
 
-    longid = str(profile.id)
     avatar_url = profile.display_avatar.url
 
-    try:
-        query = database.PortalbotProfile.get(
-            database.PortalbotProfile.DiscordLongID == longid
-        )
-    except database.PortalbotProfile.DoesNotExist:
-        return None
-
-    score_query = database.ServerScores.get_or_none(
-        (database.ServerScores.DiscordLongID == longid)
-        & (database.ServerScores.ServerID == str(guild_id))
-    )
-    server_score = score_query.Score if score_query else "N/A"
+    server_score = await run_db(_load_server_score, profile.id, guild_id)
     level, progress, next_level_score = (
         calculate_level(server_score) if isinstance(server_score, int) else (0, 0, 0)
     )
-    rank = get_user_rank(guild_id, profile.id)
+    standing = await rank_index.standing(guild_id, profile.id)
+    rank = standing.rank if standing else None
 
     embed = Embed(
         title=f"{profile.display_name}'s Profile",
@@ -173,8 +152,16 @@ async def generate_profile_embed(profile: Member, guild_id: int) -> Embed | None
 # ───────────────────────── SUPPORTING ─────────────────────────
 
 
+def _load_server_score(longid: int, guild_id: int):
+    score_query = database.ServerScores.get_or_none(
+        (database.ServerScores.DiscordLongID == longid)
+        & (database.ServerScores.ServerID == guild_id)
+    )
+    return score_query.Score if score_query else "N/A"
+
+
 def fetch_profile_data(profile, guild_id):
-    longid = str(profile.id)
+    longid = profile.id
     try:
         query = database.PortalbotProfile.get(
             database.PortalbotProfile.DiscordLongID == longid
@@ -184,7 +171,7 @@ def fetch_profile_data(profile, guild_id):
 
     score_query = database.ServerScores.get_or_none(
         (database.ServerScores.DiscordLongID == longid)
-        & (database.ServerScores.ServerID == str(guild_id))
+        & (database.ServerScores.ServerID == guild_id)
     )
     server_score = score_query.Score if score_query else "N/A"
     current_level = score_query.Level if score_query else 0
@@ -192,7 +179,7 @@ def fetch_profile_data(profile, guild_id):
     next_role_query = (
         database.LeveledRoles.select()
         .where(
-            (database.LeveledRoles.ServerID == str(guild_id))
+            (database.LeveledRoles.ServerID == guild_id)
             & (database.LeveledRoles.LevelThreshold > current_level)
         )
         .order_by(database.LeveledRoles.LevelThreshold.asc())
@@ -4,11 +4,37 @@ import discord
 from discord.ui import View, Button, Modal, TextInput
 from utils.helpers.__logging_module import get_log
 from utils.database import __database as database
-from utils.core_features.__common import get_profile_record
+from utils.database.__async_db import run_db
 
 _log = get_log(__name__)
 
 
+def _update_profile(user_id: int, **fields) -> bool:
+    """Set fields on a member's PortalbotProfile. False if they have none."""
+    profile = database.PortalbotProfile.get_or_none(
+        database.PortalbotProfile.DiscordLongID == user_id
+    )
+    if not profile:
+        return False
+    for name, value in fields.items():
+        setattr(profile, name, value)
+    profile.save()
+    return True
+
+
+def _load_realm_selection(user_id: int):
+    """Active realm names and the member's profile, for the realm selection panel."""
+    active_realms = (
+        database.RealmProfile.select(database.RealmProfile.realm_name)
+        .where(database.RealmProfile.archived == False)
+        .order_by(database.RealmProfile.realm_name)
+    )
+    profile = database.PortalbotProfile.get_or_none(
+        database.PortalbotProfile.DiscordLongID == user_id
+    )
+    return [realm.realm_name for realm in active_realms], profile
+
+
 # ---------- Game Usernames Modal ----------
 class GameUsernamesModal(Modal, title="Game Usernames"):
     def __init__(self):
@@ -29,21 +55,20 @@ class GameUsernamesModal(Modal, title="Game Usernames"):
 
     async def on_submit(self, interaction: discord.Interaction):
         try:
-            profile = database.PortalbotProfile.get_or_none(
-                database.PortalbotProfile.DiscordLongID == str(interaction.user.id)
+            updated = await run_db(
+                _update_profile,
+                interaction.user.id,
+                XBOX=self.xbox.value.strip() or "None",
+                Playstation=self.playstation.value.strip() or "None",
+                Switch=self.switch.value.strip() or "None",
+                SwitchNNID=self.nnid.value.strip() or "None",
             )
-            if not profile:
+            if not updated:
                 await interaction.response.send_message(
                     "❌ Profile not found.", ephemeral=True
                 )
                 return
 
-            profile.XBOX = self.xbox.value.strip() or "None"
-            profile.Playstation = self.playstation.value.strip() or "None"
-            profile.Switch = self.switch.value.strip() or "None"
-            profile.SwitchNNID = self.nnid.value.strip() or "None"
-            profile.save()
-
             _log.info(f"Updated game usernames for {interaction.user.name}")
             await interaction.response.send_message(
                 "✅ Game usernames updated successfully!", ephemeral=True
@@ -78,19 +103,18 @@ class RealmInfoModal(Modal, title="Realm Information"):
 
     async def on_submit(self, interaction: discord.Interaction):
         try:
-            profile = database.PortalbotProfile.get_or_none(
-                database.PortalbotProfile.DiscordLongID == str(interaction.user.id)
+            updated = await run_db(
+                _update_profile,
+                interaction.user.id,
+                RealmsJoined=self.clean_field(self.joined.value),
+                RealmsAdmin=self.clean_field(self.admin.value),
             )
-            if not profile:
+            if not updated:
                 await interaction.response.send_message(
                     "❌ Profile not found.", ephemeral=True
                 )
                 return
 
-            profile.RealmsJoined = self.clean_field(self.joined.value)
-            profile.RealmsAdmin = self.clean_field(self.admin.value)
-            profile.save()
-
             _log.info(f"Updated realm info for {interaction.user.name}")
             await interaction.response.send_message(
                 "✅ Realm information updated successfully!", ephemeral=True
@@ -138,21 +162,20 @@ class EditRealmButton(discord.ui.Button):
 
 
 class RealmSelection(discord.ui.Select):
-    def __init__(self, bot, user_id: int, field: str, label: str, placeholder: str):
+    def __init__(
+        self,
+        bot,
+        user_id: int,
+        field: str,
+        label: str,
+        placeholder: str,
+        active_names: list[str],
+        profile,
+    ):
         self.bot = bot
         self.user_id = user_id
         self.field = field  # Either 'RealmsJoined' or 'RealmsAdmin'
 
-        # Fetch active realms
-        active_realms = (
-            database.RealmProfile.select()
-            .where(database.RealmProfile.archived == False)
-            .order_by(database.RealmProfile.realm_name)
-        )
-        active_names = [realm.realm_name for realm in active_realms]
-
-        # Fetch user profile
-        profile = get_profile_record(self.bot, str(user_id))
         existing = []
         if profile:
             current_value = getattr(profile, self.field, "None")
@@ -180,20 +203,15 @@ class RealmSelection(discord.ui.Select):
 
     async def callback(self, interaction: discord.Interaction):
         try:
-            profile = get_profile_record(self.bot, str(self.user_id))
-            if not profile:
+            value = ", ".join(self.values) if self.values else "None"
+            if not await run_db(_update_profile, self.user_id, **{self.field: value}):
                 await interaction.response.send_message(
                     "Profile not found.", ephemeral=True
                 )
                 return
 
-            setattr(
-                profile, self.field, ", ".join(self.values) if self.values else "None"
-            )
-            profile.save()
-
             _log.info(
-                f"{self.field} updated for {interaction.user.display_name}: {getattr(profile, self.field)}"
+                f"{self.field} updated for {interaction.user.display_name}: {value}"
             )
             await interaction.response.send_message(
                 f"✅ Your {self.field} realms have been updated!", ephemeral=True
@@ -206,7 +224,7 @@ class RealmSelection(discord.ui.Select):
 
 
 class RealmSelectionView(discord.ui.View):
-    def __init__(self, bot, user_id: int):
+    def __init__(self, bot, user_id: int, active_names: list[str], profile):
         super().__init__(timeout=None)
 
         # Label above OP Realms dropdown
@@ -225,6 +243,8 @@ class RealmSelectionView(discord.ui.View):
             field="RealmsAdmin",
             label="OP Realms",
             placeholder="Select realms you are an OP in...",
+            active_names=active_names,
+            profile=profile,
         )
         op_dropdown.row = 1
         self.add_item(op_dropdown)
@@ -245,6 +265,8 @@ class RealmSelectionView(discord.ui.View):
             field="RealmsJoined",
             label="Member Realms",
             placeholder="Select realms you are a member of...",
+            active_names=active_names,
+            profile=profile,
         )
         member_dropdown.row = 3
         self.add_item(member_dropdown)
@@ -264,17 +286,12 @@ class RealmDropdown(discord.ui.Select):
         self.realm_type = realm_type
 
     async def callback(self, interaction: discord.Interaction):
-        profile = database.PortalbotProfile.get(
-            database.PortalbotProfile.DiscordLongID == str(interaction.user.id)
-        )
-
         selected_realms = ", ".join(self.values) if self.values else "None"
         if self.realm_type == "joined":
-            profile.RealmsJoined = selected_realms
+            await run_db(_update_profile, interaction.user.id, RealmsJoined=selected_realms)
         elif self.realm_type == "admin":
-            profile.RealmsAdmin = selected_realms
+            await run_db(_update_profile, interaction.user.id, RealmsAdmin=selected_realms)
 
-        profile.save()
         await interaction.response.send_message(
             f"✅ Updated your {self.placeholder.lower()} to: {selected_realms}",
             ephemeral=True,
@@ -282,6 +299,7 @@ class RealmDropdown(discord.ui.Select):
 
 
 async def open_realm_selection_panel(bot, interaction):
+    active_names, profile = await run_db(_load_realm_selection, interaction.user.id)
     await interaction.response.send_message(
         embed=discord.Embed(
             title="Select Your Realms",
@@ -291,6 +309,6 @@ async def open_realm_selection_panel(bot, interaction):
             ),
             color=discord.Color.blurple(),
         ),
-        view=RealmSelectionView(bot, interaction.user.id),
+        view=RealmSelectionView(bot, interaction.user.id, active_names, profile),
         ephemeral=True,
     )
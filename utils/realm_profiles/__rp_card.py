@@ -0,0 +1,127 @@
+# utils/realm_profiles/__rp_card.py
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from utils.helpers.__logging_module import get_log
+
+_log = get_log(__name__)
+
+# Worker processes for card rendering (0 renders on a thread instead) and how
+# many finished PNGs are kept in memory.
+REALM_CARD_WORKERS = max(0, int(os.getenv("realm_card_workers", "2")))
+REALM_CARD_CACHE_SIZE = max(1, int(os.getenv("realm_card_cache_size", "64")))
+
+
+class CardRenderer:
+    """
+    Renders realm profile cards off the event loop and keeps the PNGs.
+
+    Cards are keyed by a content hash (profile fields plus image mtimes), so a
+    stale key is simply never asked for again. Requests for a key that is
+    already rendering await the same task instead of starting another render.
+    invalidate() drops a realm's cached PNGs and stops renders that started
+    before it from being cached.
+    """
+
+    def __init__(self, workers: int = REALM_CARD_WORKERS, max_entries: int = REALM_CARD_CACHE_SIZE):
+        self.workers = workers
+        self.max_entries = max_entries
+        self._pool: ProcessPoolExecutor | None = None
+        self._cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._generation: dict[str, int] = {}
+        self.hits = 0
+        self.renders = 0
+
+    def start(self):
+        """
+        Fork the worker processes. Call once at startup, before anything starts
+        a thread: forking a threaded process can leave a child stuck on a lock
+        another thread held. Spawned workers are not an option because they
+        re-import main, which runs the database migrations. Without a pool
+        (not started, no fork, workers=0, or a worker died) cards render on a
+        thread instead.
+        """
+        if self._pool is not None or self.workers == 0:
+            return
+        if threading.active_count() > 1:
+            _log.warning("Realm card workers must start before other threads; rendering on threads.")
+            return
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+            # With fork every worker is created on the first submit.
+            pool.submit(os.getpid).result()
+        except (ValueError, OSError) as e:
+            _log.warning(f"Realm card process pool unavailable, rendering on threads: {e}")
+            return
+        self._pool = pool
+        _log.info(f"🖼️ Started {self.workers} realm card worker process(es).")
+
+    async def _run(self, func: Callable[..., bytes], *args: Any) -> bytes:
+        pool = self._pool
+        if pool is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM). Re-forking now would fork a threaded
+                # process, so render on threads until the next restart.
+                _log.warning("Realm card worker died; rendering on threads from now on.")
+                if self._pool is pool:
+                    self._pool = None
+                pool.shutdown(wait=False)
+        return await asyncio.to_thread(func, *args)
+
+    async def _render(self, realm_name: str, key: str, func, args) -> bytes:
+        generation = self._generation.get(realm_name, 0)
+        try:
+            data = await self._run(func, *args)
+        finally:
+            self._inflight.pop(key, None)
+        self.renders += 1
+        if self._generation.get(realm_name, 0) == generation:
+            self._cache[key] = (realm_name, data)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return data
+
+    async def get(self, realm_name: str, key: str, func: Callable[..., bytes], *args: Any) -> bytes:
+        """PNG bytes for `key`, rendering with `func(*args)` in the pool on a miss."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(
+                self._render(realm_name, key, func, args)
+            )
+        # Shielded so one caller timing out does not cancel the shared render.
+        return await asyncio.shield(task)
+
+    def invalidate(self, *realm_names: str):
+        """Forget cached cards for these realms (call after their profile or images change)."""
+        names = set(realm_names)
+        for name in names:
+            self._generation[name] = self._generation.get(name, 0) + 1
+        for key in [k for k, (name, _) in self._cache.items() if name in names]:
+            del self._cache[key]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+realm_card_renderer = CardRenderer()
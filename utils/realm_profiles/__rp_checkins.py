@@ -4,6 +4,8 @@ import discord
 from peewee import IntegrityError
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 from utils.helpers.__logging_module import get_log
 from utils.realm_profiles.__rp_logic import has_realm_operator_role
 
@@ -142,6 +144,45 @@ def get_checkin_status(
     return checked_in, missing
 
 
+def get_checkin_details(
+    guild_id: int | str,
+    *,
+    include_archived: bool = False,
+    checkin_month: str | None = None,
+) -> list[tuple[database.RealmProfile, database.RealmCheckIn | None]]:
+    """Every realm with its check-in record for the month, in two queries."""
+    checkin_month = checkin_month or current_checkin_month()
+    query = database.RealmProfile.select().order_by(database.RealmProfile.realm_name)
+    if not include_archived:
+        query = query.where(database.RealmProfile.archived == False)
+    realm_profiles = list(query)
+
+    checkins = {
+        checkin.realm_id: checkin
+        for checkin in database.RealmCheckIn.select().where(
+            (database.RealmCheckIn.guild_id == str(guild_id))
+            & (database.RealmCheckIn.checkin_month == checkin_month)
+        )
+    }
+    return [
+        (realm_profile, checkins.get(realm_profile.entry_id))
+        for realm_profile in realm_profiles
+    ]
+
+
+def reset_realm_checkins(guild_id: int | str, checkin_month: str) -> int:
+    deleted = (
+        database.RealmCheckIn.delete()
+        .where(
+            (database.RealmCheckIn.guild_id == str(guild_id))
+            & (database.RealmCheckIn.checkin_month == checkin_month)
+        )
+        .execute()
+    )
+    database.RealmProfile.update(checkin=False, last_checkin_at=None).execute()
+    return deleted
+
+
 def find_realm_by_emoji(
     emoji: discord.PartialEmoji | str,
     realm_profiles: list[database.RealmProfile] | None = None,
@@ -232,7 +273,8 @@ async def build_monthly_checkin_embed(
     total_posts: int | None = None,
 ) -> discord.Embed:
     checkin_month = checkin_month or current_checkin_month()
-    checked_in, missing = get_checkin_status(
+    checked_in, missing = await run_db(
+        get_checkin_status,
         guild_id,
         checkin_month=checkin_month,
         realm_profiles=realm_profiles,
@@ -304,9 +346,9 @@ async def post_monthly_checkin_message(
         return None
 
     if new_month_post:
-        reset_realm_checkin_flags()
+        await run_db(reset_realm_checkin_flags)
 
-    realm_profiles = get_active_realm_profiles()
+    realm_profiles = await run_db(get_active_realm_profiles)
     profile_batches = chunk_realm_profiles(realm_profiles) or [[]]
     posted_messages: list[discord.Message] = []
     role_ping = f"<@&{REALM_OP_ROLE_ID}>"
@@ -329,7 +371,8 @@ async def post_monthly_checkin_message(
         posted_messages.append(message)
 
     bot_data.last_realm_checkin_posted_month = checkin_month
-    bot_data.save(only=[database.BotData.last_realm_checkin_posted_month])
+    await run_db(bot_data.save, only=[database.BotData.last_realm_checkin_posted_month])
+    bot_data_cache.update(bot_data)
     return posted_messages
 
 
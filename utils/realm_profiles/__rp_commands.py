@@ -4,16 +4,19 @@ from discord.ext import commands
 
 from utils.database import __database as database
 from utils.database.__database import RealmProfile
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
 from utils.realm_profiles.__rp_checkins import (
     current_checkin_month,
     display_checkin_month,
+    get_checkin_details,
     get_checkin_status,
     get_realm_checkin,
     post_monthly_checkin_message,
     record_realm_checkin,
     realm_profile_is_checked_in,
+    reset_realm_checkins,
     user_can_checkin_realm,
 )
 from utils.realm_profiles.__rp_logic import (
@@ -58,7 +61,9 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
     async def view(self, interaction: discord.Interaction, realm_name: str = None):
         """View the details of a Realm Profile, as a card if possible, or fallback to embed."""
         realm_name = realm_name or interaction.channel.name
-        realm_profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
+        realm_profile = await run_db(
+            RealmProfile.get_or_none, RealmProfile.realm_name == realm_name
+        )
 
         if not realm_profile:
             await interaction.response.send_message(
@@ -101,7 +106,7 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
     @app_commands.command(name="edit", description="Edit a Realm Profile")
     @app_commands.autocomplete(realm_name=realm_name_autocomplete)
     async def open_realm_panel(self, interaction: discord.Interaction, realm_name: str):
-        if not has_realm_operator_role(interaction.user, realm_name):
+        if not await run_db(has_realm_operator_role, interaction.user, realm_name):
             await interaction.response.send_message(
                 f"🚫 You must have the `{realm_name} OP` role to manage this realm.",
                 ephemeral=True,
@@ -126,7 +131,9 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
         realm_name: str,
         owner: discord.Member,
     ):
-        realm_profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
+        realm_profile = await run_db(
+            RealmProfile.get_or_none, RealmProfile.realm_name == realm_name
+        )
         if not realm_profile:
             await interaction.response.send_message(
                 f"No profile found for realm '{realm_name}'", ephemeral=True
@@ -135,7 +142,9 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
 
         realm_profile.discord_name = owner.name
         realm_profile.discord_id = str(owner.id)
-        realm_profile.save(only=[RealmProfile.discord_name, RealmProfile.discord_id])
+        await run_db(
+            realm_profile.save, only=[RealmProfile.discord_name, RealmProfile.discord_id]
+        )
 
         await interaction.response.send_message(
             f"✅ Realm owner for **{realm_name}** set to "
@@ -149,21 +158,23 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
     )
     @app_commands.autocomplete(realm_name=realm_name_autocomplete)
     async def checkin(self, interaction: discord.Interaction, realm_name: str):
-        realm_profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
+        realm_profile = await run_db(
+            RealmProfile.get_or_none, RealmProfile.realm_name == realm_name
+        )
         if not realm_profile:
             await interaction.response.send_message(
                 f"No profile found for realm '{realm_name}'", ephemeral=True
             )
             return
 
-        if not user_can_checkin_realm(interaction.user, realm_profile):
+        if not await run_db(user_can_checkin_realm, interaction.user, realm_profile):
             await interaction.response.send_message(
                 f"🚫 You must have the `{realm_name} OP` role to check in this realm.",
                 ephemeral=True,
             )
             return
 
-        existing = get_realm_checkin(realm_profile, interaction.guild_id)
+        existing = await run_db(get_realm_checkin, realm_profile, interaction.guild_id)
         if existing:
             await interaction.response.send_message(
                 f"✅ **{realm_name}** is already checked in for "
@@ -173,7 +184,8 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
             )
             return
 
-        record_realm_checkin(
+        await run_db(
+            record_realm_checkin,
             realm_profile,
             interaction.guild_id,
             interaction.user,
@@ -196,14 +208,17 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
         include_archived: bool = False,
     ):
         checkin_month = current_checkin_month()
-        checked_in, missing = get_checkin_status(
+        details = await run_db(
+            get_checkin_details,
             interaction.guild_id,
             include_archived=include_archived,
             checkin_month=checkin_month,
         )
-        query = RealmProfile.select().order_by(RealmProfile.realm_name)
-        if not include_archived:
-            query = query.where(RealmProfile.archived == False)
+        checked_in, missing = get_checkin_status(
+            interaction.guild_id,
+            checkin_month=checkin_month,
+            realm_profiles=[realm_profile for realm_profile, _ in details],
+        )
 
         embed = discord.Embed(
             title=f"Realm Check-In Summary — {display_checkin_month(checkin_month)}",
@@ -216,12 +231,7 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
         )
 
         detail_lines: list[str] = []
-        for realm_profile in query:
-            checkin = get_realm_checkin(
-                realm_profile,
-                interaction.guild_id,
-                checkin_month,
-            )
+        for realm_profile, checkin in details:
             checked = realm_profile_is_checked_in(realm_profile, checkin_month)
             status = "Checked in" if checked else "Missing"
             op_role = _format_op_role(realm_profile)
@@ -252,15 +262,7 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
     @has_admin_level(3)
     async def reset_checkins(self, interaction: discord.Interaction):
         checkin_month = current_checkin_month()
-        deleted = (
-            database.RealmCheckIn.delete()
-            .where(
-                (database.RealmCheckIn.guild_id == str(interaction.guild_id))
-                & (database.RealmCheckIn.checkin_month == checkin_month)
-            )
-            .execute()
-        )
-        RealmProfile.update(checkin=False, last_checkin_at=None).execute()
+        deleted = await run_db(reset_realm_checkins, interaction.guild_id, checkin_month)
         await interaction.response.send_message(
             f"✅ Reset {deleted} realm check-in record(s) for "
             f"{display_checkin_month(checkin_month)}.",
@@ -279,8 +281,9 @@ class RealmProfileCommands(app_commands.Group, name="realm-profile"):
             )
             return
 
-        bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(interaction.guild.id)
+        bot_data = await run_db(
+            database.BotData.get_or_none,
+            database.BotData.server_id == interaction.guild.id,
         )
         if not bot_data:
             await interaction.response.send_message(
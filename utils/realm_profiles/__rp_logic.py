@@ -3,11 +3,16 @@
 import os
 import io
 import datetime
+import functools
+import hashlib
+import types
 from io import BytesIO
 import discord
 from PIL import Image, ImageDraw, ImageFont
 from utils.database.__database import RealmProfile
+from utils.database.__async_db import run_db
 from utils.helpers.__logging_module import get_log
+from utils.realm_profiles.__rp_card import realm_card_renderer
 
 import requests
 
@@ -27,13 +32,49 @@ PANEL_MARGIN = 28
 PANEL_GAP = 18
 PANEL_PADDING = 18
 DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%B %d, %Y", "%b %d, %Y")
+CARD_BACKGROUND_PATH = "./data/images/realm_background4.png"
+CARD_FALLBACK_BANNER_PATH = "./data/images/realm_backround_banner.png"
+# Profile fields drawn on the card; a change to any of them changes the cache key.
+CARD_FIELDS = (
+    "realm_name",
+    "long_desc",
+    "short_desc",
+    "gamemode",
+    "pvp",
+    "percent_player_sleep",
+    "world_start_date",
+    "play_style",
+    "realm_addons",
+    "member_count",
+    "community_age",
+    "reset_schedule",
+    "admin_team",
+    "foreseeable_future",
+    "application_process",
+    "banner_url",
+    "logo_url",
+)
+
+
+def _realm_names() -> list[str]:
+    return [r.realm_name for r in RealmProfile.select(RealmProfile.realm_name)]
+
+
+def _set_realm_image(realm_name: str, field: str, path: str) -> bool:
+    """Point a realm's logo_url/banner_url at an uploaded file. False if no such realm."""
+    profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
+    if not profile:
+        return False
+    setattr(profile, field, path)
+    profile.save()
+    return True
 
 
 async def realm_name_autocomplete(interaction: discord.Interaction, current: str):
     """
     Return autocomplete choices for realm names based on current input.
     """
-    names = [r.realm_name for r in RealmProfile.select()]
+    names = await run_db(_realm_names)
     return [
         discord.app_commands.Choice(name=name, value=name)
         for name in names
@@ -92,6 +133,7 @@ def create_realm_channel_link_view(
     return view
 
 
+@functools.lru_cache(maxsize=64)
 def _load_realm_name_font(size: int):
     try:
         return ImageFont.truetype(FONT_PATH, size)
@@ -565,54 +607,97 @@ def _draw_realm_details(card: Image.Image, profile: RealmProfile) -> None:
     )
 
 
-async def generate_realm_profile_card(
-    interaction: discord.Interaction, realm_name: str
-):
+def _mtime_ns(path: str | None) -> int | None:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_card_source(realm_name: str) -> tuple[dict, str] | None:
     """
-    Builds and returns the realm profile card with banner/logo and overlaid text.
+    Snapshot the fields drawn on a realm's card and hash them, together with the
+    image mtimes and today's date (World Age), into the card's cache key.
+    Blocking; run via run_db.
     """
     profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
     if not profile:
-        return None, "Invalid realm name provided."
-
-    try:
-        background_path = "./data/images/realm_background4.png"
-        fallback_banner = "./data/images/realm_backround_banner.png"
-        fallback_logo = Image.new("RGBA", (200, 200), (255, 0, 0, 255))
-
-        original_base = Image.open(background_path).convert("RGBA")
-        layout_probe = Image.new("RGBA", original_base.size, (0, 0, 0, 0))
-        layout = _measure_realm_detail_layout(
-            ImageDraw.Draw(layout_probe), profile, original_base.width
-        )
-        extra_height = max(
-            PINK_SECTION_EXTRA_HEIGHT, int(layout["card_height"]) - original_base.height
-        )
-        base = _expand_pink_section(original_base, extra_height)
-        banner = (
-            Image.open(profile.banner_url).convert("RGBA")
-            if os.path.exists(profile.banner_url)
-            else Image.open(fallback_banner).convert("RGBA")
-        )
-        logo = (
-            Image.open(profile.logo_url).convert("RGBA").resize((200, 200))
-            if os.path.exists(profile.logo_url)
-            else fallback_logo
+        return None
+    fields = {name: getattr(profile, name, None) for name in CARD_FIELDS}
+    stamps = [
+        (path, _mtime_ns(path))
+        for path in (
+            CARD_BACKGROUND_PATH,
+            CARD_FALLBACK_BANNER_PATH,
+            fields["banner_url"],
+            fields["logo_url"],
         )
+    ]
+    source = repr((sorted(fields.items()), stamps, datetime.date.today()))
+    return fields, hashlib.sha256(source.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_card_background(mtime_ns: int | None) -> Image.Image:
+    # Keyed by mtime so a replaced background is picked up; callers never mutate it.
+    return Image.open(CARD_BACKGROUND_PATH).convert("RGBA")
+
+
+def render_realm_card(fields: dict) -> bytes:
+    """
+    Draw a realm profile card from a CARD_FIELDS snapshot and return it as PNG.
+    Runs in the card worker processes, so it takes plain values, not a model.
+    """
+    profile = types.SimpleNamespace(**fields)
+    banner_path = profile.banner_url if profile.banner_url and os.path.exists(profile.banner_url) else None
+    logo_path = profile.logo_url if profile.logo_url and os.path.exists(profile.logo_url) else None
+
+    original_base = _load_card_background(_mtime_ns(CARD_BACKGROUND_PATH))
+    layout_probe = Image.new("RGBA", original_base.size, (0, 0, 0, 0))
+    layout = _measure_realm_detail_layout(
+        ImageDraw.Draw(layout_probe), profile, original_base.width
+    )
+    extra_height = max(
+        PINK_SECTION_EXTRA_HEIGHT, int(layout["card_height"]) - original_base.height
+    )
+    base = _expand_pink_section(original_base, extra_height)
+    banner = Image.open(banner_path or CARD_FALLBACK_BANNER_PATH).convert("RGBA")
+    logo = (
+        Image.open(logo_path).convert("RGBA").resize((200, 200))
+        if logo_path
+        else Image.new("RGBA", (200, 200), (255, 0, 0, 255))
+    )
 
-        card = Image.new("RGBA", base.size, (0, 0, 0, 0))
-        card.paste(banner, (5, 5), banner)
-        card.paste(base, (0, 0), base)
-        card.paste(logo, (45, 194), logo)
-        _draw_realm_name(card, profile.realm_name)
-        _draw_realm_details(card, profile)
+    card = Image.new("RGBA", base.size, (0, 0, 0, 0))
+    card.paste(banner, (5, 5), banner)
+    card.paste(base, (0, 0), base)
+    card.paste(logo, (45, 194), logo)
+    _draw_realm_name(card, profile.realm_name)
+    _draw_realm_details(card, profile)
 
-        buffer = io.BytesIO()
-        card.save(buffer, format="PNG")
-        buffer.seek(0)
+    buffer = io.BytesIO()
+    card.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def generate_realm_profile_card(
+    interaction: discord.Interaction, realm_name: str
+):
+    """
+    Builds and returns the realm profile card with banner/logo and overlaid text.
+    Rendering runs in the card process pool; unchanged cards come from the cache.
+    """
+    try:
+        source = await run_db(_load_card_source, realm_name)
+        if source is None:
+            return None, "Invalid realm name provided."
+        fields, key = source
 
-        _log.info(f"Realm profile card generated for {realm_name}")
-        return buffer, None
+        png = await realm_card_renderer.get(realm_name, key, render_realm_card, fields)
+        _log.info(f"Realm profile card ready for {realm_name}")
+        return io.BytesIO(png), None
 
     except Exception as e:
         _log.error(f"Failed to generate card: {e}", exc_info=True)
@@ -635,10 +720,8 @@ async def update_realm_logo_attachment(
         path = f"./data/images/realms/logos/{realm_name}_logo.png"
         await attachment.save(path)
 
-        profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
-        if profile:
-            profile.logo_url = path
-            profile.save()
+        if await run_db(_set_realm_image, realm_name, "logo_url", path):
+            realm_card_renderer.invalidate(realm_name)
             await interaction.response.send_message(
                 "✅ Realm logo uploaded successfully.", ephemeral=True
             )
@@ -667,10 +750,8 @@ async def update_realm_banner_attachment(
         path = f"./data/images/realms/banners/{realm_name}_banner.png"
         await attachment.save(path)
 
-        profile = RealmProfile.get_or_none(RealmProfile.realm_name == realm_name)
-        if profile:
-            profile.banner_url = path
-            profile.save()
+        if await run_db(_set_realm_image, realm_name, "banner_url", path):
+            realm_card_renderer.invalidate(realm_name)
             await interaction.response.send_message(
                 "✅ Realm banner uploaded successfully.", ephemeral=True
             )
@@ -1,11 +1,14 @@
 import asyncio
-import datetime
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_logic import fetch_bot_data_for_server
+from utils.helpers.__fanout import SkipGuild, fan_out
 from utils.helpers.__logging_module import get_log
+from utils.helpers.__scheduler import scheduler
 from utils.realm_profiles.__rp_checkins import (
     MAX_REALMS_PER_CHECKIN_POST,
     build_monthly_checkin_embed,
@@ -19,41 +22,52 @@ from utils.realm_profiles.__rp_checkins import (
 
 _log = get_log(__name__)
 
+# Posting adds a reaction per realm, so a guild's check-in takes a while.
+CHECKIN_POST_TIMEOUT = 180
+
+
+def _load_bot_data(guild_ids: list[int]) -> dict[int, database.BotData]:
+    """BotData rows for every guild in one query."""
+    rows = database.BotData.select().where(database.BotData.server_id.in_(guild_ids))
+    return {int(row.server_id): row for row in rows}
+
 
 class RealmCheckInCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._message_locks: dict[int, asyncio.Lock] = {}
-        self.monthly_checkin_poster.start()
 
-    def cog_unload(self):
-        self.monthly_checkin_poster.cancel()
+    async def cog_load(self):
+        scheduler.add_job(
+            "realm-checkin",
+            self.monthly_checkin_poster,
+            cron="0 0 1 * *",  # 1st of the month, 00:00 UTC
+            grace=86400,
+            description="Post the monthly realm check-in",
+        )
+        scheduler.start(self.bot)
+
+    async def cog_unload(self):
+        scheduler.remove_job("realm-checkin")
 
-    @tasks.loop(hours=1)
     async def monthly_checkin_poster(self):
-        now = datetime.datetime.utcnow()
-        if now.day != 1:
-            return
+        bot_data_rows = await run_db(_load_bot_data, [guild.id for guild in self.bot.guilds])
 
-        for guild in self.bot.guilds:
-            bot_data = database.BotData.get_or_none(
-                database.BotData.server_id == str(guild.id)
-            )
+        async def post(guild: discord.Guild):
+            bot_data = bot_data_rows.get(guild.id)
             if not bot_data:
-                continue
-
-            try:
-                await post_monthly_checkin_message(guild, bot_data)
-            except (discord.Forbidden, discord.HTTPException, ValueError):
-                _log.warning(
-                    "Could not post monthly realm check-in for guild %s",
-                    guild.id,
-                    exc_info=True,
-                )
-
-    @monthly_checkin_poster.before_loop
-    async def before_monthly_checkin_poster(self):
-        await self.bot.wait_until_ready()
+                raise SkipGuild("no BotData")
+            if await post_monthly_checkin_message(guild, bot_data) is None:
+                raise SkipGuild("already posted this month or no check-in channel")
+
+        # Not retried: a half-finished post would be repeated in full.
+        await fan_out(
+            "Monthly realm check-in",
+            self.bot.guilds,
+            post,
+            timeout=CHECKIN_POST_TIMEOUT,
+            retries=0,
+        )
 
     async def _resolve_member(
         self,
@@ -102,12 +116,10 @@ class RealmCheckInCog(commands.Cog):
         if guild is None:
             return
 
-        bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(payload.guild_id)
-        )
+        bot_data = await fetch_bot_data_for_server(payload.guild_id)
         if (
             not bot_data
-            or str(payload.channel_id) != str(bot_data.monthly_checkin_channel)
+            or payload.channel_id != bot_data.channel_id("monthly_checkin_channel")
         ):
             return
 
@@ -125,7 +137,7 @@ class RealmCheckInCog(commands.Cog):
             if not self._is_monthly_checkin_message(message):
                 return
 
-            message_realms = self._get_message_realms(message)
+            message_realms = await run_db(self._get_message_realms, message)
             realm_profile = find_realm_by_emoji(payload.emoji, message_realms)
             if realm_profile is None:
                 return
@@ -138,7 +150,7 @@ class RealmCheckInCog(commands.Cog):
             if member is None:
                 return
 
-            if not user_can_checkin_realm(member, realm_profile):
+            if not await run_db(user_can_checkin_realm, member, realm_profile):
                 _log.info(
                     "Ignoring check-in reaction from %s for %s: missing realm OP access.",
                     member,
@@ -146,7 +158,8 @@ class RealmCheckInCog(commands.Cog):
                 )
                 return
 
-            record_realm_checkin(
+            await run_db(
+                record_realm_checkin,
                 realm_profile,
                 guild.id,
                 member,
@@ -6,11 +6,14 @@ import discord
 from discord.ui import View, Button, Modal, TextInput, UserSelect
 from utils.helpers.__logging_module import get_log
 from utils.database.__database import Administrators, RealmProfile
+from utils.database.__async_db import run_db
+from utils.realm_profiles.__rp_card import realm_card_renderer
 from utils.realm_profiles.__rp_logic import (
     create_realm_channel_link_view,
     generate_realm_profile_card,
     save_image_from_url,
     _parse_world_start_date,
+    _set_realm_image,
 )
 
 _log = get_log(__name__)
@@ -39,7 +42,7 @@ def _is_admin(user_id: int, required_level: int = 3) -> bool:
         Administrators.select()
         .where(
             (Administrators.TierLevel >= required_level)
-            & (Administrators.discordID == str(user_id))
+            & (Administrators.discordID == user_id)
         )
         .exists()
     )
@@ -157,7 +160,7 @@ async def _sync_realm_op_role_name(
 
     if str(getattr(profile, "op_role_id", "0") or "0") != str(role.id):
         profile.op_role_id = str(role.id)
-        profile.save()
+        await run_db(profile.save)
 
     return True
 
@@ -183,8 +186,8 @@ class RealmManagerPanel(View):
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         expected_role_name = f"{self.realm_name} OP"
 
-        if interaction.user.id != self.user.id or not _user_can_manage_realm(
-            interaction.user, self.realm_name
+        if interaction.user.id != self.user.id or not await run_db(
+            _user_can_manage_realm, interaction.user, self.realm_name
         ):
             await interaction.response.send_message(
                 f"🚫 You must have the `{expected_role_name}` role to manage this realm.",
@@ -216,7 +219,7 @@ class ViewProfileButton(Button):
                 await interaction.followup.send(error, ephemeral=True)
                 return
 
-            profile = _get_profile(self.view.realm_name)
+            profile = await run_db(_get_profile, self.view.realm_name)
             file = discord.File(image_bytes, filename="realm_card.png")
             await interaction.followup.send(
                 file=file,
@@ -259,7 +262,7 @@ class EditProfileSectionButton(Button):
         self.section = section
 
     async def callback(self, interaction: discord.Interaction):
-        profile = _get_profile(self.view.realm_name)
+        profile = await run_db(_get_profile, self.view.realm_name)
         if not profile:
             await interaction.response.send_message(
                 f"⚠️ Realm profile `{self.view.realm_name}` was not found.",
@@ -277,14 +280,14 @@ class EditRealmOwnerButton(Button):
         super().__init__(style=discord.ButtonStyle.danger, label=label)
 
     async def callback(self, interaction: discord.Interaction):
-        if not _is_admin(interaction.user.id):
+        if not await run_db(_is_admin, interaction.user.id):
             await interaction.response.send_message(
                 "🚫 Only admins can edit the stored realm owner.",
                 ephemeral=True,
             )
             return
 
-        profile = _get_profile(self.view.realm_name)
+        profile = await run_db(_get_profile, self.view.realm_name)
         if not profile:
             await interaction.response.send_message(
                 f"⚠️ Realm profile `{self.view.realm_name}` was not found.",
@@ -310,7 +313,9 @@ class RealmOwnerSelectView(View):
         self.add_item(RealmOwnerUserSelect())
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user.id or not _is_admin(interaction.user.id):
+        if interaction.user.id != self.user.id or not await run_db(
+            _is_admin, interaction.user.id
+        ):
             await interaction.response.send_message(
                 "🚫 Only the admin who opened this selector can use it.",
                 ephemeral=True,
@@ -328,7 +333,7 @@ class RealmOwnerUserSelect(UserSelect):
         )
 
     async def callback(self, interaction: discord.Interaction):
-        profile = _get_profile(self.view.realm_name)
+        profile = await run_db(_get_profile, self.view.realm_name)
         if not profile:
             await interaction.response.send_message(
                 f"⚠️ Realm profile `{self.view.realm_name}` was not found.",
@@ -340,7 +345,7 @@ class RealmOwnerUserSelect(UserSelect):
         owner_name = owner.name
         profile.discord_name = owner_name
         profile.discord_id = str(owner.id)
-        profile.save()
+        await run_db(profile.save)
 
         await interaction.response.send_message(
             f"✅ Realm owner for **{self.view.realm_name}** set to {owner.mention}.",
@@ -433,7 +438,7 @@ class RealmProfileEditModal(Modal):
             self.add_item(text_input)
 
     async def on_submit(self, interaction: discord.Interaction):
-        profile = _get_profile(self.realm_name)
+        profile = await run_db(_get_profile, self.realm_name)
         if not profile:
             await interaction.response.send_message(
                 f"⚠️ Realm profile `{self.realm_name}` was not found.",
@@ -468,7 +473,8 @@ class RealmProfileEditModal(Modal):
         old_realm_name = profile.realm_name
         for field_name, value in updates.items():
             setattr(profile, field_name, value)
-        profile.save()
+        await run_db(profile.save)
+        realm_card_renderer.invalidate(old_realm_name, profile.realm_name)
 
         channel_synced = False
         if "short_desc" in updates:
@@ -541,19 +547,15 @@ class UploadImageModal(Modal):
                 )
                 return
 
-            profile = RealmProfile.get_or_none(RealmProfile.realm_name == self.realm_name)
-            if not profile:
+            field = "logo_url" if self.image_type == "logo" else "banner_url"
+            if not await run_db(_set_realm_image, self.realm_name, field, save_path):
                 await interaction.followup.send(
                     f"⚠️ Realm profile `{self.realm_name}` was not found.",
                     ephemeral=True,
                 )
                 return
 
-            if self.image_type == "logo":
-                profile.logo_url = save_path
-            else:
-                profile.banner_url = save_path
-            profile.save()
+            realm_card_renderer.invalidate(self.realm_name)
 
             await interaction.followup.send(
                 f"✅ {self.image_type.capitalize()} image updated for **{self.realm_name}**.",
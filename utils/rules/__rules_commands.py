@@ -1,10 +1,21 @@
 import discord
 from discord import app_commands
-from utils.database import __database as database
+from utils.database.__async_db import run_db
 from utils.helpers.__checks import has_admin_level
 from utils.helpers.__logging_module import get_log
-
-from .__rules_logic import update_rule_embed
+from utils.admin.bot_management.__bm_cache import bot_data_cache
+
+from .__rules_logic import (
+    create_rule,
+    delete_rule,
+    fetch_rule,
+    fetch_rule_categories,
+    fetch_rule_numbers,
+    fetch_rules,
+    save_rule_channel,
+    update_rule_embed,
+    update_rule_text,
+)
 
 _log = get_log(__name__)
 
@@ -23,15 +34,7 @@ class RulesCommands(app_commands.Group):
         self, interaction: discord.Interaction, category: str, number: int
     ):
         try:
-            rule = (
-                database.Rule.select()
-                .where(
-                    (database.Rule.guild_id == str(interaction.guild_id))
-                    & (database.Rule.category == category)
-                    & (database.Rule.number == number)
-                )
-                .first()
-            )
+            rule = await run_db(fetch_rule, interaction.guild_id, category, number)
             if not rule:
                 await interaction.response.send_message(
                     "Rule not found.", ephemeral=True
@@ -56,15 +59,11 @@ class RulesCommands(app_commands.Group):
         self, interaction: discord.Interaction, current: str
     ):
         try:
-            query = (
-                database.Rule.select(database.Rule.category)
-                .where(database.Rule.guild_id == str(interaction.guild_id))
-                .distinct()
-            )
+            categories = await run_db(fetch_rule_categories, interaction.guild_id)
             choices = [
-                r.category
-                for r in query
-                if r.category.lower().startswith(current.lower())
+                category
+                for category in categories
+                if category.lower().startswith(current.lower())
             ]
             return [app_commands.Choice(name=cat, value=cat) for cat in choices[:25]]
 
@@ -78,18 +77,11 @@ class RulesCommands(app_commands.Group):
     ):
         try:
             category = interaction.namespace.category
-            query = (
-                database.Rule.select(database.Rule.number)
-                .where(
-                    (database.Rule.guild_id == str(interaction.guild_id))
-                    & (database.Rule.category == category)
-                )
-                .order_by(database.Rule.number)
-            )
+            numbers = await run_db(fetch_rule_numbers, interaction.guild_id, category)
             return [
-                app_commands.Choice(name=f"Rule #{r.number}", value=r.number)
-                for r in query
-                if str(r.number).startswith(str(current)) or current == 0
+                app_commands.Choice(name=f"Rule #{number}", value=number)
+                for number in numbers
+                if str(number).startswith(str(current)) or current == 0
             ][:25]
 
         except Exception as e:
@@ -98,13 +90,9 @@ class RulesCommands(app_commands.Group):
 
     @app_commands.command(name="list", description="List all server rules.")
     async def list_rules(self, interaction: discord.Interaction):
-        rules = (
-            database.Rule.select()
-            .where(database.Rule.guild_id == str(interaction.guild_id))
-            .order_by(database.Rule.category, database.Rule.number)
-        )
+        rules = await run_db(fetch_rules, interaction.guild_id)
 
-        if not rules.exists():
+        if not rules:
             await interaction.response.send_message(
                 "No rules configured yet.", ephemeral=True
             )
@@ -133,21 +121,7 @@ class RulesCommands(app_commands.Group):
     async def add_rule(
         self, interaction: discord.Interaction, category: str, text: str
     ):
-        guild_id = str(interaction.guild_id)
-        count = (
-            database.Rule.select()
-            .where(
-                (database.Rule.guild_id == guild_id)
-                & (database.Rule.category == category)
-            )
-            .count()
-        )
-        rule = database.Rule.create(
-            guild_id=guild_id,
-            category=category,
-            number=count + 1,
-            text=text,
-        )
+        rule = await run_db(create_rule, interaction.guild_id, category, text)
 
         await interaction.response.send_message(
             f"✅ Rule added in **{category}** as #{rule.number}.", ephemeral=True
@@ -164,36 +138,10 @@ class RulesCommands(app_commands.Group):
     async def remove_rule(
         self, interaction: discord.Interaction, category: str, number: int
     ):
-        guild_id = str(interaction.guild_id)
-        rule = (
-            database.Rule.select()
-            .where(
-                (database.Rule.guild_id == guild_id)
-                & (database.Rule.category == category)
-                & (database.Rule.number == number)
-            )
-            .first()
-        )
-
-        if not rule:
+        if not await run_db(delete_rule, interaction.guild_id, category, number):
             await interaction.response.send_message("Rule not found.", ephemeral=True)
             return
 
-        rule.delete_instance()
-
-        remaining_rules = (
-            database.Rule.select()
-            .where(
-                (database.Rule.guild_id == guild_id)
-                & (database.Rule.category == category)
-            )
-            .order_by(database.Rule.number)
-        )
-
-        for i, r in enumerate(remaining_rules, start=1):
-            r.number = i
-            r.save()
-
         await interaction.response.send_message(
             f"❌ Rule #{number} removed from **{category}**.", ephemeral=True
         )
@@ -213,22 +161,13 @@ class RulesCommands(app_commands.Group):
         number: int,
         new_text: str,
     ):
-        rule = (
-            database.Rule.select()
-            .where(
-                (database.Rule.guild_id == str(interaction.guild_id))
-                & (database.Rule.category == category)
-                & (database.Rule.number == number)
-            )
-            .first()
+        updated = await run_db(
+            update_rule_text, interaction.guild_id, category, number, new_text
         )
-
-        if not rule:
+        if not updated:
             await interaction.response.send_message("Rule not found.", ephemeral=True)
             return
 
-        rule.text = new_text
-        rule.save()
         await interaction.response.send_message(
             f"✏️ Rule #{number} in **{category}** updated.", ephemeral=True
         )
@@ -243,9 +182,7 @@ class RulesCommands(app_commands.Group):
     ):
         try:
             await interaction.response.defer(ephemeral=True)
-            bot_data = database.BotData.get_or_none(
-                database.BotData.server_id == str(interaction.guild_id)
-            )
+            bot_data = await run_db(save_rule_channel, interaction.guild_id, channel.id)
 
             if not bot_data:
                 await interaction.followup.send(
@@ -254,9 +191,7 @@ class RulesCommands(app_commands.Group):
                 return
 
             _log.info(f"Channel ID is {str(channel.id)}")
-
-            bot_data.rule_channel = str(channel.id)
-            bot_data.save()
+            bot_data_cache.update(bot_data)
 
             await update_rule_embed(interaction.guild)
             await interaction.followup.send(
@@ -1,14 +1,119 @@
 import discord
 from utils.database import __database as database
+from utils.database.__async_db import run_db
+from utils.admin.bot_management.__bm_cache import bot_data_cache
 from utils.helpers.__logging_module import get_log
 
 _log = get_log("rules_logic")
 
 
+# Blocking helpers; call them through run_db.
+
+
+def fetch_rules(guild_id: int) -> list[database.Rule]:
+    return list(
+        database.Rule.select()
+        .where(database.Rule.guild_id == str(guild_id))
+        .order_by(database.Rule.category, database.Rule.number)
+    )
+
+
+def fetch_rule(guild_id: int, category: str, number: int) -> database.Rule | None:
+    return (
+        database.Rule.select()
+        .where(
+            (database.Rule.guild_id == str(guild_id))
+            & (database.Rule.category == category)
+            & (database.Rule.number == number)
+        )
+        .first()
+    )
+
+
+def fetch_rule_categories(guild_id: int) -> list[str]:
+    query = (
+        database.Rule.select(database.Rule.category)
+        .where(database.Rule.guild_id == str(guild_id))
+        .distinct()
+    )
+    return [r.category for r in query]
+
+
+def fetch_rule_numbers(guild_id: int, category: str) -> list[int]:
+    query = (
+        database.Rule.select(database.Rule.number)
+        .where(
+            (database.Rule.guild_id == str(guild_id))
+            & (database.Rule.category == category)
+        )
+        .order_by(database.Rule.number)
+    )
+    return [r.number for r in query]
+
+
+def create_rule(guild_id: int, category: str, text: str) -> database.Rule:
+    with database.db.atomic():
+        count = (
+            database.Rule.select()
+            .where(
+                (database.Rule.guild_id == str(guild_id))
+                & (database.Rule.category == category)
+            )
+            .count()
+        )
+        return database.Rule.create(
+            guild_id=str(guild_id),
+            category=category,
+            number=count + 1,
+            text=text,
+        )
+
+
+def delete_rule(guild_id: int, category: str, number: int) -> bool:
+    """Remove a rule and renumber the rest of its category. False if not found."""
+    with database.db.atomic():
+        rule = fetch_rule(guild_id, category, number)
+        if not rule:
+            return False
+
+        rule.delete_instance()
+
+        remaining_rules = (
+            database.Rule.select()
+            .where(
+                (database.Rule.guild_id == str(guild_id))
+                & (database.Rule.category == category)
+            )
+            .order_by(database.Rule.number)
+        )
+        for i, r in enumerate(remaining_rules, start=1):
+            r.number = i
+            r.save()
+    return True
+
+
+def update_rule_text(guild_id: int, category: str, number: int, text: str) -> bool:
+    rule = fetch_rule(guild_id, category, number)
+    if not rule:
+        return False
+    rule.text = text
+    rule.save()
+    return True
+
+
+def save_rule_channel(guild_id: int, channel_id: int) -> database.BotData | None:
+    bot_data = database.BotData.get_or_none(database.BotData.server_id == guild_id)
+    if not bot_data:
+        return None
+    bot_data.rule_channel = str(channel_id)
+    bot_data.save()
+    return bot_data
+
+
 async def update_rule_embed(guild: discord.Guild):
     try:
-        bot_data = database.BotData.get_or_none(
-            database.BotData.server_id == str(guild.id)
+        bot_data = await run_db(
+            database.BotData.get_or_none, database.BotData.server_id == guild.id
         )
         if not bot_data or not bot_data.rule_channel:
             _log.warning(f"No rule channel configured for guild: {guild.name}")
@@ -21,13 +126,9 @@ async def update_rule_embed(guild: discord.Guild):
             )
             return
 
-        rules = (
-            database.Rule.select()
-            .where(database.Rule.guild_id == str(guild.id))
-            .order_by(database.Rule.category, database.Rule.number)
-        )
+        rules = await run_db(fetch_rules, guild.id)
 
-        if not rules.exists():
+        if not rules:
             _log.info(f"No rules found for guild: {guild.name}")
             return
 
@@ -124,7 +225,8 @@ async def update_rule_embed(guild: discord.Guild):
 
         new_msg = await channel.send(embed=embed)
         bot_data.rule_message_id = str(new_msg.id)
-        bot_data.save()
+        await run_db(bot_data.save)
+        bot_data_cache.update(bot_data)
         _log.info(f"Posted new rule embed and saved message ID for {guild.name}.")
 
     except Exception as e: